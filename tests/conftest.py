@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from tracr.core.config import Settings
+from tracr.runtime.job_manager import JobManager
+
+
+# Validated once per session; each test gets a cheap copy pointed at its tmp_path.
+_SETTINGS_TEMPLATE = Settings(_env_file=None)
+
+
+@pytest.fixture
+def build_settings(tmp_path: Path) -> Callable[[], Settings]:
+    def _factory() -> Settings:
+        settings = _SETTINGS_TEMPLATE.model_copy(
+            update={
+                "inputs_dir": str(tmp_path / "inputs"),
+                "outputs_dir": str(tmp_path / "outputs"),
+                "job_configs_dir": str(tmp_path / "job_configs"),
+                "state_dir": str(tmp_path / "state"),
+            }
+        )
+        settings.ensure_runtime_dirs()
+        return settings
+
+    return _factory
+
+
+@pytest.fixture
+def build_manager(build_settings: Callable[[], Settings]) -> Iterator[Callable[..., Any]]:
+    created: list[Any] = []
+
+    def _factory(cls: type = JobManager) -> Any:
+        instance = cls(build_settings())
+        created.append(instance)
+        return instance
+
+    yield _factory
+
+    for instance in created:
+        close = getattr(instance, "close", None)
+        if callable(close):
+            close()
@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+
+def write_json(path: Path, payload: dict) -> None:
+    # Shared seeding helper for metadata fixtures; stdlib json keeps test output stable.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload), encoding="utf-8")
@@ -1,3 +1,4 @@
+from tracr import cli
 from tracr.cli import _local_tui_base_url
 
 
@@ -7,3 +8,36 @@ def test_local_tui_base_url_maps_wildcard_host_to_loopback() -> None:
 
 def test_local_tui_base_url_keeps_specific_host() -> None:
     assert _local_tui_base_url("127.0.0.1", 9001) == "http://127.0.0.1:9001"
+
+
+def test_wait_for_api_ready_polls_tcp_before_http(monkeypatch) -> None:
+    connects: list[tuple[str, int]] = []
+    health_calls: list[str] = []
+
+    class _Conn:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *_args) -> None:
+            return None
+
+    def _fake_connect(address, timeout):  # noqa: ANN001
+        connects.append(address)
+        if len(connects) < 3:
+            raise ConnectionRefusedError
+        return _Conn()
+
+    class _Response(_Conn):
+        status = 200
+
+    def _fake_urlopen(url, timeout):  # noqa: ANN001
+        health_calls.append(url)
+        return _Response()
+
+    monkeypatch.setattr(cli.socket, "create_connection", _fake_connect)
+    monkeypatch.setattr(cli.urllib.request, "urlopen", _fake_urlopen)
+    monkeypatch.setattr(cli.time, "sleep", lambda _seconds: None)
+
+    cli._wait_for_api_ready("http://127.0.0.1:8787")
+    assert connects == [("127.0.0.1", 8787)] * 3
+    assert health_calls == ["http://127.0.0.1:8787/health"]
@@ -1,3 +1,5 @@
+from pathlib import Path
+
 from tracr.core.config import REPO_ROOT, Settings
 
 
@@ -14,3 +16,26 @@ def test_repo_root_and_default_inputs_path() -> None:
     assert settings.job_configs_path == REPO_ROOT / "job_configs"
     assert settings.vllm_data_parallel_size == 1
     assert settings.vllm_max_concurrent_requests == 8
+
+
+def test_resolved_outputs_path_is_cached_and_follows_copies(tmp_path: Path) -> None:
+    real = tmp_path / "real"
+    real.mkdir()
+    (tmp_path / "link").symlink_to(real)
+
+    settings = Settings(_env_file=None, OCR_OUTPUTS_DIR=str(tmp_path / "link"))
+    assert settings.resolved_outputs_path == real.resolve()
+    assert settings.resolved_outputs_path is settings.resolved_outputs_path
+
+    copied = settings.model_copy(update={"outputs_dir": str(tmp_path / "other")})
+    assert copied.resolved_outputs_path == (tmp_path / "other").resolve()
+
+
+def test_path_properties_are_reused_per_dir_value(tmp_path: Path) -> None:
+    settings = Settings(_env_file=None, OCR_INPUTS_DIR=str(tmp_path / "in"))
+    assert settings.inputs_path is settings.inputs_path
+    assert settings.inputs_path == tmp_path / "in"
+
+    copied = settings.model_copy(update={"inputs_dir": "elsewhere"})
+    assert copied.inputs_path == REPO_ROOT / "elsewhere"
+    assert settings.inputs_path == tmp_path / "in"
@@ -1,23 +1,11 @@
 from pathlib import Path
 
-from tracr.core.config import Settings
+from tracr.runtime import elo_manager
 from tracr.runtime.elo_manager import EloManager
 
 
-def _build_manager(tmp_path: Path) -> EloManager:
-    settings = Settings(
-        _env_file=None,
-        OCR_INPUTS_DIR=str(tmp_path / "inputs"),
-        OCR_OUTPUTS_DIR=str(tmp_path / "outputs"),
-        OCR_JOB_CONFIGS_DIR=str(tmp_path / "job_configs"),
-        OCR_STATE_DIR=str(tmp_path / "state"),
-    )
-    settings.ensure_runtime_dirs()
-    return EloManager(settings)
-
-
-def test_record_vote_updates_ratings_and_writes_files(tmp_path: Path) -> None:
-    manager = _build_manager(tmp_path)
+def test_record_vote_updates_ratings_and_writes_files(tmp_path: Path, build_manager) -> None:
+    manager = build_manager(EloManager)
 
     result = manager.record_vote(
         job_id="job-a",
@@ -46,8 +34,8 @@ def test_record_vote_updates_ratings_and_writes_files(tmp_path: Path) -> None:
     assert len(votes_path.read_text(encoding="utf-8").strip().splitlines()) == 1
 
 
-def test_skip_vote_keeps_ratings_unchanged(tmp_path: Path) -> None:
-    manager = _build_manager(tmp_path)
+def test_skip_vote_keeps_ratings_unchanged(tmp_path: Path, build_manager) -> None:
+    manager = build_manager(EloManager)
 
     manager.record_vote(
         job_id="job-b",
@@ -74,3 +62,114 @@ def test_skip_vote_keeps_ratings_unchanged(tmp_path: Path) -> None:
     assert baseline == after
     votes_lines = manager.votes_path("job-b").read_text(encoding="utf-8").strip().splitlines()
     assert len(votes_lines) == 2
+
+
+def test_ratings_table_reuses_parsed_file_until_it_changes(build_manager, monkeypatch) -> None:
+    manager = build_manager(EloManager)
+    labels = {"model-a": "Model A", "model-b": "Model B"}
+    manager.ratings_table("job-c", model_labels=labels)
+
+    loads_calls = 0
+    real_loads = elo_manager.orjson.loads
+
+    def _counting_loads(data):  # noqa: ANN001
+        nonlocal loads_calls
+        loads_calls += 1
+        return real_loads(data)
+
+    monkeypatch.setattr(elo_manager.orjson, "loads", _counting_loads)
+
+    manager.load_ratings("job-c")["models"]["model-a"]["rating"] = -1.0
+    rows = manager.ratings_table("job-c", model_labels=labels)
+    assert loads_calls == 0
+    assert {row["rating"] for row in rows} == {1000.0}
+
+    manager.record_vote(
+        job_id="job-c",
+        left_model_slug="model-a",
+        left_model_label="Model A",
+        right_model_slug="model-b",
+        right_model_label="Model B",
+        choice="left_better",
+        context={},
+    )
+    ratings = {row["model_slug"]: row["rating"] for row in manager.ratings_table("job-c")}
+    assert ratings["model-a"] > ratings["model-b"]
+
+
+def test_votes_log_reuses_handle_and_close_releases_it(build_manager) -> None:
+    manager = build_manager(EloManager)
+
+    for choice in ("left_better", "right_better"):
+        manager.record_vote(
+            job_id="job-c",
+            left_model_slug="model-left",
+            left_model_label="Model Left",
+            right_model_slug="model-right",
+            right_model_label="Model Right",
+            choice=choice,
+            context={},
+        )
+        assert manager.votes_path("job-c").read_text(encoding="utf-8").count("\n") >= 1
+
+    handle = manager._vote_handles["job-c"]
+    assert len(manager.votes_path("job-c").read_text(encoding="utf-8").strip().splitlines()) == 2
+
+    manager.close()
+    assert handle.closed
+    assert manager._vote_handles == {}
+
+
+def test_record_vote_writes_ratings_once(build_manager, monkeypatch) -> None:
+    manager = build_manager(EloManager)
+    writes: list[Path] = []
+    real_write = elo_manager.atomic_write_bytes
+
+    def _counting_write(path, data):  # noqa: ANN001
+        writes.append(path)
+        real_write(path, data)
+
+    monkeypatch.setattr(elo_manager, "atomic_write_bytes", _counting_write)
+
+    vote = {
+        "job_id": "job-e",
+        "left_model_slug": "model-a",
+        "left_model_label": "Model A",
+        "right_model_slug": "model-b",
+        "right_model_label": "Model B",
+        "context": {},
+    }
+    result = manager.record_vote(choice="right_better", **vote)
+    assert writes == [manager.ratings_path("job-e")]
+    assert result["ratings"] == manager.ratings_table("job-e")
+    assert result["ratings"][0]["model_slug"] == "model-b"
+
+    manager.record_vote(choice="skip", **vote)
+    assert len(writes) == 1
+
+
+def test_ratings_table_normalizes_partial_entries(build_manager) -> None:
+    manager = build_manager(EloManager)
+    ratings_path = manager.ratings_path("job-f")
+    ratings_path.parent.mkdir(parents=True)
+    ratings_path.write_text(
+        '{"job_id": "job-f", "models": {"model-a": {"rating": "1010.5", "wins": 2}, "broken": 3}}',
+        encoding="utf-8",
+    )
+
+    rows = manager.ratings_table("job-f", model_labels={"model-a": "Model A"})
+    assert rows == [
+        {
+            "model_slug": "model-a",
+            "model_label": "Model A",
+            "rating": 1010.5,
+            "wins": 2,
+            "losses": 0,
+            "ties": 0,
+            "comparisons": 0,
+        }
+    ]
+    stored = manager.load_ratings("job-f")
+    assert stored["k_factor"] == elo_manager.DEFAULT_K_FACTOR
+    assert stored["models"]["model-a"]["model_label"] == "Model A"
+    assert set(stored["models"]) == {"model-a"}
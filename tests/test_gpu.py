@@ -1,13 +1,183 @@
 from __future__ import annotations
 
+import queue
+import threading
+import time
 from types import SimpleNamespace
 
+import pytest
+
 from tracr.runtime import gpu
 
 
-def test_query_gpu_stats_parses_nvidia_smi(monkeypatch) -> None:
+@pytest.fixture(autouse=True)
+def _reset_nvml_state(monkeypatch) -> None:
+    monkeypatch.setattr(gpu, "_NVML_INITIALIZED", False)
+    monkeypatch.setattr(gpu, "_NVML_LIBRARY_MISSING", False)
+    monkeypatch.setattr(gpu, "_HANDLES", [])
+    monkeypatch.setattr(gpu, "_NAMES", [])
+    monkeypatch.setattr(gpu, "_LAST_SNAPSHOT", None)
+    monkeypatch.setattr(gpu, "_TTL_SECONDS", 0.0)
+    monkeypatch.setattr(gpu.atexit, "register", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(gpu, "_SMI_STREAM", None)
+    monkeypatch.setattr(gpu, "_SMI_STREAM_LATEST", None)
+    monkeypatch.setattr(gpu, "_SMI_STREAM_FAILED", False)
+
+    def _no_stream(*_args, **_kwargs):
+        raise FileNotFoundError("nvidia-smi")
+
+    monkeypatch.setattr(gpu.subprocess, "Popen", _no_stream)
+
+
+class _FakeMemInfo:
+    def __init__(self, total: int, used: int):
+        self.total = total
+        self.used = used
+
+
+class _FakeUtil:
+    def __init__(self, value: int):
+        self.gpu = value
+
+
+class _FakePynvml:
+    def __init__(self) -> None:
+        self.init_calls = 0
+        self.shutdown_calls = 0
+        self.handle_calls = 0
+        self.memory_calls = 0
+
+    def nvmlInit(self) -> None:
+        self.init_calls += 1
+
+    def nvmlShutdown(self) -> None:
+        self.shutdown_calls += 1
+
+    def nvmlDeviceGetCount(self) -> int:
+        return 1
+
+    def nvmlDeviceGetHandleByIndex(self, index: int) -> int:
+        self.handle_calls += 1
+        return index
+
+    def nvmlDeviceGetName(self, _handle: int) -> bytes:
+        return b"NVIDIA L4"
+
+    def nvmlDeviceGetMemoryInfo(self, _handle: int) -> _FakeMemInfo:
+        self.memory_calls += 1
+        gib = 1024 * 1024 * 1024
+        return _FakeMemInfo(total=24 * gib, used=3 * gib)
+
+    def nvmlDeviceGetUtilizationRates(self, _handle: int) -> _FakeUtil:
+        return _FakeUtil(47)
+
+
+def test_query_gpu_stats_prefers_nvml(monkeypatch) -> None:
+    monkeypatch.setattr(gpu.shutil, "which", lambda _: "/usr/bin/nvidia-smi")
+
+    def _fail_run(*_args, **_kwargs):
+        raise AssertionError("nvidia-smi should not run when NVML is available")
+
+    monkeypatch.setattr(gpu.subprocess, "run", _fail_run)
+    monkeypatch.setattr(gpu, "_pynvml", _FakePynvml())
+
+    stats = gpu.query_gpu_stats()
+    assert len(stats) == 1
+    assert stats[0].name == "NVIDIA L4"
+    assert stats[0].memory_total_mb == 24576
+    assert stats[0].memory_used_mb == 3072
+    assert stats[0].utilization_percent == 47
+
+
+def test_query_gpu_stats_initializes_nvml_once(monkeypatch) -> None:
+    monkeypatch.setattr(gpu.shutil, "which", lambda _: None)
+    fake = _FakePynvml()
+    monkeypatch.setattr(gpu, "_pynvml", fake)
+
+    assert len(gpu.query_gpu_stats()) == 1
+    assert len(gpu.query_gpu_stats()) == 1
+    assert fake.init_calls == 1
+    assert fake.shutdown_calls == 0
+
+
+def test_query_gpu_stats_caches_nvml_handles(monkeypatch) -> None:
+    monkeypatch.setattr(gpu.shutil, "which", lambda _: None)
+    fake = _FakePynvml()
+    monkeypatch.setattr(gpu, "_pynvml", fake)
+
+    gpu.query_gpu_stats()
+    gpu.query_gpu_stats()
+    assert fake.handle_calls == fake.nvmlDeviceGetCount()
+
+
+def test_query_gpu_stats_reuses_snapshot_within_ttl(monkeypatch) -> None:
+    monkeypatch.setattr(gpu.shutil, "which", lambda _: None)
+    monkeypatch.setattr(gpu, "_TTL_SECONDS", 2.0)
+    clock = iter([100.0, 101.0, 103.0, 103.0])
+    monkeypatch.setattr(gpu.time, "monotonic", lambda: next(clock))
+    fake = _FakePynvml()
+    monkeypatch.setattr(gpu, "_pynvml", fake)
+
+    first = gpu.query_gpu_stats()
+    second = gpu.query_gpu_stats()
+    assert fake.memory_calls == 1
+    assert [stat.name for stat in second] == [stat.name for stat in first]
+
+    gpu.query_gpu_stats()
+    assert fake.memory_calls == 2
+
+
+def test_missing_nvml_library_is_not_retried(monkeypatch) -> None:
+    class _LibraryNotFound(Exception):
+        pass
+
+    class _MissingLibraryPynvml(_FakePynvml):
+        NVMLError_LibraryNotFound = _LibraryNotFound
+
+        def nvmlInit(self) -> None:
+            self.init_calls += 1
+            raise _LibraryNotFound
+
+    monkeypatch.setattr(gpu.shutil, "which", lambda _: None)
+    fake = _MissingLibraryPynvml()
+    monkeypatch.setattr(gpu, "_pynvml", fake)
+
+    assert gpu.query_gpu_stats() == []
+    assert gpu.query_gpu_stats() == []
+    assert fake.init_calls == 1
+
+
+def test_concurrent_snapshot_misses_share_one_query(monkeypatch) -> None:
+    calls = 0
+    barrier = threading.Barrier(4)
+
+    def _slow_read() -> list[gpu.GPUStat]:
+        nonlocal calls
+        calls += 1
+        time.sleep(0.05)
+        return [gpu.GPUStat(0, "NVIDIA L4", 24576, 3072, 47)]
+
+    monkeypatch.setattr(gpu, "_read_gpu_stats", _slow_read)
+    results: list[list[gpu.GPUStat]] = []
+
+    def _worker() -> None:
+        barrier.wait()
+        results.append(gpu.query_gpu_stats())
+
+    threads = [threading.Thread(target=_worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == 1
+    assert [len(stats) for stats in results] == [1, 1, 1, 1]
+
+
+def test_query_gpu_stats_falls_back_to_nvidia_smi(monkeypatch) -> None:
     sample_output = "0, NVIDIA H100, 81559, 1024, 13\n1, NVIDIA H100, 81559, 2048, 21\n"
 
+    monkeypatch.setattr(gpu, "_pynvml", None)
     monkeypatch.setattr(gpu.shutil, "which", lambda _: "/usr/bin/nvidia-smi")
     monkeypatch.setattr(
         gpu.subprocess,
@@ -22,59 +192,83 @@ def test_query_gpu_stats_parses_nvidia_smi(monkeypatch) -> None:
     assert stats[1].memory_used_mb == 2048
 
 
-def test_query_gpu_stats_falls_back_to_nvml(monkeypatch) -> None:
-    monkeypatch.setattr(gpu.shutil, "which", lambda _: None)
-
-    class _FakeMemInfo:
-        def __init__(self, total: int, used: int):
-            self.total = total
-            self.used = used
+class _FakeSmiStream:
+    def __init__(self) -> None:
+        self.lines: queue.Queue[str | None] = queue.Queue()
+        self.stdout = iter(self.lines.get, None)
+        self.terminated = False
 
-    class _FakeUtil:
-        def __init__(self, value: int):
-            self.gpu = value
+    def poll(self) -> int | None:
+        return None
 
-    class _FakePynvml:
-        def nvmlInit(self) -> None:
-            return None
+    def terminate(self) -> None:
+        self.terminated = True
 
-        def nvmlShutdown(self) -> None:
-            return None
 
-        def nvmlDeviceGetCount(self) -> int:
-            return 1
+def test_nvidia_smi_fallback_streams_after_first_query(monkeypatch) -> None:
+    runs = 0
+    stream = _FakeSmiStream()
+    launched: list[list[str]] = []
 
-        def nvmlDeviceGetHandleByIndex(self, index: int) -> int:
-            return index
+    def _fake_run(*_args, **_kwargs):
+        nonlocal runs
+        runs += 1
+        return SimpleNamespace(stdout="0, NVIDIA H100, 81559, 1024, 13\n1, NVIDIA H100, 81559, 2048, 21\n")
 
-        def nvmlDeviceGetName(self, _handle: int) -> bytes:
-            return b"NVIDIA L4"
+    def _fake_popen(command, **_kwargs):  # noqa: ANN001
+        launched.append(list(command))
+        return stream
 
-        def nvmlDeviceGetMemoryInfo(self, _handle: int) -> _FakeMemInfo:
-            gib = 1024 * 1024 * 1024
-            return _FakeMemInfo(total=24 * gib, used=3 * gib)
-
-        def nvmlDeviceGetUtilizationRates(self, _handle: int) -> _FakeUtil:
-            return _FakeUtil(47)
+    monkeypatch.setattr(gpu, "_pynvml", None)
+    monkeypatch.setattr(gpu.shutil, "which", lambda _: "/usr/bin/nvidia-smi")
+    monkeypatch.setattr(gpu.subprocess, "run", _fake_run)
+    monkeypatch.setattr(gpu.subprocess, "Popen", _fake_popen)
 
-    import builtins
+    assert [stat.memory_used_mb for stat in gpu.query_gpu_stats()] == [1024, 2048]
+    assert launched and launched[0][-2] == "-l"
 
-    real_import = builtins.__import__
+    stream.lines.put("0, NVIDIA H100, 81559, 4096, 50\n")
+    stream.lines.put("1, NVIDIA H100, 81559, 8192, 60\n")
+    deadline = time.monotonic() + 2.0
+    while gpu._SMI_STREAM_LATEST is None and time.monotonic() < deadline:
+        time.sleep(0.01)
 
-    def _import(name, globals=None, locals=None, fromlist=(), level=0):  # noqa: ANN001, A002
-        if name == "pynvml":
-            return _FakePynvml()
-        return real_import(name, globals, locals, fromlist, level)
+    assert [stat.memory_used_mb for stat in gpu.query_gpu_stats()] == [4096, 8192]
+    assert runs == 1
 
-    monkeypatch.setattr(builtins, "__import__", _import)
-
-    stats = gpu.query_gpu_stats()
-    assert len(stats) == 1
-    assert stats[0].name == "NVIDIA L4"
-    assert stats[0].memory_total_mb == 24576
-    assert stats[0].utilization_percent == 47
+    stream.lines.put(None)
+    deadline = time.monotonic() + 2.0
+    while gpu._SMI_STREAM is not None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert gpu._SMI_STREAM_LATEST is None
+    assert gpu._SMI_STREAM_FAILED is False
 
 
 def test_detect_gpu_count_uses_override(monkeypatch) -> None:
     monkeypatch.setenv("OCR_GPU_COUNT", "7")
     assert gpu.detect_gpu_count() == 7
+
+
+def test_nvidia_smi_fallback_requests_bare_csv(monkeypatch) -> None:
+    captured: list[list[str]] = []
+
+    def _fake_run(command, *args, **kwargs):  # noqa: ANN001
+        captured.append(list(command))
+        return SimpleNamespace(stdout="0, NVIDIA H100, 81559, 1024, 13\n")
+
+    monkeypatch.setattr(gpu, "_pynvml", None)
+    monkeypatch.setattr(gpu.shutil, "which", lambda _: "/usr/bin/nvidia-smi")
+    monkeypatch.setattr(gpu.subprocess, "run", _fake_run)
+
+    assert len(gpu.query_gpu_stats()) == 1
+    assert captured
+    assert "--format=csv,noheader,nounits" in captured[0]
+    assert "--query-gpu=index,name,memory.total,memory.used,utilization.gpu" in captured[0]
+
+
+def test_parse_smi_csv_skips_malformed_rows() -> None:
+    stats = gpu._parse_smi_csv("0, NVIDIA H100, 81559, 1024, [N/A]\n\ngarbage\n1, NVIDIA H100, 81559, 2048, 21\n")
+    assert [stat.index for stat in stats] == [0, 1]
+    assert stats[0].utilization_percent == 0
+    assert stats[1].name == "NVIDIA H100"
+    assert stats[1].utilization_percent == 21
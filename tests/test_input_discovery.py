@@ -23,6 +23,19 @@ def test_expand_pdf_inputs_directory(tmp_path: Path) -> None:
     assert names == ["a.pdf", "b.pdf"]
 
 
+def test_expand_pdf_inputs_walks_deep_trees_case_insensitively(tmp_path: Path) -> None:
+    root = tmp_path / "inputs"
+    deep = root / "x" / "y" / "z"
+    deep.mkdir(parents=True)
+    (root / "x" / "SCAN.PDF").write_bytes(b"pdf")
+    (deep / "c.pdf").write_bytes(b"pdf")
+    (root / "x" / "y" / "notes.md").write_text("x", encoding="utf-8")
+
+    paths = expand_pdf_inputs(root)
+
+    assert [path.relative_to(root).as_posix() for path in paths] == ["x/SCAN.PDF", "x/y/z/c.pdf"]
+
+
 def test_discover_inputs_returns_pdf_and_folder_candidates(tmp_path: Path) -> None:
     inputs = tmp_path / "inputs"
     (inputs / "docs").mkdir(parents=True)
@@ -50,3 +63,19 @@ def test_resolve_input_path_prefers_inputs_folder(tmp_path: Path, monkeypatch) -
 
     resolved = resolve_input_path(settings, "report.pdf")
     assert resolved == (inputs / "report.pdf")
+
+
+def test_discover_inputs_matches_global_sort_and_stops_at_limit(tmp_path: Path) -> None:
+    inputs = tmp_path / "inputs"
+    for relative in ("a.pdf", "a/z.pdf", "a-b/c.pdf", "B.pdf", "a/b/d.PDF", "notes.txt"):
+        target = inputs / relative
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(b"pdf")
+
+    settings = DummySettings(inputs)
+    pdfs = [item.relative_to_inputs for item in discover_inputs(settings) if item.kind == "pdf"]
+    expected = sorted(path for path in inputs.rglob("*") if path.suffix.lower() == ".pdf")
+    assert pdfs == [str(path.relative_to(inputs)) for path in expected]
+
+    limited = discover_inputs(settings, max_items=2)
+    assert [(item.kind, item.relative_to_inputs) for item in limited] == [("pdf", "B.pdf"), ("pdf", "a/b/d.PDF"), ("folder", "a/b")]
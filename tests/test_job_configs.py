@@ -2,25 +2,12 @@ from pathlib import Path
 
 import pytest
 
-from tracr.core.config import Settings
 from tracr.core.job_configs import discover_job_configs, load_job_config
 from tracr.core.models import ModelMode
 
 
-def _build_settings(tmp_path: Path) -> Settings:
-    settings = Settings(
-        _env_file=None,
-        OCR_INPUTS_DIR=str(tmp_path / "inputs"),
-        OCR_OUTPUTS_DIR=str(tmp_path / "outputs"),
-        OCR_JOB_CONFIGS_DIR=str(tmp_path / "job_configs"),
-        OCR_STATE_DIR=str(tmp_path / "state"),
-    )
-    settings.ensure_runtime_dirs()
-    return settings
-
-
-def test_discover_job_configs_lists_yaml_files(tmp_path: Path) -> None:
-    settings = _build_settings(tmp_path)
+def test_discover_job_configs_lists_yaml_files(tmp_path: Path, build_settings) -> None:
+    settings = build_settings()
     (settings.job_configs_path / "a.yaml").write_text("input_path: inputs/a.pdf\nmodels: []\n", encoding="utf-8")
     nested = settings.job_configs_path / "nested"
     nested.mkdir(parents=True, exist_ok=True)
@@ -35,8 +22,20 @@ def test_discover_job_configs_lists_yaml_files(tmp_path: Path) -> None:
     assert all(not item.endswith(".txt") for item in relatives)
 
 
-def test_load_job_config_validates_with_launch_request(tmp_path: Path) -> None:
-    settings = _build_settings(tmp_path)
+def test_discover_job_configs_sorted_and_capped(tmp_path: Path, build_settings) -> None:
+    settings = build_settings()
+    for relative in ("b.yaml", "a/c.YML", "a.yml", "a/notes.txt"):
+        target = settings.job_configs_path / relative
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text("models: []\n", encoding="utf-8")
+
+    relatives = [item["relative_to_configs"] for item in discover_job_configs(settings)]
+    assert relatives == ["a/c.YML", "a.yml", "b.yaml"]
+    assert [item["relative_to_configs"] for item in discover_job_configs(settings, max_items=1)] == ["a/c.YML"]
+
+
+def test_load_job_config_validates_with_launch_request(tmp_path: Path, build_settings) -> None:
+    settings = build_settings()
     payload_path = settings.job_configs_path / "batch.yaml"
     payload_path.write_text(
         "\n".join(
@@ -78,8 +77,8 @@ def test_load_job_config_validates_with_launch_request(tmp_path: Path) -> None:
     assert request.models[1].extra_vllm_args == ["--enforce-eager"]
 
 
-def test_load_job_config_rejects_non_yaml_extension(tmp_path: Path) -> None:
-    settings = _build_settings(tmp_path)
+def test_load_job_config_rejects_non_yaml_extension(tmp_path: Path, build_settings) -> None:
+    settings = build_settings()
     payload_path = settings.job_configs_path / "bad.txt"
     payload_path.write_text("input_path: inputs/main.pdf\n", encoding="utf-8")
 
@@ -1,21 +1,9 @@
 from pathlib import Path
 
-from tracr.core.config import Settings
 from tracr.core.models import JobProgress, ModelMode, ModelRunProgress, RunStatus
 from tracr.runtime.job_manager import JobManager
 
 
-def _build_manager(tmp_path: Path) -> JobManager:
-    settings = Settings(
-        _env_file=None,
-        OCR_INPUTS_DIR=str(tmp_path / "inputs"),
-        OCR_OUTPUTS_DIR=str(tmp_path / "outputs"),
-        OCR_STATE_DIR=str(tmp_path / "state"),
-    )
-    settings.ensure_runtime_dirs()
-    return JobManager(settings)
-
-
 def _make_job(job_id: str, status: RunStatus, tmp_path: Path) -> JobProgress:
     run = ModelRunProgress(
         run_id=f"{job_id}:run-1",
@@ -38,8 +26,8 @@ def _make_job(job_id: str, status: RunStatus, tmp_path: Path) -> JobProgress:
     )
 
 
-def test_dismiss_completed_job_removes_it(tmp_path: Path) -> None:
-    manager = _build_manager(tmp_path)
+def test_dismiss_completed_job_removes_it(tmp_path: Path, build_manager) -> None:
+    manager = build_manager(JobManager)
     job = _make_job("job-complete", RunStatus.COMPLETED, tmp_path)
     manager._jobs[job.job_id] = job
 
@@ -50,8 +38,8 @@ def test_dismiss_completed_job_removes_it(tmp_path: Path) -> None:
     assert manager.get_job(job.job_id) is None
 
 
-def test_dismiss_canceled_job_removes_it(tmp_path: Path) -> None:
-    manager = _build_manager(tmp_path)
+def test_dismiss_canceled_job_removes_it(tmp_path: Path, build_manager) -> None:
+    manager = build_manager(JobManager)
     job = _make_job("job-canceled", RunStatus.CANCELED, tmp_path)
     manager._jobs[job.job_id] = job
 
@@ -62,8 +50,8 @@ def test_dismiss_canceled_job_removes_it(tmp_path: Path) -> None:
     assert manager.get_job(job.job_id) is None
 
 
-def test_dismiss_non_completed_job_is_rejected(tmp_path: Path) -> None:
-    manager = _build_manager(tmp_path)
+def test_dismiss_non_completed_job_is_rejected(tmp_path: Path, build_manager) -> None:
+    manager = build_manager(JobManager)
     job = _make_job("job-running", RunStatus.RUNNING, tmp_path)
     manager._jobs[job.job_id] = job
 
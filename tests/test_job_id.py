@@ -2,26 +2,14 @@ from pathlib import Path
 
 import pytest
 
-from tracr.core.config import Settings
 from tracr.core.models import LaunchJobRequest, ModelMode, OCRModelSpec
 from tracr.core.pdf_tools import PDFDescriptor
 from tracr.runtime.job_manager import JobManager
 
 
-def _build_manager(tmp_path: Path) -> JobManager:
-    settings = Settings(
-        _env_file=None,
-        OCR_INPUTS_DIR=str(tmp_path / "inputs"),
-        OCR_OUTPUTS_DIR=str(tmp_path / "outputs"),
-        OCR_STATE_DIR=str(tmp_path / "state"),
-    )
-    settings.ensure_runtime_dirs()
-    return JobManager(settings)
-
-
 @pytest.mark.asyncio
-async def test_launch_job_uses_explicit_job_id_without_timestamp(monkeypatch, tmp_path: Path) -> None:
-    manager = _build_manager(tmp_path)
+async def test_launch_job_uses_explicit_job_id_without_timestamp(monkeypatch, tmp_path: Path, build_manager) -> None:
+    manager = build_manager(JobManager)
 
     pdf_path = tmp_path / "inputs" / "doc.pdf"
     pdf_path.parent.mkdir(parents=True, exist_ok=True)
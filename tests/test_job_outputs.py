@@ -1,33 +1,17 @@
-import json
 from pathlib import Path
 
-from tracr.core.config import Settings
+from helpers import write_json
+from tracr.runtime import job_manager as job_manager_module
 from tracr.runtime.job_manager import JobManager
 
 
-def _build_manager(tmp_path: Path) -> JobManager:
-    settings = Settings(
-        _env_file=None,
-        OCR_INPUTS_DIR=str(tmp_path / "inputs"),
-        OCR_OUTPUTS_DIR=str(tmp_path / "outputs"),
-        OCR_STATE_DIR=str(tmp_path / "state"),
-    )
-    settings.ensure_runtime_dirs()
-    return JobManager(settings)
-
-
-def _write_json(path: Path, payload: dict) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload), encoding="utf-8")
-
-
-def test_list_output_pages_sorted_and_indexed(tmp_path: Path) -> None:
-    manager = _build_manager(tmp_path)
+def test_list_output_pages_sorted_and_indexed(tmp_path: Path, build_manager) -> None:
+    manager = build_manager(JobManager)
     job_dir = manager.layout.job_dir("job-1")
 
     run_dir = job_dir / "model-b" / "run-2"
-    _write_json(run_dir / "run_metadata.json", {"model": "org/model-b", "mode": "api"})
-    _write_json(
+    write_json(run_dir / "run_metadata.json", {"model": "org/model-b", "mode": "api"})
+    write_json(
         run_dir / "scan" / "pdf_metadata.json",
         {
             "source_pdf": "/tmp/scan.pdf",
@@ -41,8 +25,8 @@ def test_list_output_pages_sorted_and_indexed(tmp_path: Path) -> None:
     (run_dir / "scan" / "2.md").write_text("two", encoding="utf-8")
 
     run_dir = job_dir / "model-a" / "run-1"
-    _write_json(run_dir / "run_metadata.json", {"model": "org/model-a", "mode": "local"})
-    _write_json(
+    write_json(run_dir / "run_metadata.json", {"model": "org/model-a", "mode": "local"})
+    write_json(
         run_dir / "doc" / "pdf_metadata.json",
         {"source_pdf": "/tmp/doc.pdf", "pages": [{"page_number": 1, "token_usage": {"output_tokens": 3}}]},
     )
@@ -59,12 +43,12 @@ def test_list_output_pages_sorted_and_indexed(tmp_path: Path) -> None:
     assert [page["output_tokens"] for page in pages] == [3, 5, 11]
 
 
-def test_get_output_page_reads_markdown(tmp_path: Path) -> None:
-    manager = _build_manager(tmp_path)
+def test_get_output_page_reads_markdown(tmp_path: Path, build_manager) -> None:
+    manager = build_manager(JobManager)
     run_dir = manager.layout.job_dir("job-2") / "model-x" / "run-1"
 
-    _write_json(run_dir / "run_metadata.json", {"model": "org/model-x", "mode": "api"})
-    _write_json(
+    write_json(run_dir / "run_metadata.json", {"model": "org/model-x", "mode": "api"})
+    write_json(
         run_dir / "paper" / "pdf_metadata.json",
         {"source_pdf": "/tmp/paper.pdf", "pages": [{"page_number": 1, "token_usage": {"output_tokens": 17}}]},
     )
@@ -77,3 +61,55 @@ def test_get_output_page_reads_markdown(tmp_path: Path) -> None:
     assert payload["page"]["output_tokens"] == 17
     assert payload["page"]["output_characters"] == len("# page one")
     assert payload["markdown"] == "# page one"
+
+
+def test_pdf_pages_by_number_skips_malformed_entries_and_keeps_first() -> None:
+    pdf_metadata = {
+        "pages": [
+            "garbage",
+            {"page_number": "x"},
+            {"page_number": 2, "token_usage": {"output_tokens": 5}},
+            {"page_number": "2", "token_usage": {"output_tokens": 99}},
+            {"page_number": 3, "token_usage": None},
+        ]
+    }
+
+    index = JobManager._pdf_pages_by_number(pdf_metadata)
+    assert sorted(index) == [2, 3]
+    assert JobManager._page_output_tokens(index.get(2)) == 5
+    assert JobManager._page_output_tokens(index.get(3)) is None
+    assert JobManager._output_tokens_from_pdf_metadata(pdf_metadata, 4) is None
+
+
+def test_output_tokens_for_page_reads_pdf_metadata(tmp_path: Path) -> None:
+    pdf_dir = tmp_path / "run-1" / "doc"
+    write_json(
+        pdf_dir / "pdf_metadata.json",
+        {"pages": [{"page_number": 1, "token_usage": {"output_tokens": 8}}, {"page_number": 2}]},
+    )
+
+    assert JobManager.output_tokens_for_page(pdf_dir, 1) == 8
+    assert JobManager.output_tokens_for_page(pdf_dir, 2) is None
+    assert JobManager.output_tokens_for_page(tmp_path / "missing", 1) is None
+
+
+def test_output_tokens_for_page_parses_metadata_once_until_rewritten(tmp_path: Path, monkeypatch) -> None:
+    pdf_dir = tmp_path / "run-1" / "doc"
+    metadata_path = pdf_dir / "pdf_metadata.json"
+    write_json(metadata_path, {"pages": [{"page_number": 1, "token_usage": {"output_tokens": 8}}]})
+
+    parses: list[bytes] = []
+    real_loads = job_manager_module.loads
+
+    def _counting_loads(data):  # noqa: ANN001
+        parses.append(data)
+        return real_loads(data)
+
+    monkeypatch.setattr(job_manager_module, "loads", _counting_loads)
+
+    assert [JobManager.output_tokens_for_page(pdf_dir, page) for page in (1, 1, 2)] == [8, 8, None]
+    assert len(parses) == 1
+
+    write_json(metadata_path, {"pages": [{"page_number": 1, "token_usage": {"output_tokens": 123}}]})
+    assert JobManager.output_tokens_for_page(pdf_dir, 1) == 123
+    assert len(parses) == 2
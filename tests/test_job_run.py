@@ -0,0 +1,316 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pypdfium2 as pdfium
+import pytest
+
+from tracr.core import pdf_tools
+from tracr.core.models import LaunchJobRequest, ModelMode, OCRModelSpec, RunStatus
+from tracr.runtime import job_manager
+from tracr.runtime.job_manager import JobManager
+from tracr.runtime.openai_client import OCRPageResult, OpenAICompatibleOCRClient
+
+
+class _FakeOCRClient(OpenAICompatibleOCRClient):
+    calls: list[tuple[str, int]] = []
+    lock = threading.Lock()
+    # When set, the first page blocks until a second page request arrives.
+    overlap: threading.Event | None = None
+    # Called with the number of pages requested so far, including this one.
+    on_call: Callable[[int], None] | None = None
+
+    def __init__(self, auth, timeout_seconds: float = 300.0):  # noqa: ANN001
+        self.auth = auth
+
+    def ocr_page(self, *, model: str, image_png: bytes, **_kwargs: Any) -> OCRPageResult:
+        with self.lock:
+            self.calls.append((model, len(image_png)))
+            call_count = len(self.calls)
+            first_call = call_count == 1
+        if self.on_call is not None:
+            self.on_call(call_count)
+        if self.overlap is not None:
+            if first_call:
+                assert self.overlap.wait(timeout=5.0), "second page was not dispatched while the first was in flight"
+            else:
+                self.overlap.set()
+        return OCRPageResult(
+            markdown=f"# {model}",
+            request_duration_seconds=0.01,
+            usage={"prompt_tokens": 10, "completion_tokens": 3, "total_tokens": 13},
+            finish_reason="stop",
+            provider_model=model,
+            attempts=1,
+        )
+
+    def close(self) -> None:
+        return None
+
+
+def _write_pdf(path: Path, page_count: int) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    document = pdfium.PdfDocument.new()
+    for _ in range(page_count):
+        document.new_page(72, 72)
+    document.save(str(path))
+    document.close()
+    return path
+
+
+def _api_spec(model: str) -> OCRModelSpec:
+    return OCRModelSpec(
+        model=model,
+        mode=ModelMode.API,
+        provider="openai",
+        base_url="https://api.openai.com/v1",
+        api_key="test-key",
+        max_concurrent_requests=2,
+    )
+
+
+@pytest.fixture
+def fake_ocr(monkeypatch) -> list[tuple[str, int]]:
+    calls: list[tuple[str, int]] = []
+    monkeypatch.setattr(_FakeOCRClient, "calls", calls)
+    monkeypatch.setattr(_FakeOCRClient, "overlap", None)
+    monkeypatch.setattr(_FakeOCRClient, "on_call", None)
+    monkeypatch.setattr("tracr.runtime.job_manager.OpenAICompatibleOCRClient", _FakeOCRClient)
+    monkeypatch.setattr(pdf_tools, "PDF_RENDER_WORKERS", 1)
+    return calls
+
+
+async def _run_job(manager: JobManager, inputs_dir: Path, models: list[str]) -> str:
+    job = await manager.launch_job(
+        LaunchJobRequest(
+            job_id="batch",
+            input_path=str(inputs_dir),
+            models=[_api_spec(model) for model in models],
+        )
+    )
+    await manager._tasks[job.job_id]
+    return job.job_id
+
+
+@pytest.mark.asyncio
+async def test_run_processes_every_page_of_every_pdf(build_manager, fake_ocr) -> None:
+    manager = build_manager(JobManager)
+    inputs_dir = manager.settings.inputs_path / "batch"
+    _write_pdf(inputs_dir / "a.pdf", 3)
+    _write_pdf(inputs_dir / "b.pdf", 2)
+
+    job_id = await _run_job(manager, inputs_dir, ["model-x"])
+
+    job = manager.get_job(job_id)
+    assert job is not None
+    assert job.status == RunStatus.COMPLETED
+    assert job.models[0].completed_pages == 5
+    assert len(fake_ocr) == 5
+    assert manager.layout._run_dir_names == {}
+
+    run_dir = Path(job.models[0].output_dir)
+    for slug, page_count in (("a", 3), ("b", 2)):
+        pdf_dir = run_dir / slug
+        metadata = manager.load_pdf_metadata(pdf_dir)
+        assert [page["page_number"] for page in metadata["pages"]] == list(range(1, page_count + 1))
+        assert metadata["ended_at"] is not None
+        assert sorted(path.name for path in pdf_dir.glob("*.md")) == [f"{n}.md" for n in range(1, page_count + 1)]
+
+    await manager.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_run_dispatches_next_pdf_while_previous_pdf_is_in_flight(build_manager, fake_ocr, monkeypatch) -> None:
+    monkeypatch.setattr(_FakeOCRClient, "overlap", threading.Event())
+    manager = build_manager(JobManager)
+    inputs_dir = manager.settings.inputs_path / "batch"
+    _write_pdf(inputs_dir / "a.pdf", 1)
+    _write_pdf(inputs_dir / "b.pdf", 1)
+
+    job_id = await _run_job(manager, inputs_dir, ["model-x"])
+
+    job = manager.get_job(job_id)
+    assert job is not None
+    run_dir = Path(job.models[0].output_dir)
+    for slug in ("a", "b"):
+        metadata = manager.load_pdf_metadata(run_dir / slug)
+        assert [page["status"] for page in metadata["pages"]] == ["completed"]
+        assert metadata["ended_at"] is not None
+
+    await manager.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_models_in_one_job_share_a_single_render_pass(build_manager, fake_ocr, monkeypatch) -> None:
+    rendered: list[str] = []
+    real_iter = job_manager.iter_rendered_pages
+
+    def _counting_iter(pdf_path, *args, **kwargs):  # noqa: ANN001
+        rendered.append(Path(pdf_path).name)
+        return real_iter(pdf_path, *args, **kwargs)
+
+    monkeypatch.setattr(job_manager, "iter_rendered_pages", _counting_iter)
+    manager = build_manager(JobManager)
+    inputs_dir = manager.settings.inputs_path / "batch"
+    _write_pdf(inputs_dir / "a.pdf", 3)
+    _write_pdf(inputs_dir / "b.pdf", 2)
+
+    job_id = await _run_job(manager, inputs_dir, ["model-x", "model-y", "model-z"])
+
+    job = manager.get_job(job_id)
+    assert job is not None
+    assert job.status == RunStatus.COMPLETED
+    assert [run.completed_pages for run in job.models] == [5, 5, 5]
+    assert sorted(rendered) == ["a.pdf", "b.pdf"]
+    assert sorted(model for model, _ in fake_ocr) == ["model-x"] * 5 + ["model-y"] * 5 + ["model-z"] * 5
+    assert not (manager._page_renders_root / job_id).exists()
+
+    await manager.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_shared_render_failure_fails_every_model_run(build_manager, fake_ocr, monkeypatch) -> None:
+    def _broken_iter(*_args, **_kwargs):  # noqa: ANN001
+        raise ValueError("corrupt pdf")
+        yield  # pragma: no cover
+
+    monkeypatch.setattr(job_manager, "iter_rendered_pages", _broken_iter)
+    manager = build_manager(JobManager)
+    inputs_dir = manager.settings.inputs_path / "batch"
+    _write_pdf(inputs_dir / "a.pdf", 1)
+
+    job_id = await _run_job(manager, inputs_dir, ["model-x", "model-y"])
+
+    job = manager.get_job(job_id)
+    assert job is not None
+    assert [run.status for run in job.models] == [RunStatus.FAILED, RunStatus.FAILED]
+    assert [run.error for run in job.models] == ["corrupt pdf", "corrupt pdf"]
+    assert fake_ocr == []
+
+    await manager.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_shared_renders_are_dropped_when_a_run_fails_before_reading(build_manager, fake_ocr, monkeypatch) -> None:
+    manager = build_manager(JobManager)
+    inputs_dir = manager.settings.inputs_path / "batch"
+    _write_pdf(inputs_dir / "a.pdf", 3)
+    _write_pdf(inputs_dir / "b.pdf", 2)
+    spill_dir = manager._page_renders_root / "batch"
+    real_resolve = manager._resolve_api_auth
+
+    def _resolve_api_auth(spec):  # noqa: ANN001
+        if spec.model == "model-y":
+            raise RuntimeError("missing api key")
+        return real_resolve(spec)
+
+    released = threading.Event()
+    real_release = job_manager._SharedPageRenders.release
+
+    def _release(self, consumer: str) -> None:  # noqa: ANN001
+        real_release(self, consumer)
+        if consumer.startswith("model-y"):
+            released.set()
+
+    spilled: list[tuple[int, int]] = []
+
+    def _on_call(call_count: int) -> None:
+        assert released.wait(timeout=5.0)
+        spilled.append((call_count, len(list(spill_dir.rglob("*.img")))))
+
+    monkeypatch.setattr(manager, "_resolve_api_auth", _resolve_api_auth)
+    monkeypatch.setattr(job_manager._SharedPageRenders, "release", _release)
+    monkeypatch.setattr(_FakeOCRClient, "on_call", staticmethod(_on_call))
+
+    job_id = await _run_job(manager, inputs_dir, ["model-x", "model-y"])
+
+    job = manager.get_job(job_id)
+    assert job is not None
+    assert [run.status for run in job.models] == [RunStatus.COMPLETED, RunStatus.FAILED]
+    assert len(spilled) == 5
+    # Each page model-x has read is gone, so only pages it hasn't reached stay on disk.
+    assert all(files <= 5 - call_count for call_count, files in spilled)
+    assert not spill_dir.exists()
+
+    await manager.shutdown()
+
+
+def test_manager_startup_clears_page_renders_of_dead_processes(build_settings, build_manager) -> None:
+    renders_root = build_settings().state_path / job_manager.PAGE_RENDERS_DIRNAME
+    dead_pid = subprocess.Popen([sys.executable, "-c", "pass"])
+    dead_pid.wait()
+    stale = [
+        renders_root / str(dead_pid.pid) / "batch" / "0" / "1.img",
+        renders_root / str(os.getpid()) / "batch" / "0" / "1.img",
+        renders_root / "legacy-job" / "0" / "1.img",
+    ]
+    live = renders_root / str(os.getppid()) / "batch" / "0" / "1.img"
+    for path in [*stale, live]:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"page")
+
+    manager = build_manager(JobManager)
+
+    assert manager._page_renders_root == renders_root / str(os.getpid())
+    assert [path for path in stale if path.exists()] == []
+    assert live.exists()
+
+
+def test_page_driven_job_metadata_writes_are_coalesced(build_manager, monkeypatch) -> None:
+    manager = build_manager(JobManager)
+    writes: list[str] = []
+    monkeypatch.setattr(manager, "_persist_job_metadata", writes.append)
+
+    manager._job_metadata_written_at["batch"] = job_manager.time.monotonic()
+    manager._persist_job_metadata_coalesced("batch")
+    assert writes == []
+
+    manager._job_metadata_written_at["batch"] -= job_manager.METADATA_FLUSH_INTERVAL_SECONDS
+    manager._persist_job_metadata_coalesced("batch")
+    assert writes == ["batch"]
+
+
+def test_page_updates_do_not_wait_on_other_jobs(build_manager) -> None:
+    manager = build_manager(JobManager)
+    for job_id in ("job-a", "job-b"):
+        manager._job_locks[job_id] = threading.RLock()
+        manager._job_metrics[job_id] = manager._new_metrics()
+
+    held = threading.Event()
+    release = threading.Event()
+
+    def _hold_job_a() -> None:
+        with manager._job_lock("job-a"):
+            held.set()
+            release.wait(timeout=5.0)
+
+    holder = threading.Thread(target=_hold_job_a)
+    holder.start()
+    assert held.wait(timeout=5.0)
+    try:
+        recorded = threading.Event()
+
+        def _record_job_b() -> None:
+            manager._record_run_page_metrics(
+                job_id="job-b",
+                run_id="model-x:1",
+                succeeded=True,
+                processing_time_seconds=1.0,
+                ocr_request_time_seconds=1.0,
+                token_usage={"input_tokens": 1, "output_tokens": 1, "total_tokens": 2},
+            )
+            recorded.set()
+
+        threading.Thread(target=_record_job_b).start()
+        assert recorded.wait(timeout=2.0)
+    finally:
+        release.set()
+        holder.join()
+
+    assert manager._job_metrics["job-b"]["pages_attempted"] == 1
@@ -0,0 +1,12 @@
+from datetime import UTC, datetime
+
+from tracr.core.jsonio import dumps_bytes, loads
+
+
+def test_dumps_bytes_pretty_is_sorted_and_round_trips() -> None:
+    payload = {"b": 1, "a": {2: "x"}, "when": datetime(2026, 2, 7, tzinfo=UTC)}
+
+    raw = dumps_bytes(payload, pretty=True)
+
+    assert raw.index(b'"a"') < raw.index(b'"b"')
+    assert loads(raw) == {"a": {"2": "x"}, "b": 1, "when": "2026-02-07T00:00:00+00:00"}
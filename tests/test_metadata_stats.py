@@ -2,30 +2,19 @@ import json
 from datetime import UTC, datetime
 from pathlib import Path
 
-from tracr.core.config import Settings
 from tracr.core.models import JobProgress, ModelMode, ModelRunProgress
+from tracr.runtime import job_manager as job_manager_module
 from tracr.runtime.job_manager import JobManager
 
 
-def _build_manager(tmp_path: Path) -> JobManager:
-    settings = Settings(
-        _env_file=None,
-        OCR_INPUTS_DIR=str(tmp_path / "inputs"),
-        OCR_OUTPUTS_DIR=str(tmp_path / "outputs"),
-        OCR_STATE_DIR=str(tmp_path / "state"),
-    )
-    settings.ensure_runtime_dirs()
-    return JobManager(settings)
-
-
 def test_token_usage_extraction_handles_openai_shape() -> None:
     usage = {"prompt_tokens": 120, "completion_tokens": 45, "total_tokens": 165}
     totals = JobManager._token_usage_from_provider_usage(usage)
     assert totals == {"input_tokens": 120, "output_tokens": 45, "total_tokens": 165}
 
 
-def test_pdf_metadata_persists_page_and_global_stats(tmp_path: Path) -> None:
-    manager = _build_manager(tmp_path)
+def test_pdf_metadata_persists_page_and_global_stats(tmp_path: Path, build_manager) -> None:
+    manager = build_manager(JobManager)
 
     manager.layout.ensure_job("job-m", {"job_id": "job-m"})
     run_paths = manager.layout.prepare_run("job-m", "org/model-a", {"model": "org/model-a"})
@@ -59,7 +48,7 @@ def test_pdf_metadata_persists_page_and_global_stats(tmp_path: Path) -> None:
         ended_at=datetime.now(UTC),
     )
 
-    payload = json.loads(pdf_paths.pdf_metadata_path.read_text(encoding="utf-8"))
+    payload = manager.load_pdf_metadata(pdf_paths.pdf_dir)
     stats = payload["statistics"]
 
     assert stats["page_count"] == 3
@@ -72,8 +61,58 @@ def test_pdf_metadata_persists_page_and_global_stats(tmp_path: Path) -> None:
     assert len(payload["pages"]) == 2
 
 
-def test_job_metadata_includes_rollup_statistics(tmp_path: Path) -> None:
-    manager = _build_manager(tmp_path)
+def test_in_flight_pdf_metadata_is_rebuilt_from_page_log(build_manager) -> None:
+    manager = build_manager(JobManager)
+
+    manager.layout.ensure_job("job-n", {"job_id": "job-n"})
+    run_paths = manager.layout.prepare_run("job-n", "org/model-a", {"model": "org/model-a"})
+    pdf_paths = manager.layout.prepare_pdf(run_paths.run_dir, Path("/tmp/sample.pdf"), page_count=3)
+
+    totals = JobManager._new_metrics()
+    for page_number in (2, 1):
+        page = {
+            "page_number": page_number,
+            "status": "completed",
+            "processing_time_seconds": 1.0,
+            "ocr_request_time_seconds": 0.5,
+            "token_usage": {"input_tokens": 1, "output_tokens": 2, "total_tokens": 3},
+        }
+        manager._append_pdf_page(pdf_paths.pdf_pages_path, page)
+        JobManager._accumulate_pdf_page(totals, page)
+    manager._persist_pdf_summary(
+        pdf_summary_path=pdf_paths.pdf_summary_path,
+        source_pdf=Path("/tmp/sample.pdf"),
+        pdf_slug=pdf_paths.pdf_slug,
+        page_count=3,
+        started_at=datetime.now(UTC),
+        running_totals=totals,
+    )
+    with pdf_paths.pdf_pages_path.open("ab") as handle:
+        handle.write(b'{"page_number": 3, "sta')
+
+    payload = manager.load_pdf_metadata(pdf_paths.pdf_dir)
+    assert [page["page_number"] for page in payload["pages"]] == [1, 2]
+    assert payload["statistics"]["processed_pages"] == 2
+    assert payload["statistics"]["token_usage"]["output_tokens"] == 4
+    assert "pages" not in json.loads(pdf_paths.pdf_metadata_path.read_text(encoding="utf-8"))
+
+    manager._persist_pdf_metadata(
+        pdf_metadata_path=pdf_paths.pdf_metadata_path,
+        source_pdf=Path("/tmp/sample.pdf"),
+        pdf_slug=pdf_paths.pdf_slug,
+        page_count=3,
+        pages=payload["pages"],
+        started_at=None,
+        ended_at=datetime.now(UTC),
+        running_totals=totals,
+    )
+    assert not pdf_paths.pdf_summary_path.exists()
+    assert not pdf_paths.pdf_pages_path.exists()
+    assert len(json.loads(pdf_paths.pdf_metadata_path.read_text(encoding="utf-8"))["pages"]) == 2
+
+
+def test_job_metadata_includes_rollup_statistics(tmp_path: Path, build_manager) -> None:
+    manager = build_manager(JobManager)
     manager._project_root = tmp_path.resolve()
 
     run = ModelRunProgress(
@@ -118,9 +157,13 @@ def test_job_metadata_includes_rollup_statistics(tmp_path: Path) -> None:
     assert stats["token_usage"]["output_tokens"] == 70
     assert stats["token_usage"]["total_tokens"] == 170
 
+    snapshot = manager.statistics_snapshot()
+    assert snapshot["job-s"]["job"] == manager.job_statistics("job-s")
+    assert snapshot["job-s"]["runs"]["model-a:1"] == manager.run_statistics("job-s", "model-a:1")
 
-def test_job_metadata_merges_existing_runs_for_reused_job_id(tmp_path: Path) -> None:
-    manager = _build_manager(tmp_path)
+
+def test_job_metadata_merges_existing_runs_for_reused_job_id(tmp_path: Path, build_manager) -> None:
+    manager = build_manager(JobManager)
     manager._project_root = tmp_path.resolve()
 
     metadata_path = tmp_path / "outputs" / "job-s" / "job_metadata.json"
@@ -219,3 +262,116 @@ def test_job_metadata_merges_existing_runs_for_reused_job_id(tmp_path: Path) ->
     assert stats["token_usage"]["input_tokens"] == 15
     assert stats["token_usage"]["output_tokens"] == 27
     assert stats["token_usage"]["total_tokens"] == 42
+
+
+def test_metadata_debounce_flushes_on_interval_or_page_count(monkeypatch) -> None:
+    clock = iter([0.1, 0.2, 0.4, 0.5, 0.6, 0.7])
+    monkeypatch.setattr(job_manager_module.time, "monotonic", lambda: next(clock))
+    debounce = job_manager_module._MetadataDebounce(interval_seconds=0.25, every_pages=3, last_flush=0.0)
+
+    assert debounce.mark_dirty() is False
+    assert debounce.mark_dirty() is False
+    assert debounce.mark_dirty() is True
+    assert debounce.dirty_pages == 0
+    assert debounce.mark_dirty() is False
+    assert debounce.mark_dirty() is False
+    assert debounce.mark_dirty() is True
+
+
+def test_pdf_statistics_running_totals_match_full_recompute() -> None:
+    pages = [
+        {
+            "page_number": 1,
+            "status": "completed",
+            "processing_time_seconds": 1.0,
+            "ocr_request_time_seconds": 0.5,
+            "token_usage": {"input_tokens": 3, "output_tokens": 4, "total_tokens": 7},
+        },
+        {
+            "page_number": 2,
+            "status": "failed",
+            "processing_time_seconds": 2.0,
+            "ocr_request_time_seconds": None,
+            "token_usage": {"input_tokens": 0, "output_tokens": 0, "total_tokens": 0},
+        },
+    ]
+    totals = JobManager._new_metrics()
+    for page in pages:
+        JobManager._accumulate_pdf_page(totals, page)
+
+    assert JobManager._pdf_statistics(5, pages, running_totals=totals) == JobManager._pdf_statistics(5, pages)
+
+
+def test_pdf_statistics_tolerates_partial_token_usage() -> None:
+    pages = [
+        {"page_number": 1, "status": "completed", "token_usage": {"input_tokens": "3", "output_tokens": 4}},
+        {"page_number": 2, "status": "completed", "token_usage": None},
+        {"page_number": 3, "status": "failed", "token_usage": {"input_tokens": 1, "output_tokens": 1, "total_tokens": 2}},
+    ]
+
+    stats = JobManager._pdf_statistics(3, pages)
+    assert stats["pages_succeeded"] == 2
+    assert stats["pages_failed"] == 1
+    assert stats["token_usage"] == {"input_tokens": 4, "output_tokens": 5, "total_tokens": 2}
+
+
+def test_token_usage_extraction_coerces_and_fills_missing_total() -> None:
+    usage = JobManager._token_usage_from_provider_usage(
+        {"input_tokens": "7", "output_tokens": 5, "total_tokens": None}
+    )
+    assert usage == {"input_tokens": 7, "output_tokens": 5, "total_tokens": 12}
+    assert JobManager._token_usage_from_provider_usage(None) == {"input_tokens": 0, "output_tokens": 0, "total_tokens": 0}
+
+
+def test_iso_from_ns_matches_datetime_isoformat() -> None:
+    moment = datetime(2026, 2, 7, 12, 30, 45, 123456, tzinfo=UTC)
+    timestamp_ns = int(moment.timestamp()) * 1_000_000_000 + 123_456_789
+
+    assert job_manager_module._iso_from_ns(timestamp_ns) == moment.isoformat()
+    assert job_manager_module._iso_from_ns(int(moment.timestamp()) * 1_000_000_000).endswith("12:30:45+00:00")
+
+
+def test_job_statistics_use_running_totals(tmp_path: Path, build_manager, monkeypatch) -> None:
+    manager = build_manager(JobManager)
+    runs = [
+        ModelRunProgress(
+            run_id=f"model-{name}:1",
+            model=f"org/model-{name}",
+            mode=ModelMode.API,
+            output_dir=str(tmp_path / "outputs" / "job-r" / f"model-{name}" / "1"),
+            total_pages=2,
+        )
+        for name in ("a", "b")
+    ]
+    job = JobProgress(
+        job_id="job-r",
+        title="job-r",
+        input_path=str(tmp_path / "inputs" / "doc.pdf"),
+        total_pages_all_models=4,
+        models=runs,
+        metadata_path=str(tmp_path / "outputs" / "job-r" / "job_metadata.json"),
+    )
+    manager._jobs[job.job_id] = job
+    manager._job_metrics[job.job_id] = manager._new_metrics()
+
+    for run, succeeded in ((runs[0], True), (runs[0], False), (runs[1], True)):
+        manager._record_run_page_metrics(
+            job_id=job.job_id,
+            run_id=run.run_id,
+            succeeded=succeeded,
+            processing_time_seconds=1.5,
+            ocr_request_time_seconds=1.0,
+            token_usage={"input_tokens": 10, "output_tokens": 5, "total_tokens": 15},
+        )
+
+    def _no_rescan(*_args, **_kwargs):
+        raise AssertionError("job statistics should not rescan runs")
+
+    monkeypatch.setattr(manager, "_run_statistics", _no_rescan)
+    stats = manager.job_statistics(job.job_id)
+
+    assert stats["pages_attempted"] == 3
+    assert stats["pages_succeeded"] == 2
+    assert stats["pages_failed"] == 1
+    assert stats["processing_time_seconds"] == 4.5
+    assert stats["token_usage"] == {"input_tokens": 30, "output_tokens": 15, "total_tokens": 45}
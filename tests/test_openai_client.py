@@ -1,6 +1,16 @@
+from pathlib import Path
+
+import pytest
+
+from tracr.runtime import openai_client
 from tracr.runtime.openai_client import OpenAICompatibleOCRClient
 
 
+@pytest.fixture(autouse=True)
+def _clear_dotenv_cache(monkeypatch) -> None:
+    monkeypatch.setattr(openai_client, "_DOTENV_CACHE", {})
+
+
 def test_lookup_api_key_env_prefers_process_env(monkeypatch) -> None:
     monkeypatch.setenv("GEMINI_API_KEY", "from-process-env")
     value = OpenAICompatibleOCRClient.lookup_api_key_env("GEMINI_API_KEY")
@@ -29,3 +39,35 @@ def test_resolve_api_key_uses_env_lookup(monkeypatch) -> None:
 
     value = OpenAICompatibleOCRClient.resolve_api_key(None, "OPENAI_API_KEY")
     assert value == "dotenv-openai-key"
+
+
+def test_dotenv_is_reparsed_only_when_file_changes(monkeypatch, tmp_path: Path) -> None:
+    env_path = tmp_path / ".env"
+    env_path.write_text("GEMINI_API_KEY=first\n", encoding="utf-8")
+    monkeypatch.setattr(openai_client, "_DOTENV_PATH", env_path)
+    monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+
+    calls = 0
+    real_dotenv_values = openai_client.dotenv_values
+
+    def counting_dotenv_values(path):  # noqa: ANN001
+        nonlocal calls
+        calls += 1
+        return real_dotenv_values(path)
+
+    monkeypatch.setattr(openai_client, "dotenv_values", counting_dotenv_values)
+
+    assert OpenAICompatibleOCRClient.lookup_api_key_env("GEMINI_API_KEY") == "first"
+    assert OpenAICompatibleOCRClient.lookup_api_key_env("GEMINI_API_KEY") == "first"
+    assert calls == 1
+
+    env_path.write_text("GEMINI_API_KEY=second-value\n", encoding="utf-8")
+    assert OpenAICompatibleOCRClient.lookup_api_key_env("GEMINI_API_KEY") == "second-value"
+    assert calls == 2
+
+
+def test_image_content_block_sniffs_media_type() -> None:
+    jpeg_block = OpenAICompatibleOCRClient._image_content_block(b"\xff\xd8\xff\xe0jpeg")
+    png_block = OpenAICompatibleOCRClient._image_content_block(b"\x89PNG\r\n\x1a\npng")
+    assert jpeg_block["image_url"]["url"].startswith("data:image/jpeg;base64,")
+    assert png_block["image_url"]["url"].startswith("data:image/png;base64,")
@@ -1,6 +1,7 @@
+import json
 from pathlib import Path
 
-from tracr.core.output_layout import OutputLayout, build_job_id
+from tracr.core.output_layout import OutputLayout, _slug, atomic_write_bytes, build_job_id, write_json
 
 
 class DummySettings:
@@ -54,3 +55,56 @@ def test_prepare_pdf_deduplicates_slug(tmp_path: Path) -> None:
 
     assert pdf1.pdf_slug == "invoice"
     assert pdf2.pdf_slug == "invoice-2"
+
+
+def test_atomic_write_bytes_replaces_file_without_leftovers(tmp_path: Path) -> None:
+    target = tmp_path / "nested" / "meta.json"
+
+    atomic_write_bytes(target, b"{}")
+    atomic_write_bytes(target, b'{"a": 1}', fsync=True)
+
+    assert target.read_bytes() == b'{"a": 1}'
+    assert [child.name for child in target.parent.iterdir()] == ["meta.json"]
+
+
+def test_slug_fast_path_matches_regex_path() -> None:
+    assert _slug("invoice_2024.v2") == "invoice_2024.v2"
+    assert _slug("--a--b--") == "a-b"
+    assert _slug("My Job / Q1") == "My-Job-Q1"
+    assert _slug("café menu") == "caf-menu"
+    assert _slug("  !!  ") == "job"
+
+
+def test_prepare_pdf_dedup_survives_new_layout_and_suffix_collisions(tmp_path: Path) -> None:
+    settings = DummySettings(tmp_path / "outputs")
+    layout = OutputLayout(settings)
+    run = layout.prepare_run("job-a", "org/model", {"x": 1})
+
+    assert layout.prepare_pdf(run.run_dir, Path("/a/invoice-2.pdf"), page_count=1).pdf_slug == "invoice-2"
+    assert layout.prepare_pdf(run.run_dir, Path("/a/invoice.pdf"), page_count=1).pdf_slug == "invoice"
+    assert layout.prepare_pdf(run.run_dir, Path("/b/invoice.pdf"), page_count=1).pdf_slug == "invoice-3"
+
+    restarted = OutputLayout(settings)
+    assert restarted.prepare_pdf(run.run_dir, Path("/c/invoice.pdf"), page_count=1).pdf_slug == "invoice-4"
+
+
+def test_forget_run_drops_slug_state_and_reseeds_from_disk(tmp_path: Path) -> None:
+    layout = OutputLayout(DummySettings(tmp_path / "outputs"))
+    run = layout.prepare_run("job-a", "org/model", {"x": 1})
+    assert layout.prepare_pdf(run.run_dir, Path("/a/invoice.pdf"), page_count=1).pdf_slug == "invoice"
+
+    layout.forget_run(run.run_dir)
+    assert layout._run_dir_names == {}
+    assert layout._slug_counters == {}
+
+    assert layout.prepare_pdf(run.run_dir, Path("/b/invoice.pdf"), page_count=1).pdf_slug == "invoice-2"
+
+
+def test_write_json_is_sorted_indented_utf8(tmp_path: Path) -> None:
+    path = tmp_path / "nested" / "meta.json"
+    write_json(path, {"b": 1, "a": {"title": "r\u00e9sum\u00e9"}})
+
+    text = path.read_text(encoding="utf-8")
+    assert text.startswith('{\n  "a": {\n    "title": "r\u00e9sum\u00e9"')
+    assert json.loads(text) == {"a": {"title": "r\u00e9sum\u00e9"}, "b": 1}
+    assert [child.name for child in path.parent.iterdir()] == ["meta.json"]
@@ -1,3 +1,7 @@
+from collections import OrderedDict
+from pathlib import Path
+
+import pypdfium2 as pdfium
 import pytest
 
 from tracr.core import pdf_tools
@@ -8,3 +12,85 @@ def test_rendering_requires_pillow(monkeypatch) -> None:
 
     with pytest.raises(RuntimeError, match="Pillow is required"):
         pdf_tools._ensure_pillow_available()
+
+
+def _write_pdf(path: Path, page_sizes: list[tuple[int, int]]) -> Path:
+    document = pdfium.PdfDocument.new()
+    for width, height in page_sizes:
+        document.new_page(width, height)
+    document.save(str(path))
+    document.close()
+    return path
+
+
+def _png_size(image_png: bytes) -> tuple[int, int]:
+    assert image_png.startswith(b"\x89PNG")
+    return int.from_bytes(image_png[16:20], "big"), int.from_bytes(image_png[20:24], "big")
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_iter_rendered_pages_yields_pages_in_order(tmp_path, monkeypatch, workers: int) -> None:
+    monkeypatch.setattr(pdf_tools, "PDF_RENDER_WORKERS", workers)
+    monkeypatch.setattr(pdf_tools, "_RENDER_POOL", None)
+    pdf_path = _write_pdf(tmp_path / "doc.pdf", [(72, 72), (144, 72), (72, 144), (36, 36), (72, 36)])
+
+    try:
+        pages = list(pdf_tools.iter_rendered_pages(pdf_path, dpi=72, image_format="png"))
+        descriptors = pdf_tools.describe_pdfs([pdf_path, pdf_path])
+        assert (pdf_tools._RENDER_POOL is not None) == (workers > 1)
+    finally:
+        if pdf_tools._RENDER_POOL is not None:
+            pdf_tools._RENDER_POOL.shutdown()
+
+    assert [page_number for page_number, _ in pages] == [1, 2, 3, 4, 5]
+    assert [_png_size(image_png) for _, image_png in pages] == [(72, 72), (144, 72), (72, 144), (36, 36), (72, 36)]
+    assert [descriptor.page_count for descriptor in descriptors] == [5, 5]
+
+
+def test_iter_rendered_pages_defaults_to_jpeg(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(pdf_tools, "PDF_RENDER_WORKERS", 1)
+    pdf_path = _write_pdf(tmp_path / "doc.pdf", [(72, 72)])
+
+    [(page_number, image_bytes)] = list(pdf_tools.iter_rendered_pages(pdf_path, dpi=72))
+    assert page_number == 1
+    assert image_bytes.startswith(b"\xff\xd8\xff")
+    assert pdf_tools.render_pdf_page_png(pdf_path, 0, dpi=72).startswith(b"\x89PNG")
+
+
+def test_page_count_is_cached_until_file_changes(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(pdf_tools, "PDF_RENDER_WORKERS", 1)
+    monkeypatch.setattr(pdf_tools, "_PAGE_COUNTS", {})
+    counted: list[str] = []
+    real_count = pdf_tools._count_pages
+
+    def _counting(path: str) -> int:
+        counted.append(path)
+        return real_count(path)
+
+    monkeypatch.setattr(pdf_tools, "_count_pages", _counting)
+    pdf_path = _write_pdf(tmp_path / "doc.pdf", [(72, 72), (72, 72)])
+
+    assert [descriptor.page_count for descriptor in pdf_tools.describe_pdfs([pdf_path, pdf_path])] == [2, 2]
+    assert pdf_tools.get_page_count(pdf_path) == 2
+    assert counted == [str(pdf_path)]
+
+    _write_pdf(pdf_path, [(72, 72), (72, 72), (72, 72)])
+    assert pdf_tools.get_page_count(pdf_path) == 3
+    assert len(counted) == 2
+
+
+def test_render_pdf_page_reuses_open_document_until_file_changes(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(pdf_tools, "_OPEN_PDFS", OrderedDict())
+    pdf_path = _write_pdf(tmp_path / "doc.pdf", [(72, 72), (144, 72)])
+
+    try:
+        assert _png_size(pdf_tools.render_pdf_page_png(pdf_path, 0, dpi=72)) == (72, 72)
+        first_document = pdf_tools._OPEN_PDFS[str(pdf_path)][1]
+        assert _png_size(pdf_tools.render_pdf_page_png(pdf_path, 1, dpi=72)) == (144, 72)
+        assert pdf_tools._OPEN_PDFS[str(pdf_path)][1] is first_document
+
+        _write_pdf(pdf_path, [(36, 36), (72, 36), (72, 72)])
+        assert _png_size(pdf_tools.render_pdf_page_png(pdf_path, 0, dpi=72)) == (36, 36)
+        assert pdf_tools._OPEN_PDFS[str(pdf_path)][1] is not first_document
+    finally:
+        pdf_tools._close_cached_documents()
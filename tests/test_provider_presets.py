@@ -1,4 +1,4 @@
-from tracr.core.provider_presets import PRESET_BY_KEY, PROVIDER_PRESETS
+from tracr.core.provider_presets import PRESET_BY_KEY, PROVIDER_PRESETS, model_slug
 
 
 def test_provider_preset_list_and_examples() -> None:
@@ -10,3 +10,9 @@ def test_provider_preset_list_and_examples() -> None:
     assert PRESET_BY_KEY["openai"].example_models == ("gpt-5.2", "gpt-5-mini")
     assert PRESET_BY_KEY["openrouter"].example_models == ("google/gemini-3-flash-preview",)
     assert PRESET_BY_KEY["gemini"].example_models == ("gemini-3-pro-preview", "gemini-3-flash-preview")
+
+
+def test_model_slug_collapses_dash_runs() -> None:
+    assert model_slug(" org/Model Name ") == "org-Model-Name"
+    assert model_slug("org//model -- v2") == "org-model-v2"
+    assert model_slug("gpt-5-mini") == "gpt-5-mini"
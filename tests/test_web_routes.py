@@ -1,20 +1,19 @@
 from __future__ import annotations
 
 import json
+import shutil
+from collections.abc import Iterator
 from pathlib import Path
 
+import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
+from helpers import write_json
 from tracr.core.config import REPO_ROOT, Settings
 from tracr.runtime.elo_manager import EloManager
 from tracr.runtime.job_manager import JobManager
-from tracr.web.routes import build_web_router
-
-
-def _write_json(path: Path, payload: dict) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload), encoding="utf-8")
+from tracr.web.routes import OrjsonResponse, build_web_router
 
 
 def _build_settings(tmp_path: Path) -> Settings:
@@ -34,17 +33,18 @@ def _build_client(tmp_path: Path) -> tuple[TestClient, Settings]:
     manager = JobManager(settings)
     elo_manager = EloManager(settings)
     app = FastAPI()
+    app.state.elo_manager = elo_manager
     app.include_router(build_web_router(settings=settings, manager=manager, elo_manager=elo_manager))
     return TestClient(app), settings
 
 
 def _seed_output_tree(settings: Settings) -> None:
     job_dir = settings.outputs_path / "job-1"
-    _write_json(job_dir / "job_metadata.json", {"title": "Invoice Review", "created_at": "2026-02-07T00:00:00Z"})
+    write_json(job_dir / "job_metadata.json", {"title": "Invoice Review", "created_at": "2026-02-07T00:00:00Z"})
 
-    _write_json(job_dir / "model-a" / "model_metadata.json", {"model": "model-a"})
-    _write_json(job_dir / "model-a" / "run-1" / "run_metadata.json", {"model": "model-a"})
-    _write_json(
+    write_json(job_dir / "model-a" / "model_metadata.json", {"model": "model-a"})
+    write_json(job_dir / "model-a" / "run-1" / "run_metadata.json", {"model": "model-a"})
+    write_json(
         job_dir / "model-a" / "run-1" / "invoice" / "pdf_metadata.json",
         {
             "source_pdf": "/very/private/invoice.pdf",
@@ -59,9 +59,9 @@ def _seed_output_tree(settings: Settings) -> None:
     (job_dir / "model-a" / "run-1" / "invoice" / "2.md").write_text("# A output p2", encoding="utf-8")
     (job_dir / "model-a" / "run-1" / "invoice" / "10.md").write_text("# A output p10", encoding="utf-8")
 
-    _write_json(job_dir / "model-b" / "model_metadata.json", {"model": "model-b"})
-    _write_json(job_dir / "model-b" / "run-1" / "run_metadata.json", {"model": "model-b"})
-    _write_json(
+    write_json(job_dir / "model-b" / "model_metadata.json", {"model": "model-b"})
+    write_json(job_dir / "model-b" / "run-1" / "run_metadata.json", {"model": "model-b"})
+    write_json(
         job_dir / "model-b" / "run-1" / "invoice" / "pdf_metadata.json",
         {
             "source_pdf": "/very/private/invoice.pdf",
@@ -71,9 +71,29 @@ def _seed_output_tree(settings: Settings) -> None:
     (job_dir / "model-b" / "run-1" / "invoice" / "1.md").write_text("# B output", encoding="utf-8")
 
 
-def test_web_jobs_and_outputs_do_not_expose_source_paths(tmp_path: Path) -> None:
-    client, settings = _build_client(tmp_path)
+@pytest.fixture(scope="module")
+def seeded_client(tmp_path_factory: pytest.TempPathFactory) -> Iterator[tuple[TestClient, Settings]]:
+    # Built once per module; tests using it must only add state the other users tolerate.
+    client, settings = _build_client(tmp_path_factory.mktemp("web", numbered=True))
     _seed_output_tree(settings)
+    yield client, settings
+    client.app.state.elo_manager.close()
+
+
+def test_orjson_response_round_trips_payloads(seeded_client: tuple[TestClient, Settings]) -> None:
+    payload = {"job_id": "job-1", "title": "Re\u00e7u", "pages": [1, 2], "score": 0.5, "note": None}
+    response = OrjsonResponse(payload)
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == payload
+
+    client, _settings = seeded_client
+    outputs_resp = client.get("/api/web/jobs/job-1/outputs")
+    assert outputs_resp.headers["content-type"] == "application/json"
+    assert outputs_resp.json()["job_id"] == "job-1"
+
+
+def test_web_jobs_and_outputs_do_not_expose_source_paths(seeded_client: tuple[TestClient, Settings]) -> None:
+    client, _settings = seeded_client
 
     jobs_resp = client.get("/api/web/jobs")
     assert jobs_resp.status_code == 200
@@ -93,9 +113,8 @@ def test_web_jobs_and_outputs_do_not_expose_source_paths(tmp_path: Path) -> None
     assert model_a_output["page_numbers"] == [1, 2, 10]
 
 
-def test_web_viewer_and_elo_vote_flow(tmp_path: Path) -> None:
-    client, settings = _build_client(tmp_path)
-    _seed_output_tree(settings)
+def test_web_viewer_and_elo_vote_flow(seeded_client: tuple[TestClient, Settings]) -> None:
+    client, settings = seeded_client
 
     outputs_resp = client.get("/api/web/jobs/job-1/outputs")
     assert outputs_resp.status_code == 200
@@ -158,10 +177,10 @@ def test_web_viewer_page_image_resolves_relative_source_pdf(tmp_path: Path, monk
     source_pdf.write_bytes(b"%PDF-1.4\n")
 
     try:
-        _write_json(job_dir / "job_metadata.json", {"title": "Invoice Review", "created_at": "2026-02-07T00:00:00Z"})
-        _write_json(job_dir / "model-a" / "model_metadata.json", {"model": "model-a"})
-        _write_json(job_dir / "model-a" / "run-1" / "run_metadata.json", {"model": "model-a"})
-        _write_json(
+        write_json(job_dir / "job_metadata.json", {"title": "Invoice Review", "created_at": "2026-02-07T00:00:00Z"})
+        write_json(job_dir / "model-a" / "model_metadata.json", {"model": "model-a"})
+        write_json(job_dir / "model-a" / "run-1" / "run_metadata.json", {"model": "model-a"})
+        write_json(
             job_dir / "model-a" / "run-1" / "invoice" / "pdf_metadata.json",
             {"source_pdf": source_pdf_relative, "pages": [{"page_number": 1}]},
         )
@@ -201,16 +220,16 @@ def test_web_viewer_page_image_falls_back_from_stale_absolute_source_pdf(tmp_pat
     source_pdf.parent.mkdir(parents=True, exist_ok=True)
     source_pdf.write_bytes(b"%PDF-1.4\n")
 
-    _write_json(
+    write_json(
         job_dir / "job_metadata.json",
         {"title": "Invoice Review", "created_at": "2026-02-07T00:00:00Z", "input_path": "inputs/invoice.pdf"},
     )
-    _write_json(job_dir / "model-a" / "model_metadata.json", {"model": "model-a"})
-    _write_json(
+    write_json(job_dir / "model-a" / "model_metadata.json", {"model": "model-a"})
+    write_json(
         job_dir / "model-a" / "run-1" / "run_metadata.json",
         {"model": "model-a", "source_files": ["inputs/invoice.pdf"]},
     )
-    _write_json(
+    write_json(
         job_dir / "model-a" / "run-1" / "invoice" / "pdf_metadata.json",
         {"source_pdf": "/root/tracr/inputs/invoice.pdf", "pages": [{"page_number": 1}]},
     )
@@ -238,3 +257,29 @@ def test_web_viewer_page_image_falls_back_from_stale_absolute_source_pdf(tmp_pat
     assert image_resp.content == b"fake-png"
     assert called_with["pdf_path"] == source_pdf
     assert called_with["page_index"] == 0
+
+
+def test_web_jobs_pick_up_rewritten_metadata(tmp_path: Path) -> None:
+    client, settings = _build_client(tmp_path)
+    _seed_output_tree(settings)
+
+    assert client.get("/api/web/jobs").json()["jobs"][0]["title"] == "Invoice Review"
+
+    write_json(
+        settings.outputs_path / "job-1" / "job_metadata.json",
+        {"title": "Invoice Review (rerun)", "created_at": "2026-02-07T00:00:00Z"},
+    )
+
+    assert client.get("/api/web/jobs").json()["jobs"][0]["title"] == "Invoice Review (rerun)"
+
+
+def test_web_jobs_lists_many_jobs_in_stable_order(tmp_path: Path) -> None:
+    client, settings = _build_client(tmp_path)
+    _seed_output_tree(settings)
+    for index in range(2, 7):
+        shutil.copytree(settings.outputs_path / "job-1", settings.outputs_path / f"job-{index}")
+
+    jobs = client.get("/api/web/jobs").json()["jobs"]
+
+    assert [job["job_id"] for job in jobs] == [f"job-{index}" for index in range(6, 0, -1)]
+    assert all(job["output_count"] == 2 for job in jobs)
@@ -1,18 +1,26 @@
 from __future__ import annotations
 
-import json
+import hashlib
+import os
+import stat
+import time
 from contextlib import asynccontextmanager
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
-from fastapi import FastAPI, HTTPException
+from anyio import to_thread
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Request
+from fastapi.responses import FileResponse, Response
 from pydantic import BaseModel, Field
 
 from tracr.core.config import get_settings
 from tracr.core.input_discovery import discover_inputs
+from tracr.core.jsonio import dumps_bytes
 from tracr.core.job_configs import discover_job_configs, load_job_config
 from tracr.core.models import (
+    JOB_PROGRESS_ADAPTER,
+    LIST_JOBS_ADAPTER,
     CancelJobResponse,
     DismissJobResponse,
     JobOutputPageContentResponse,
@@ -28,15 +36,35 @@ from tracr.core.models import (
 )
 from tracr.core.provider_presets import DEFAULT_LOCAL_MODELS, PROVIDER_PRESETS
 from tracr.runtime.elo_manager import EloManager
+from tracr.runtime.gpu import prewarm_gpu_poller
 from tracr.runtime.job_manager import JobManager
 from tracr.runtime.openai_client import EndpointAuth, OpenAICompatibleOCRClient
 from tracr.web.routes import build_web_router
 
 
+# Sync handlers (file tree, inputs, job configs) run on anyio's worker threads; the default
+# limit of 40 caps concurrent disk-bound requests.
+API_THREADPOOL_TOKENS = 128
+RAW_OUTPUT_MEDIA_TYPES = {
+    ".md": "text/markdown; charset=utf-8",
+    ".json": "application/json",
+    ".jsonl": "application/x-ndjson",
+    ".ndjson": "application/x-ndjson",
+}
+
 settings = get_settings()
 manager = JobManager(settings)
 elo_manager = EloManager(settings)
 
+HEALTH_TIMESTAMP_RESOLUTION_SECONDS = 1.0
+_health_payload: tuple[float, dict[str, str]] = (float("-inf"), {})
+
+# Static catalog responses, serialized once; handlers hand the bytes straight back.
+_PRESETS_JSON = dumps_bytes(
+    [ProviderPresetResponse(**preset.__dict__).model_dump(mode="json") for preset in PROVIDER_PRESETS]
+)
+_LOCAL_MODELS_JSON = dumps_bytes(list(DEFAULT_LOCAL_MODELS))
+
 
 class RawProxyRequest(BaseModel):
     base_url: str | None = None
@@ -59,29 +87,24 @@ class JobWithRuntime(JobProgress):
     eta_seconds: float | None = None
 
 
-def _enrich_job(job: JobProgress) -> JobWithRuntime:
-    runtime = manager.job_runtime_seconds(job)
-    eta = manager.estimate_eta_seconds(job)
-    data = job.model_dump(mode="json")
-    data["runtime_seconds"] = runtime
-    data["eta_seconds"] = eta
-    data["statistics"] = manager.job_statistics(job.job_id)
+def _enrich_job(job: JobProgress, statistics: dict[str, Any] | None = None) -> JobWithRuntime:
+    # The manager hands out deep copies, so computed fields are set in place rather than
+    # round-tripping through model_dump() and revalidating.
+    job.runtime_seconds = manager.job_runtime_seconds(job)
+    job.eta_seconds = manager.estimate_eta_seconds(job)
+    job.statistics = statistics["job"] if statistics else manager.job_statistics(job.job_id)
 
-    run_lookup = {run.run_id: run for run in job.models}
-    for run_payload in data.get("models", []):
-        run_id = str(run_payload.get("run_id", ""))
-        run = run_lookup.get(run_id)
-        if run is None:
-            continue
-        run_payload["runtime_seconds"] = manager.run_runtime_seconds(run)
-        run_payload["eta_seconds"] = manager.estimate_run_eta_seconds(run)
-        run_payload["statistics"] = manager.run_statistics(job.job_id, run_id)
+    run_statistics = statistics["runs"] if statistics else {}
+    for run in job.models:
+        run.runtime_seconds = manager.run_runtime_seconds(run)
+        run.eta_seconds = manager.estimate_run_eta_seconds(run)
+        run.statistics = run_statistics.get(run.run_id) or manager.run_statistics(job.job_id, run.run_id)
 
-    return JobWithRuntime(**data)
+    return JobWithRuntime.model_construct(_fields_set=job.model_fields_set, **job.__dict__)
 
 
 def _resolve_output_path(relative_path: str | None) -> Path:
-    root = settings.outputs_path.resolve()
+    root = settings.resolved_outputs_path
     normalized = (relative_path or "").strip().lstrip("/")
     candidate = (root / normalized).resolve()
     try:
@@ -92,56 +115,34 @@ def _resolve_output_path(relative_path: str | None) -> Path:
 
 
 def _output_relative(path: Path) -> str:
-    root = settings.outputs_path.resolve()
-    if path.resolve() == root:
+    root = settings.resolved_outputs_path
+    resolved = path.resolve()
+    if resolved == root:
         return ""
-    return path.resolve().relative_to(root).as_posix()
+    return resolved.relative_to(root).as_posix()
 
 
 def _output_tokens_for_markdown(markdown_path: Path) -> int | None:
-    if markdown_path.suffix.lower() != ".md" or not markdown_path.stem.isdigit():
-        return None
-
-    metadata_path = markdown_path.parent / "pdf_metadata.json"
-    if not metadata_path.exists():
+    # Callers only pass .md files; page files are named <page_number>.md.
+    if not markdown_path.stem.isdigit():
         return None
 
-    try:
-        payload = json.loads(metadata_path.read_text(encoding="utf-8"))
-    except Exception:  # noqa: BLE001
-        return None
+    return manager.output_tokens_for_page(markdown_path.parent, int(markdown_path.stem))
 
-    pages = payload.get("pages")
-    if not isinstance(pages, list):
-        return None
 
-    page_number = int(markdown_path.stem)
-    for page_entry in pages:
-        if not isinstance(page_entry, dict):
-            continue
-        try:
-            entry_page = int(page_entry.get("page_number"))
-        except Exception:  # noqa: BLE001
-            continue
-        if entry_page != page_number:
-            continue
-        token_usage = page_entry.get("token_usage")
-        if not isinstance(token_usage, dict):
-            return None
-        try:
-            return int(token_usage.get("output_tokens"))
-        except Exception:  # noqa: BLE001
-            return None
-
-    return None
+def _write_proxy_log(output_path: Path, log_payload: dict[str, Any]) -> None:
+    output_path.write_bytes(dumps_bytes(log_payload, pretty=True))
 
 
 @asynccontextmanager
 async def lifespan(_: FastAPI):
+    to_thread.current_default_thread_limiter().total_tokens = API_THREADPOOL_TOKENS
+    prewarm_gpu_poller()
     try:
         yield
     finally:
         await manager.shutdown()
+        elo_manager.close()
 
 
 app = FastAPI(title="TRACR", version="0.1.0", lifespan=lifespan)
@@ -150,17 +151,22 @@ app.include_router(build_web_router(settings=settings, manager=manager, elo_mana
 
 @app.get("/health")
 def health() -> dict[str, str]:
-    return {"status": "ok", "time": datetime.now(UTC).isoformat()}
+    global _health_payload
+    now = time.monotonic()
+    # Readiness probes poll this every 0.5s; one-second resolution is plenty.
+    if now - _health_payload[0] >= HEALTH_TIMESTAMP_RESOLUTION_SECONDS:
+        _health_payload = (now, {"status": "ok", "time": datetime.now(UTC).isoformat()})
+    return _health_payload[1]
 
 
 @app.get("/api/presets", response_model=list[ProviderPresetResponse])
-def list_presets() -> list[ProviderPresetResponse]:
-    return [ProviderPresetResponse(**preset.__dict__) for preset in PROVIDER_PRESETS]
+def list_presets() -> Response:
+    return Response(content=_PRESETS_JSON, media_type="application/json")
 
 
 @app.get("/api/local-default-models", response_model=list[str])
-def list_local_default_models() -> list[str]:
-    return list(DEFAULT_LOCAL_MODELS)
+def list_local_default_models() -> Response:
+    return Response(content=_LOCAL_MODELS_JSON, media_type="application/json")
 
 
 @app.get("/api/inputs")
@@ -205,18 +211,19 @@ async def launch_job(payload: LaunchJobRequest) -> LaunchJobResponse:
 
 
 @app.get("/api/jobs", response_model=ListJobsResponse)
-def list_jobs() -> ListJobsResponse:
-    jobs = [_enrich_job(job) for job in manager.list_jobs()]
+def list_jobs() -> Response:
+    statistics = manager.statistics_snapshot()
+    jobs = [_enrich_job(job, statistics.get(job.job_id)) for job in manager.list_jobs()]
     jobs.sort(key=lambda item: item.created_at, reverse=True)
-    return ListJobsResponse(jobs=jobs)
+    return Response(content=LIST_JOBS_ADAPTER.dump_json(ListJobsResponse(jobs=jobs)), media_type="application/json")
 
 
 @app.get("/api/jobs/{job_id}", response_model=JobWithRuntime)
-def get_job(job_id: str) -> JobWithRuntime:
+def get_job(job_id: str) -> Response:
     job = manager.get_job(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="job not found")
-    return _enrich_job(job)
+    return Response(content=JOB_PROGRESS_ADAPTER.dump_json(_enrich_job(job)), media_type="application/json")
 
 
 @app.post("/api/jobs/{job_id}/cancel", response_model=CancelJobResponse)
@@ -238,12 +245,14 @@ def dismiss_job(job_id: str) -> DismissJobResponse:
 
 
 @app.get("/api/jobs/{job_id}/output-pages", response_model=JobOutputPagesResponse)
-def list_job_output_pages(job_id: str) -> JobOutputPagesResponse:
+def list_job_output_pages(job_id: str) -> Any:
     try:
         pages = manager.list_output_pages(job_id)
     except FileNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
-    return JobOutputPagesResponse(job_id=job_id, pages=pages)
+    # Page summaries are built server-side with the JobOutputPageSummary fields already, so
+    # they're encoded as-is instead of being validated into one model per page.
+    return Response(content=dumps_bytes({"job_id": job_id, "pages": pages}), media_type="application/json")
 
 
 @app.get("/api/jobs/{job_id}/output-pages/{page_index}", response_model=JobOutputPageContentResponse)
@@ -259,51 +268,94 @@ def get_job_output_page(job_id: str, page_index: int) -> JobOutputPageContentRes
     return JobOutputPageContentResponse(job_id=job_id, page=payload["page"], markdown=payload["markdown"])
 
 
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {candidate.strip() for candidate in header.split(",")}
+    return etag in candidates or "*" in candidates
+
+
 @app.get("/api/outputs/tree", response_model=OutputTreeResponse)
-def list_outputs_tree(relative_path: str = "") -> OutputTreeResponse:
+def list_outputs_tree(request: Request, relative_path: str = "") -> Any:
     target = _resolve_output_path(relative_path)
     if not target.exists():
         raise HTTPException(status_code=404, detail=f"path not found: {relative_path}")
     if not target.is_dir():
         raise HTTPException(status_code=400, detail="relative_path must point to a directory")
 
+    current_relative = _output_relative(target)
+    # target is already resolved, so children's relative paths are plain joins.
+    child_prefix = f"{current_relative}/" if current_relative else ""
+
+    # DirEntry caches the readdir type and the stat result, so each child costs at most one stat.
+    with os.scandir(target) as scanned:
+        children = [(child, child.is_dir()) for child in scanned]
+    children.sort(key=lambda item: (0 if item[1] else 1, item[0].name.lower()))
+
     entries: list[dict[str, Any]] = []
-    children = sorted(target.iterdir(), key=lambda item: (0 if item.is_dir() else 1, item.name.lower()))
-    for child in children:
+    signature: list[tuple[str, int, int]] = []
+    for child, is_dir in children:
+        is_file = not is_dir and child.is_file()
+        suffix = os.path.splitext(child.name)[1].lower()
+        child_stat = None if is_dir else child.stat()
+        size_bytes = None if child_stat is None else child_stat.st_size
+        signature.append(
+            (child.name, -1, -1) if child_stat is None else (child.name, child_stat.st_mtime_ns, child_stat.st_size)
+        )
         entries.append(
             {
                 "name": child.name,
-                "relative_path": _output_relative(child),
-                "kind": "dir" if child.is_dir() else "file",
-                "size_bytes": None if child.is_dir() else child.stat().st_size,
-                "is_metadata_json": child.is_file() and child.suffix.lower() == ".json",
-                "is_markdown": child.is_file() and child.suffix.lower() == ".md",
+                "relative_path": child_prefix + child.name,
+                "kind": "dir" if is_dir else "file",
+                "size_bytes": size_bytes,
+                "is_metadata_json": is_file and suffix == ".json",
+                "is_markdown": is_file and suffix == ".md",
             }
         )
 
-    current_relative = _output_relative(target)
-    root = settings.outputs_path.resolve()
-    parent_path = _output_relative(target.parent) if target.resolve() != root else None
-
-    return OutputTreeResponse(
-        outputs_root=str(settings.outputs_path),
-        current_path=current_relative,
-        parent_path=parent_path,
-        entries=entries,
-    )
+    # The listing only depends on the children's names, kinds, and file stats; hash those so
+    # polling clients get a 304 without re-serializing the tree.
+    signature.sort()
+    etag = f'W/"{hashlib.blake2b(repr((current_relative, signature)).encode(), digest_size=12).hexdigest()}"'
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    parent_path = current_relative.rpartition("/")[0] if current_relative else None
+
+    payload = {
+        "outputs_root": str(settings.outputs_path),
+        "current_path": current_relative,
+        "parent_path": parent_path,
+        "entries": entries,
+    }
+    return Response(content=dumps_bytes(payload), media_type="application/json", headers={"ETag": etag})
 
 
 @app.get("/api/outputs/file", response_model=OutputFileResponse)
-def read_output_file(relative_path: str) -> OutputFileResponse:
+def read_output_file(request: Request, response: Response, relative_path: str) -> Any:
     if not relative_path.strip():
         raise HTTPException(status_code=400, detail="relative_path is required")
 
     target = _resolve_output_path(relative_path)
-    if not target.exists():
-        raise HTTPException(status_code=404, detail=f"path not found: {relative_path}")
-    if not target.is_file():
+    # One stat answers exists/is_file/size; target is already resolved inside the outputs root.
+    try:
+        target_stat = target.stat()
+    except OSError:
+        raise HTTPException(status_code=404, detail=f"path not found: {relative_path}") from None
+    if not stat.S_ISREG(target_stat.st_mode):
         raise HTTPException(status_code=400, detail="relative_path must point to a file")
 
+    extension = target.suffix.lower()
+    is_markdown = extension == ".md"
+    output_tokens = _output_tokens_for_markdown(target) if is_markdown else None
+
+    # Token usage lands in the PDF metadata after the page file is written, so it is part of the tag.
+    etag = f'W/"{target_stat.st_mtime_ns:x}-{target_stat.st_size:x}-{output_tokens if output_tokens is not None else ""}"'
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+
     try:
         content = target.read_text(encoding="utf-8")
     except UnicodeDecodeError:
@@ -311,20 +363,33 @@ def read_output_file(relative_path: str) -> OutputFileResponse:
     except OSError as exc:
         raise HTTPException(status_code=500, detail=f"failed to read file: {exc}") from exc
 
-    output_characters = len(content) if target.suffix.lower() == ".md" else None
-    output_tokens = _output_tokens_for_markdown(target)
+    output_characters = len(content) if is_markdown else None
 
     return OutputFileResponse(
-        relative_path=_output_relative(target),
+        relative_path=target.relative_to(settings.resolved_outputs_path).as_posix(),
         name=target.name,
-        extension=target.suffix.lower(),
-        size_bytes=target.stat().st_size,
+        extension=extension,
+        size_bytes=target_stat.st_size,
         content=content,
         output_tokens=output_tokens,
         output_characters=output_characters,
     )
 
 
+@app.get("/api/outputs/file/raw")
+def read_output_file_raw(relative_path: str) -> FileResponse:
+    if not relative_path.strip():
+        raise HTTPException(status_code=400, detail="relative_path is required")
+
+    target = _resolve_output_path(relative_path)
+    if not target.is_file():
+        raise HTTPException(status_code=404, detail=f"file not found: {relative_path}")
+
+    # FileResponse streams in chunks from a worker thread, so large outputs are never held in memory whole.
+    media_type = RAW_OUTPUT_MEDIA_TYPES.get(target.suffix.lower(), "text/plain; charset=utf-8")
+    return FileResponse(target, media_type=media_type)
+
+
 @app.get("/api/system/gpus", response_model=SystemGPUStats)
 def gpu_stats() -> SystemGPUStats:
     payload = manager.gpu_stats()
@@ -337,7 +402,7 @@ def provider_key_status(provider_key: str, api_key_env: str | None = None) -> di
 
 
 @app.post("/api/proxy/chat/completions", response_model=RawProxyResponse)
-def raw_proxy_chat(payload: RawProxyRequest) -> RawProxyResponse:
+def raw_proxy_chat(payload: RawProxyRequest, background_tasks: BackgroundTasks) -> RawProxyResponse:
     base_url = payload.base_url or settings.default_upstream_base_url
     if not base_url:
         raise HTTPException(status_code=400, detail="Missing base_url and OCR_DEFAULT_UPSTREAM_BASE_URL")
@@ -362,18 +427,13 @@ def raw_proxy_chat(payload: RawProxyRequest) -> RawProxyResponse:
     proxy_dir.mkdir(parents=True, exist_ok=True)
     stamp = datetime.now(UTC).strftime("%Y%m%d-%H%M%S-%f")
     output_path = proxy_dir / f"{stamp}.json"
-    output_path.write_text(
-        json.dumps(
-            {
-                "timestamp": datetime.now(UTC).isoformat(),
-                "base_url": base_url,
-                "request": payload.payload,
-                "response": response,
-            },
-            indent=2,
-            sort_keys=True,
-        ),
-        encoding="utf-8",
-    )
+    log_payload = {
+        "timestamp": datetime.now(UTC).isoformat(),
+        "base_url": base_url,
+        "request": payload.payload,
+        "response": response,
+    }
+    # Upstream payloads can be large (base64 page images); encode and write after the response is sent.
+    background_tasks.add_task(_write_proxy_log, output_path, log_payload)
 
     return RawProxyResponse(saved_to=str(output_path), response=response)
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import argparse
 import os
+import socket
 import subprocess
 import sys
 import time
 import urllib.error
+import urllib.parse
 import urllib.request
 from pathlib import Path
 
@@ -109,17 +111,32 @@ def _local_tui_base_url(host: str, port: int) -> str:
     return f"http://{host}:{port}"
 
 
+API_READY_POLL_SECONDS = 0.2
+
+
 def _wait_for_api_ready(base_url: str, timeout_seconds: float = 90.0) -> None:
-    deadline = time.time() + timeout_seconds
+    deadline = time.monotonic() + timeout_seconds
     health_url = f"{base_url.rstrip('/')}/health"
-    while time.time() < deadline:
+    parsed = urllib.parse.urlsplit(base_url)
+    address = (parsed.hostname or "127.0.0.1", parsed.port or (443 if parsed.scheme == "https" else 80))
+
+    # Bare TCP connects until the listener is up, then HTTP only to confirm /health.
+    port_open = False
+    while time.monotonic() < deadline:
+        if not port_open:
+            try:
+                with socket.create_connection(address, timeout=1):
+                    port_open = True
+            except OSError:
+                time.sleep(API_READY_POLL_SECONDS)
+                continue
         try:
             with urllib.request.urlopen(health_url, timeout=2) as response:
                 if response.status == 200:
                     return
         except (urllib.error.URLError, TimeoutError, ConnectionError):
             pass
-        time.sleep(0.5)
+        time.sleep(API_READY_POLL_SECONDS)
     raise RuntimeError(f"Timed out waiting for API readiness at {health_url}")
 
 
@@ -145,12 +162,12 @@ def run_all(args: argparse.Namespace) -> int:
     ]
 
     print(f"Starting API in background on {host}:{port} (logs: {log_path})")
-    with log_path.open("a", encoding="utf-8") as log_file:
+    # The child writes straight to the inherited descriptor; no text-mode wrapper is needed.
+    with log_path.open("ab") as log_file:
         api_process = subprocess.Popen(
             cmd,
             stdout=log_file,
             stderr=subprocess.STDOUT,
-            text=True,
         )
 
         try:
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import os
 from functools import lru_cache
 from pathlib import Path
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -38,6 +39,11 @@ class Settings(BaseSettings):
     vllm_data_parallel_size: int = Field(default=1, ge=1, alias="OCR_VLLM_DATA_PARALLEL_SIZE")
     vllm_max_concurrent_requests: int = Field(default=8, ge=1, alias="OCR_VLLM_MAX_CONCURRENT_REQUESTS")
     local_max_concurrent_models: int = Field(default=8, alias="OCR_LOCAL_MAX_CONCURRENT_MODELS")
+    metadata_fsync: bool = Field(default=False, alias="OCR_METADATA_FSYNC")
+
+    # Keyed by the raw *_dir value, so model_copy() clones that share these dicts stay correct.
+    _path_cache: dict[str, Path] = PrivateAttr(default_factory=dict)
+    _resolved_paths: dict[str, Path] = PrivateAttr(default_factory=dict)
 
     def resolve_path(self, path_value: str) -> Path:
         candidate = Path(path_value).expanduser()
@@ -45,27 +51,43 @@ class Settings(BaseSettings):
             return candidate
         return REPO_ROOT / candidate
 
+    def _cached_path(self, path_value: str) -> Path:
+        cached = self._path_cache.get(path_value)
+        if cached is None:
+            cached = self.resolve_path(path_value)
+            self._path_cache[path_value] = cached
+        return cached
+
     @property
     def inputs_path(self) -> Path:
-        return self.resolve_path(self.inputs_dir)
+        return self._cached_path(self.inputs_dir)
 
     @property
     def outputs_path(self) -> Path:
-        return self.resolve_path(self.outputs_dir)
+        return self._cached_path(self.outputs_dir)
+
+    @property
+    def resolved_outputs_path(self) -> Path:
+        # resolve() walks every path component; output endpoints need it on each request.
+        resolved = self._resolved_paths.get(self.outputs_dir)
+        if resolved is None:
+            resolved = self.outputs_path.resolve()
+            self._resolved_paths[self.outputs_dir] = resolved
+        return resolved
 
     @property
     def job_configs_path(self) -> Path:
-        return self.resolve_path(self.job_configs_dir)
+        return self._cached_path(self.job_configs_dir)
 
     @property
     def state_path(self) -> Path:
-        return self.resolve_path(self.state_dir)
+        return self._cached_path(self.state_dir)
 
     def ensure_runtime_dirs(self) -> None:
-        self.inputs_path.mkdir(parents=True, exist_ok=True)
-        self.outputs_path.mkdir(parents=True, exist_ok=True)
-        self.job_configs_path.mkdir(parents=True, exist_ok=True)
-        self.state_path.mkdir(parents=True, exist_ok=True)
+        # Shallowest first so shared parents are created once; duplicates are skipped.
+        runtime_dirs = {str(self.inputs_path), str(self.outputs_path), str(self.job_configs_path), str(self.state_path)}
+        for directory in sorted(runtime_dirs, key=len):
+            os.makedirs(directory, exist_ok=True)
 
 
 @lru_cache(maxsize=1)
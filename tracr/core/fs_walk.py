@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+
+def walk_with_suffix(root: str | Path, suffixes: Iterable[str]) -> Iterator[str]:
+    # Depth-first walk that sorts one directory at a time; visiting files and subdirectories
+    # together by name yields paths in the same order as sorting the whole tree, so callers
+    # can stop early without scanning everything first.
+    suffix_tuple = tuple(suffix.lower() for suffix in suffixes)
+    stack: list[Iterator[os.DirEntry[str]]] = []
+    try:
+        with os.scandir(root) as entries:
+            stack.append(iter(sorted(entries, key=lambda entry: entry.name)))
+    except OSError:
+        return
+    while stack:
+        entry = next(stack[-1], None)
+        if entry is None:
+            stack.pop()
+            continue
+        # DirEntry carries the d_type from readdir, so these checks avoid a stat per entry.
+        if entry.is_dir(follow_symlinks=False):
+            try:
+                with os.scandir(entry.path) as children:
+                    stack.append(iter(sorted(children, key=lambda child: child.name)))
+            except OSError:
+                continue
+        elif entry.name.lower().endswith(suffix_tuple) and entry.is_file():
+            yield entry.path
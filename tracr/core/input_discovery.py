@@ -1,16 +1,21 @@
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from tracr.core.config import Settings
+from tracr.core.fs_walk import walk_with_suffix
 from tracr.core.models import InputCandidate
 
 
-PDF_SUFFIXES = {".pdf"}
+PDF_SUFFIXES = frozenset({".pdf"})
+SCAN_WORKERS = 8
 
 
 def is_pdf(path: Path) -> bool:
-    return path.is_file() and path.suffix.lower() in PDF_SUFFIXES
+    # Suffix first: it is a string check, is_file() is a stat.
+    return path.suffix.lower() in PDF_SUFFIXES and path.is_file()
 
 
 def resolve_input_path(settings: Settings, candidate: str) -> Path:
@@ -26,12 +31,39 @@ def resolve_input_path(settings: Settings, candidate: str) -> Path:
     return from_inputs
 
 
+def _scan_pdf_dir(directory: str) -> tuple[list[str], list[str]]:
+    pdf_files: list[str] = []
+    subdirs: list[str] = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                # DirEntry carries the d_type from readdir, so these checks avoid a stat per entry.
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.name.lower().endswith(".pdf") and entry.is_file():
+                    pdf_files.append(entry.path)
+    except OSError:
+        pass
+    return pdf_files, subdirs
+
+
 def expand_pdf_inputs(source: Path) -> list[Path]:
-    if source.is_file() and is_pdf(source):
+    if is_pdf(source):
         return [source]
-    if source.is_dir():
-        return sorted(path for path in source.rglob("*.pdf") if path.is_file())
-    return []
+    if not source.is_dir():
+        return []
+
+    found: list[str] = []
+    pending = [str(source)]
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+        while pending:
+            next_level: list[str] = []
+            for pdf_files, subdirs in executor.map(_scan_pdf_dir, pending):
+                found.extend(pdf_files)
+                next_level.extend(subdirs)
+            pending = next_level
+
+    return sorted(Path(path) for path in found)
 
 
 def discover_inputs(settings: Settings, max_items: int = 500) -> list[InputCandidate]:
@@ -41,28 +73,29 @@ def discover_inputs(settings: Settings, max_items: int = 500) -> list[InputCandi
     candidates: list[InputCandidate] = []
     seen_dirs: set[Path] = set()
 
-    for path in sorted(inputs_root.rglob("*")):
+    # Stop walking as soon as the listing is full instead of scanning the whole tree first.
+    for raw_path in walk_with_suffix(inputs_root, PDF_SUFFIXES):
         if len(candidates) >= max_items:
             break
 
-        if is_pdf(path):
+        path = Path(raw_path)
+        candidates.append(
+            InputCandidate(
+                path=str(path),
+                kind="pdf",
+                relative_to_inputs=str(path.relative_to(inputs_root)),
+            )
+        )
+
+        parent = path.parent
+        if parent != inputs_root and parent not in seen_dirs:
+            seen_dirs.add(parent)
             candidates.append(
                 InputCandidate(
-                    path=str(path),
-                    kind="pdf",
-                    relative_to_inputs=str(path.relative_to(inputs_root)),
+                    path=str(parent),
+                    kind="folder",
+                    relative_to_inputs=str(parent.relative_to(inputs_root)),
                 )
             )
 
-            parent = path.parent
-            if parent != inputs_root and parent not in seen_dirs:
-                seen_dirs.add(parent)
-                candidates.append(
-                    InputCandidate(
-                        path=str(parent),
-                        kind="folder",
-                        relative_to_inputs=str(parent.relative_to(inputs_root)),
-                    )
-                )
-
     return candidates
@@ -1,18 +1,25 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 from tracr.core.config import Settings
+from tracr.core.fs_walk import walk_with_suffix
 from tracr.core.models import LaunchJobRequest
 
 
-JOB_CONFIG_SUFFIXES = {".yaml", ".yml"}
+JOB_CONFIG_SUFFIXES = frozenset({".yaml", ".yml"})
 
 
 def is_job_config(path: Path) -> bool:
-    return path.is_file() and path.suffix.lower() in JOB_CONFIG_SUFFIXES
+    return path.suffix.lower() in JOB_CONFIG_SUFFIXES and path.is_file()
 
 
 def resolve_job_config_path(settings: Settings, candidate: str) -> Path:
@@ -33,16 +40,15 @@ def discover_job_configs(settings: Settings, max_items: int = 500) -> list[dict[
     configs_root.mkdir(parents=True, exist_ok=True)
 
     candidates: list[dict[str, str]] = []
-    for path in sorted(configs_root.rglob("*")):
+    root_prefix = os.path.join(str(configs_root), "")
+    for raw_path in walk_with_suffix(configs_root, JOB_CONFIG_SUFFIXES):
         if len(candidates) >= max_items:
             break
-        if not is_job_config(path):
-            continue
 
         candidates.append(
             {
-                "path": str(path),
-                "relative_to_configs": str(path.relative_to(configs_root)),
+                "path": raw_path,
+                "relative_to_configs": raw_path[len(root_prefix) :],
             }
         )
 
@@ -51,15 +57,17 @@ def discover_job_configs(settings: Settings, max_items: int = 500) -> list[dict[
 
 def load_job_config(settings: Settings, candidate: str) -> LaunchJobRequest:
     path = resolve_job_config_path(settings, candidate)
-    if not path.exists() or not path.is_file():
+    if not path.is_file():
         raise FileNotFoundError(f"Job config file not found: {path}")
     if path.suffix.lower() not in JOB_CONFIG_SUFFIXES:
         raise ValueError("Job config file must end in .yaml or .yml")
 
-    payload = yaml.safe_load(path.read_text(encoding="utf-8"))
+    # libyaml decodes UTF-8 itself; handing it bytes skips a Python-level decode.
+    payload = yaml.load(path.read_bytes(), Loader=_YamlLoader)
     if payload is None:
         payload = {}
     if not isinstance(payload, dict):
         raise ValueError("Job config root must be a mapping/object")
 
-    return LaunchJobRequest.model_validate(payload)
+    # Lax mode: YAML already yields native scalars, so only enums/nested specs need coercion.
+    return LaunchJobRequest.model_validate(payload, strict=False)
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+
+
+DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC
+# Metadata files stay human-readable and diff-stable.
+PRETTY_DUMPS_OPTIONS = DUMPS_OPTIONS | orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+
+
+def dumps_bytes(obj: Any, *, pretty: bool = False) -> bytes:
+    return orjson.dumps(obj, option=PRETTY_DUMPS_OPTIONS if pretty else DUMPS_OPTIONS)
+
+
+def loads(data: bytes | bytearray | memoryview | str) -> Any:
+    return orjson.loads(data)
@@ -5,7 +5,7 @@ from enum import Enum
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator, model_validator
 
 
 DEFAULT_OCR_PROMPT = (
@@ -87,6 +87,9 @@ class PDFProgress(BaseModel):
 
 
 class ModelRunProgress(BaseModel):
+    # Mutated per page by the job manager; keep attribute writes unvalidated.
+    model_config = ConfigDict(validate_assignment=False)
+
     run_id: str
     model: str
     mode: ModelMode
@@ -107,12 +110,12 @@ class ModelRunProgress(BaseModel):
     statistics: dict[str, Any] = Field(default_factory=dict)
 
     def progress_ratio(self) -> float:
-        if self.total_pages <= 0:
-            return 0.0
-        return min(1.0, self.completed_pages / self.total_pages)
+        return min(1.0, self.completed_pages / max(self.total_pages, 1))
 
 
 class JobProgress(BaseModel):
+    model_config = ConfigDict(validate_assignment=False)
+
     job_id: str
     title: str
     input_path: str
@@ -132,9 +135,7 @@ class JobProgress(BaseModel):
     statistics: dict[str, Any] = Field(default_factory=dict)
 
     def progress_ratio(self) -> float:
-        if self.total_pages_all_models <= 0:
-            return 0.0
-        return min(1.0, self.completed_pages_all_models / self.total_pages_all_models)
+        return min(1.0, self.completed_pages_all_models / max(self.total_pages_all_models, 1))
 
 
 class InputCandidate(BaseModel):
@@ -217,6 +218,12 @@ class OutputFileResponse(BaseModel):
     output_characters: int | None = None
 
 
+# Polled job endpoints serialize through these directly to JSON bytes, skipping FastAPI's
+# response-model revalidation and second encoding pass.
+JOB_PROGRESS_ADAPTER = TypeAdapter(JobProgress)
+LIST_JOBS_ADAPTER = TypeAdapter(ListJobsResponse)
+
+
 def iso_or_none(value: datetime | None) -> str | None:
     return value.isoformat() if value else None
 
@@ -1,34 +1,63 @@
 from __future__ import annotations
 
-import json
+import os
 import re
+import string
+import threading
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 
 from tracr.core.config import Settings
+from tracr.core.jsonio import dumps_bytes, loads
 from tracr.core.provider_presets import model_slug
 
 
+_SLUG_INVALID_RE = re.compile(r"[^a-zA-Z0-9._-]+")
+_SLUG_DASHES_RE = re.compile(r"-{2,}")
+_SLUG_SAFE_CHARS_DELETE = str.maketrans("", "", string.ascii_letters + string.digits + "._-")
+JOB_ID_TIMESTAMP_FORMAT = "%Y%m%d-%H%M%S"
+# While a PDF is in flight its pages are appended to PDF_PAGES_FILENAME and the small
+# PDF_SUMMARY_FILENAME is rewritten; pdf_metadata.json gets the full view once the PDF finishes.
+PDF_SUMMARY_FILENAME = "pdf_summary.json"
+PDF_PAGES_FILENAME = "pages.ndjson"
+
+
 def _slug(value: str) -> str:
-    cleaned = re.sub(r"[^a-zA-Z0-9._-]+", "-", value.strip())
+    cleaned = value.strip()
+    # Fast path: already-safe ASCII names (the common case for PDF stems) skip the regex pass.
+    if not (cleaned.isascii() and not cleaned.translate(_SLUG_SAFE_CHARS_DELETE)):
+        cleaned = _SLUG_INVALID_RE.sub("-", cleaned)
     cleaned = cleaned.strip("-")
-    cleaned = re.sub(r"-+", "-", cleaned)
+    if "--" in cleaned:
+        cleaned = _SLUG_DASHES_RE.sub("-", cleaned)
     return cleaned or "job"
 
 
 def build_job_id(title: str | None, input_path: str) -> str:
-    stamp = datetime.now(UTC).strftime("%Y%m%d-%H%M%S")
-    if title and title.strip():
-        base = _slug(title)
-    else:
-        base = _slug(Path(input_path).stem)
+    base = _slug(title) if title and title.strip() else _slug(Path(input_path).stem)
+    stamp = datetime.now(UTC).strftime(JOB_ID_TIMESTAMP_FORMAT)
     return f"{base}-{stamp}"
 
 
-def write_json(path: Path, payload: dict) -> None:
+def atomic_write_bytes(path: Path, data: bytes, *, fsync: bool = False) -> None:
+    # Readers see either the old file or the new one, never a truncated write.
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+    tmp_path = path.with_name(f"{path.name}.tmp.{os.getpid()}.{threading.get_ident()}")
+    try:
+        with open(tmp_path, "wb") as handle:
+            handle.write(data)
+            if fsync:
+                handle.flush()
+                os.fsync(handle.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def write_json(path: Path, payload: dict) -> None:
+    atomic_write_bytes(path, dumps_bytes(payload, pretty=True))
 
 
 @dataclass
@@ -45,17 +74,28 @@ class PDFPaths:
     pdf_slug: str
     pdf_dir: Path
     pdf_metadata_path: Path
+    pdf_summary_path: Path
+    pdf_pages_path: Path
 
 
 class OutputLayout:
     def __init__(self, settings: Settings):
         self.settings = settings
+        # Joins stay on plain strings; Path objects are only built for returned values.
+        self._root = str(settings.outputs_path)
+        # run_dir -> names present in it, and run_dir -> last dedup index per PDF slug.
+        self._run_dir_names: dict[str, set[str]] = {}
+        self._slug_counters: dict[str, dict[str, int]] = {}
+        self._slug_lock = threading.Lock()
+
+    def _job_dir_str(self, job_id: str) -> str:
+        return os.path.join(self._root, job_id)
 
     def job_dir(self, job_id: str) -> Path:
-        return self.settings.outputs_path / job_id
+        return Path(self._job_dir_str(job_id))
 
     def job_metadata_path(self, job_id: str) -> Path:
-        return self.job_dir(job_id) / "job_metadata.json"
+        return Path(os.path.join(self._root, job_id, "job_metadata.json"))
 
     def ensure_job(self, job_id: str, payload: dict) -> Path:
         job_dir = self.job_dir(job_id)
@@ -63,7 +103,7 @@ class OutputLayout:
 
         metadata_path = self.job_metadata_path(job_id)
         if metadata_path.exists():
-            existing = json.loads(metadata_path.read_text(encoding="utf-8"))
+            existing = loads(metadata_path.read_bytes())
             existing.update(payload)
             payload = existing
         write_json(metadata_path, payload)
@@ -71,12 +111,12 @@ class OutputLayout:
 
     def ensure_model(self, job_id: str, model_name: str, payload: dict) -> Path:
         slug = model_slug(model_name)
-        model_dir = self.job_dir(job_id) / slug
-        model_dir.mkdir(parents=True, exist_ok=True)
-        metadata_path = model_dir / "model_metadata.json"
+        model_dir = os.path.join(self._job_dir_str(job_id), slug)
+        os.makedirs(model_dir, exist_ok=True)
+        metadata_path = Path(os.path.join(model_dir, "model_metadata.json"))
 
         if metadata_path.exists():
-            existing = json.loads(metadata_path.read_text(encoding="utf-8"))
+            existing = loads(metadata_path.read_bytes())
             existing.update(payload)
             payload = existing
 
@@ -85,36 +125,61 @@ class OutputLayout:
 
     def prepare_run(self, job_id: str, model_name: str, payload: dict) -> RunPaths:
         slug = model_slug(model_name)
-        model_dir = self.job_dir(job_id) / slug
-        model_dir.mkdir(parents=True, exist_ok=True)
+        model_dir = os.path.join(self._job_dir_str(job_id), slug)
+        os.makedirs(model_dir, exist_ok=True)
 
-        run_number = self.next_run_number(model_dir)
-        run_dir = model_dir / self.run_dir_name(run_number)
-        run_dir.mkdir(parents=True, exist_ok=True)
+        run_number = self.next_run_number(Path(model_dir))
+        run_dir = os.path.join(model_dir, self.run_dir_name(run_number))
+        os.makedirs(run_dir, exist_ok=True)
 
-        run_metadata_path = run_dir / "run_metadata.json"
+        run_metadata_path = Path(os.path.join(run_dir, "run_metadata.json"))
         write_json(run_metadata_path, payload)
+        with self._slug_lock:
+            self._run_dir_names[run_dir] = {"run_metadata.json"}
+            self._slug_counters[run_dir] = {}
 
         return RunPaths(
             model_slug=slug,
             run_number=run_number,
-            model_dir=model_dir,
-            run_dir=run_dir,
+            model_dir=Path(model_dir),
+            run_dir=Path(run_dir),
             run_metadata_path=run_metadata_path,
         )
 
+    def forget_run(self, run_dir: Path) -> None:
+        # Called when a run finishes; a later prepare_pdf for it re-seeds from disk.
+        run_dir_str = str(run_dir)
+        with self._slug_lock:
+            self._run_dir_names.pop(run_dir_str, None)
+            self._slug_counters.pop(run_dir_str, None)
+
     def prepare_pdf(self, run_dir: Path, source_pdf: Path, page_count: int) -> PDFPaths:
         pdf_slug = _slug(source_pdf.stem)
-        candidate = pdf_slug
-        index = 1
-        while (run_dir / candidate).exists():
-            index += 1
-            candidate = f"{pdf_slug}-{index}"
-
-        pdf_dir = run_dir / candidate
-        pdf_dir.mkdir(parents=True, exist_ok=True)
-
-        metadata_path = pdf_dir / "pdf_metadata.json"
+        run_dir_str = str(run_dir)
+        with self._slug_lock:
+            used = self._run_dir_names.get(run_dir_str)
+            if used is None:
+                # First use of this run dir in this process (e.g. after a restart): seed from disk once.
+                try:
+                    with os.scandir(run_dir_str) as entries:
+                        used = {entry.name for entry in entries}
+                except FileNotFoundError:
+                    used = set()
+                self._run_dir_names[run_dir_str] = used
+            counters = self._slug_counters.setdefault(run_dir_str, {})
+
+            index = counters.get(pdf_slug, 0) + 1
+            candidate = pdf_slug if index == 1 else f"{pdf_slug}-{index}"
+            while candidate in used:
+                index += 1
+                candidate = f"{pdf_slug}-{index}"
+            counters[pdf_slug] = index
+            used.add(candidate)
+
+        pdf_dir = os.path.join(run_dir_str, candidate)
+        os.makedirs(pdf_dir, exist_ok=True)
+
+        metadata_path = Path(os.path.join(pdf_dir, "pdf_metadata.json"))
         write_json(
             metadata_path,
             {
@@ -125,12 +190,19 @@ class OutputLayout:
             },
         )
 
-        return PDFPaths(pdf_slug=candidate, pdf_dir=pdf_dir, pdf_metadata_path=metadata_path)
+        return PDFPaths(
+            pdf_slug=candidate,
+            pdf_dir=Path(pdf_dir),
+            pdf_metadata_path=metadata_path,
+            pdf_summary_path=Path(os.path.join(pdf_dir, PDF_SUMMARY_FILENAME)),
+            pdf_pages_path=Path(os.path.join(pdf_dir, PDF_PAGES_FILENAME)),
+        )
 
     def write_page_markdown(self, pdf_dir: Path, page_index: int, markdown_text: str) -> Path:
-        page_path = pdf_dir / f"{page_index}.md"
-        page_path.write_text(markdown_text, encoding="utf-8")
-        return page_path
+        page_path = os.path.join(str(pdf_dir), f"{page_index}.md")
+        with open(page_path, "w", encoding="utf-8") as handle:
+            handle.write(markdown_text)
+        return Path(page_path)
 
     @staticmethod
     def run_dir_name(run_number: int) -> str:
@@ -147,12 +219,13 @@ class OutputLayout:
 
     @classmethod
     def next_run_number(cls, model_dir: Path) -> int:
-        run_numbers: list[int] = []
-        if model_dir.exists():
-            for child in model_dir.iterdir():
-                if not child.is_dir():
-                    continue
-                run_number = cls.parse_run_number(child.name)
-                if run_number is not None:
-                    run_numbers.append(run_number)
-        return (max(run_numbers) + 1) if run_numbers else 1
+        highest = 0
+        try:
+            with os.scandir(model_dir) as entries:
+                for entry in entries:
+                    run_number = cls.parse_run_number(entry.name)
+                    if run_number is not None and run_number > highest and entry.is_dir():
+                        highest = run_number
+        except FileNotFoundError:
+            pass
+        return highest + 1
@@ -1,19 +1,54 @@
 from __future__ import annotations
 
+import atexit
+import concurrent.futures
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict, deque
+from collections.abc import Iterator
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 from io import BytesIO
 from pathlib import Path
+from typing import Literal
 
 import pypdfium2 as pdfium
 
 try:
-    import PIL.Image  # noqa: F401
+    import PIL.Image
 
     PIL_AVAILABLE = True
 except ModuleNotFoundError:
     PIL_AVAILABLE = False
 
 
+# Rasterization and image encoding are CPU-bound, so pages render in worker processes. Each
+# worker opens its own PdfDocument; pdfium handles must not cross process boundaries.
+PDF_RENDER_WORKERS = min(os.cpu_count() or 1, 8)
+PDF_RENDER_PREFETCH_PER_WORKER = 2
+
+PageImageFormat = Literal["png", "jpeg", "webp"]
+# Pages sent to OCR models default to JPEG: a fraction of the PNG size and much cheaper to encode.
+PDF_PAGE_IMAGE_FORMAT: PageImageFormat = "jpeg"
+PAGE_IMAGE_QUALITY = 85
+
+_RENDER_POOL: concurrent.futures.ProcessPoolExecutor | None = None
+_RENDER_POOL_LOCK = threading.Lock()
+
+# Single-page renders (viewer requests, pool tasks) reuse open documents instead of re-parsing
+# the xref and page tree per page. pdfium is not thread-safe, so renders from the cache are
+# serialized on the lock.
+OPEN_PDF_CACHE_SIZE = 16
+_OPEN_PDFS: OrderedDict[str, tuple[tuple[int, int], pdfium.PdfDocument]] = OrderedDict()
+_OPEN_PDFS_LOCK = threading.Lock()
+
+# (path, st_mtime_ns, st_size) -> page count; a rewritten file gets a new key.
+PAGE_COUNT_CACHE_SIZE = 4096
+_PAGE_COUNTS: dict[tuple[str, int, int], int] = {}
+_PAGE_COUNTS_LOCK = threading.Lock()
+
+
 @dataclass
 class PDFDescriptor:
     path: Path
@@ -27,43 +62,194 @@ def _ensure_pillow_available() -> None:
         )
 
 
-def get_page_count(pdf_path: Path) -> int:
-    document = pdfium.PdfDocument(str(pdf_path))
+def _count_pages(pdf_path: str) -> int:
+    document = pdfium.PdfDocument(pdf_path)
     try:
         return len(document)
     finally:
         document.close()
 
 
+def _page_count_key(pdf_path: Path) -> tuple[str, int, int]:
+    path_str = str(pdf_path)
+    stat = os.stat(path_str)
+    return path_str, stat.st_mtime_ns, stat.st_size
+
+
+def _remember_page_count(key: tuple[str, int, int], page_count: int) -> None:
+    with _PAGE_COUNTS_LOCK:
+        _PAGE_COUNTS[key] = page_count
+        while len(_PAGE_COUNTS) > PAGE_COUNT_CACHE_SIZE:
+            del _PAGE_COUNTS[next(iter(_PAGE_COUNTS))]
+
+
+def get_page_count(pdf_path: Path) -> int:
+    key = _page_count_key(pdf_path)
+    cached = _PAGE_COUNTS.get(key)
+    if cached is not None:
+        return cached
+    page_count = _count_pages(key[0])
+    _remember_page_count(key, page_count)
+    return page_count
+
+
+def _render_pool() -> concurrent.futures.ProcessPoolExecutor | None:
+    global _RENDER_POOL
+    if PDF_RENDER_WORKERS <= 1:
+        return None
+    with _RENDER_POOL_LOCK:
+        if _RENDER_POOL is None:
+            try:
+                # spawn, not fork: the job manager forks from a process full of threads.
+                _RENDER_POOL = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=PDF_RENDER_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            except Exception:  # noqa: BLE001
+                return None
+        return _RENDER_POOL
+
+
+def _discard_render_pool(pool: concurrent.futures.ProcessPoolExecutor) -> None:
+    global _RENDER_POOL
+    with _RENDER_POOL_LOCK:
+        if _RENDER_POOL is pool:
+            _RENDER_POOL = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
 def describe_pdfs(paths: list[Path]) -> list[PDFDescriptor]:
+    keys = [_page_count_key(path) for path in paths]
+    missing = list(dict.fromkeys(key for key in keys if key not in _PAGE_COUNTS))
+    pool = _render_pool() if len(missing) > 1 else None
+    if pool is not None:
+        try:
+            counted = pool.map(_count_pages, [key[0] for key in missing], chunksize=4)
+            for key, page_count in zip(missing, counted):
+                _remember_page_count(key, page_count)
+        except BrokenProcessPool:
+            _discard_render_pool(pool)
+
     descriptors: list[PDFDescriptor] = []
-    for path in paths:
-        descriptors.append(PDFDescriptor(path=path, page_count=get_page_count(path)))
+    for path, key in zip(paths, keys):
+        page_count = _PAGE_COUNTS.get(key)
+        if page_count is None:
+            page_count = _count_pages(key[0])
+            _remember_page_count(key, page_count)
+        descriptors.append(PDFDescriptor(path=path, page_count=page_count))
     return descriptors
 
 
-def render_pdf_page_png(pdf_path: Path, page_index: int, dpi: int = 180) -> bytes:
+def _render_page_pil(document: pdfium.PdfDocument, page_index: int, dpi: int) -> PIL.Image.Image:
+    page = document[page_index]
+    try:
+        # rev_byteorder makes pdfium emit RGB, so to_pil() skips the BGR -> RGB unpack.
+        return page.render(scale=dpi / 72.0, rev_byteorder=True).to_pil()
+    finally:
+        page.close()
+
+
+def _render_page_image(
+    document: pdfium.PdfDocument, page_index: int, dpi: int, image_format: PageImageFormat
+) -> bytes:
+    return _encode_page_image(_render_page_pil(document, page_index, dpi), image_format)
+
+
+def _encode_page_image(pil_image: PIL.Image.Image, image_format: PageImageFormat) -> bytes:
+    buffer = BytesIO()
+    if image_format == "png":
+        pil_image.save(buffer, format="PNG")
+    else:
+        if pil_image.mode != "RGB":
+            pil_image = pil_image.convert("RGB")
+        pil_image.save(buffer, format=image_format.upper(), quality=PAGE_IMAGE_QUALITY)
+    return buffer.getvalue()
+
+
+def _cached_document(path_str: str) -> pdfium.PdfDocument:
+    # Caller holds _OPEN_PDFS_LOCK.
+    stat = os.stat(path_str)
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _OPEN_PDFS.get(path_str)
+    if cached is not None:
+        if cached[0] == key:
+            _OPEN_PDFS.move_to_end(path_str)
+            return cached[1]
+        del _OPEN_PDFS[path_str]
+        cached[1].close()
+
+    document = pdfium.PdfDocument(path_str)
+    _OPEN_PDFS[path_str] = (key, document)
+    while len(_OPEN_PDFS) > OPEN_PDF_CACHE_SIZE:
+        _, (_, evicted) = _OPEN_PDFS.popitem(last=False)
+        evicted.close()
+    return document
+
+
+def _close_cached_documents() -> None:
+    with _OPEN_PDFS_LOCK:
+        for _, document in _OPEN_PDFS.values():
+            document.close()
+        _OPEN_PDFS.clear()
+
+
+atexit.register(_close_cached_documents)
+
+
+def render_pdf_page(
+    pdf_path: Path, page_index: int, dpi: int = 180, image_format: PageImageFormat = "png"
+) -> bytes:
     _ensure_pillow_available()
+    # Only the pdfium calls touch the shared document; the encode runs outside the lock.
+    with _OPEN_PDFS_LOCK:
+        pil_image = _render_page_pil(_cached_document(str(pdf_path)), page_index, dpi)
+    return _encode_page_image(pil_image, image_format)
+
+
+def render_pdf_page_png(pdf_path: Path, page_index: int, dpi: int = 180) -> bytes:
+    return render_pdf_page(pdf_path, page_index, dpi, "png")
+
+
+def _iter_rendered_pages_serial(
+    pdf_path: Path, dpi: int, image_format: PageImageFormat, start_index: int = 0
+) -> Iterator[tuple[int, bytes]]:
     document = pdfium.PdfDocument(str(pdf_path))
     try:
-        page = document[page_index]
-        pil_image = page.render(scale=dpi / 72.0).to_pil()
-        buffer = BytesIO()
-        pil_image.save(buffer, format="PNG")
-        return buffer.getvalue()
+        for index in range(start_index, len(document)):
+            yield index + 1, _render_page_image(document, index, dpi, image_format)
     finally:
         document.close()
 
 
-def iter_rendered_pages(pdf_path: Path, dpi: int = 180):
+def iter_rendered_pages(
+    pdf_path: Path, dpi: int = 180, image_format: PageImageFormat = PDF_PAGE_IMAGE_FORMAT
+) -> Iterator[tuple[int, bytes]]:
     _ensure_pillow_available()
-    document = pdfium.PdfDocument(str(pdf_path))
+    page_count = get_page_count(pdf_path)
+    pool = _render_pool() if page_count > 1 else None
+    if pool is None:
+        yield from _iter_rendered_pages_serial(pdf_path, dpi, image_format)
+        return
+
+    # Keep a bounded window of pages in flight and yield them in page order; the consumer pulls
+    # lazily, so rendering all pages up front would hold every image in memory.
+    window = PDF_RENDER_WORKERS * PDF_RENDER_PREFETCH_PER_WORKER
+    pending: deque[concurrent.futures.Future[bytes]] = deque()
+    next_index = 0
     try:
-        for index in range(len(document)):
-            page = document[index]
-            pil_image = page.render(scale=dpi / 72.0).to_pil()
-            buffer = BytesIO()
-            pil_image.save(buffer, format="PNG")
-            yield index + 1, buffer.getvalue()
+        while next_index < page_count or pending:
+            while next_index < page_count and len(pending) < window:
+                pending.append(pool.submit(render_pdf_page, pdf_path, next_index, dpi, image_format))
+                next_index += 1
+            yielded_index = next_index - len(pending)
+            try:
+                image_bytes = pending.popleft().result()
+            except BrokenProcessPool:
+                _discard_render_pool(pool)
+                pending.clear()
+                yield from _iter_rendered_pages_serial(pdf_path, dpi, image_format, start_index=yielded_index)
+                return
+            yield yielded_index + 1, image_bytes
     finally:
-        document.close()
+        for future in pending:
+            future.cancel()
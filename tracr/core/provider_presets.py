@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 
 
+_DASH_RUN_RE = re.compile(r"-{2,}")
+
+
 @dataclass(frozen=True)
 class ProviderPreset:
     key: str
@@ -53,8 +57,7 @@ DEFAULT_LOCAL_MODELS: tuple[str, ...] = (
 
 
 def model_slug(model_name: str) -> str:
-    value = model_name.strip().replace("/", "-")
-    value = value.replace(" ", "-")
-    while "--" in value:
-        value = value.replace("--", "-")
+    value = model_name.strip().replace("/", "-").replace(" ", "-")
+    if "--" in value:
+        value = _DASH_RUN_RE.sub("-", value)
     return value
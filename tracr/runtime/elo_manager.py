@@ -1,129 +1,231 @@
 from __future__ import annotations
 
-import json
+import os
+import threading
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
+
+import orjson
 
 from tracr.core.config import Settings
-from tracr.core.output_layout import write_json
+from tracr.core.jsonio import dumps_bytes, loads
+from tracr.core.output_layout import atomic_write_bytes
 
 
 DEFAULT_RATING = 1000.0
 DEFAULT_K_FACTOR = 24.0
+VOTES_BUFFER_BYTES = 64 * 1024
+_RATING_ENTRY_KEYS = frozenset({"model_label", "rating", "wins", "losses", "ties", "comparisons"})
+
+
+@dataclass(slots=True)
+class ModelRating:
+    model_slug: str
+    model_label: str
+    rating: float = DEFAULT_RATING
+    wins: int = 0
+    losses: int = 0
+    ties: int = 0
+    comparisons: int = 0
+
+    @classmethod
+    def from_entry(cls, model_slug: str, entry: dict[str, Any]) -> ModelRating:
+        return cls(
+            model_slug=model_slug,
+            model_label=str(entry.get("model_label") or ""),
+            rating=float(entry.get("rating", DEFAULT_RATING)),
+            wins=int(entry.get("wins", 0)),
+            losses=int(entry.get("losses", 0)),
+            ties=int(entry.get("ties", 0)),
+            comparisons=int(entry.get("comparisons", 0)),
+        )
+
+    def to_entry(self) -> dict[str, Any]:
+        return {
+            "model_slug": self.model_slug,
+            "model_label": self.model_label,
+            "rating": self.rating,
+            "wins": self.wins,
+            "losses": self.losses,
+            "ties": self.ties,
+            "comparisons": self.comparisons,
+        }
+
+
+@dataclass(slots=True)
+class _RatingsState:
+    k_factor: float = DEFAULT_K_FACTOR
+    updated_at: str | None = None
+    models: dict[str, ModelRating] = field(default_factory=dict)
+
+    def copy(self) -> _RatingsState:
+        return _RatingsState(
+            k_factor=self.k_factor,
+            updated_at=self.updated_at,
+            models={slug: replace(rating) for slug, rating in self.models.items()},
+        )
+
+    def to_payload(self, job_id: str) -> dict[str, Any]:
+        return {
+            "job_id": job_id,
+            "k_factor": self.k_factor,
+            "updated_at": self.updated_at,
+            "models": {slug: rating.to_entry() for slug, rating in self.models.items()},
+        }
 
 
 class EloManager:
     def __init__(self, settings: Settings):
         self.settings = settings
+        self._paths: dict[str, tuple[Path, Path, Path]] = {}
+        # job_id -> ((st_mtime_ns, st_size), parsed ratings.json, entries needing a rewrite)
+        self._ratings_cache: dict[str, tuple[tuple[int, int], _RatingsState, bool]] = {}
+        # Long-lived append handles for votes.jsonl, one per job; closed by close().
+        self._vote_handles: dict[str, BinaryIO] = {}
+        self._votes_lock = threading.Lock()
+
+    def _job_paths(self, job_id: str) -> tuple[Path, Path, Path]:
+        cached = self._paths.get(job_id)
+        if cached is None:
+            elo_dir = self.settings.outputs_path / job_id / "elo"
+            cached = (elo_dir, elo_dir / "ratings.json", elo_dir / "votes.jsonl")
+            self._paths[job_id] = cached
+        return cached
 
     def elo_dir(self, job_id: str) -> Path:
-        return self.settings.outputs_path / job_id / "elo"
+        return self._job_paths(job_id)[0]
 
     def ratings_path(self, job_id: str) -> Path:
-        return self.elo_dir(job_id) / "ratings.json"
+        return self._job_paths(job_id)[1]
 
     def votes_path(self, job_id: str) -> Path:
-        return self.elo_dir(job_id) / "votes.jsonl"
-
-    @staticmethod
-    def _new_model_entry(model_slug: str, model_label: str) -> dict[str, Any]:
-        return {
-            "model_slug": model_slug,
-            "model_label": model_label,
-            "rating": DEFAULT_RATING,
-            "wins": 0,
-            "losses": 0,
-            "ties": 0,
-            "comparisons": 0,
-        }
+        return self._job_paths(job_id)[2]
 
     @staticmethod
     def _expected_score(ra: float, rb: float) -> float:
         return 1.0 / (1.0 + 10.0 ** ((rb - ra) / 400.0))
 
-    def _read_ratings_payload(self, job_id: str) -> dict[str, Any]:
+    @staticmethod
+    def _parse_ratings_payload(payload: dict[str, Any]) -> tuple[_RatingsState, bool]:
+        state = _RatingsState(
+            k_factor=float(payload.get("k_factor", DEFAULT_K_FACTOR)),
+            updated_at=payload.get("updated_at"),
+        )
+        incomplete = False
+        models = payload.get("models")
+        if isinstance(models, dict):
+            for model_slug, entry in models.items():
+                if not isinstance(entry, dict):
+                    incomplete = True
+                    continue
+                if not _RATING_ENTRY_KEYS <= entry.keys() or not entry.get("model_label"):
+                    incomplete = True
+                state.models[model_slug] = ModelRating.from_entry(model_slug, entry)
+        return state, incomplete
+
+    def _read_ratings_state(self, job_id: str) -> tuple[_RatingsState | None, bool]:
         path = self.ratings_path(job_id)
-        if not path.exists():
-            return {}
         try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
-            if isinstance(payload, dict):
-                return payload
+            stat = os.stat(path)
+        except OSError:
+            self._ratings_cache.pop(job_id, None)
+            return None, True
+
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._ratings_cache.get(job_id)
+        if cached is not None and cached[0] == key:
+            return cached[1].copy(), cached[2]
+
+        try:
+            payload = loads(path.read_bytes())
         except Exception:  # noqa: BLE001
-            pass
-        return {}
+            return None, False
+        if not isinstance(payload, dict):
+            return None, False
+        state, incomplete = self._parse_ratings_payload(payload)
+        self._ratings_cache[job_id] = (key, state, incomplete)
+        return state.copy(), incomplete
 
-    def _write_ratings_payload(self, job_id: str, payload: dict[str, Any]) -> None:
-        payload["updated_at"] = datetime.now(UTC).isoformat()
-        write_json(self.ratings_path(job_id), payload)
+    def _write_ratings_state(self, job_id: str, state: _RatingsState) -> dict[str, Any]:
+        state.updated_at = datetime.now(UTC).isoformat()
+        payload = state.to_payload(job_id)
+        path = self.ratings_path(job_id)
+        atomic_write_bytes(path, dumps_bytes(payload, pretty=True))
+        stat = os.stat(path)
+        self._ratings_cache[job_id] = ((stat.st_mtime_ns, stat.st_size), state.copy(), False)
+        return payload
 
-    def load_ratings(self, job_id: str, model_labels: dict[str, str] | None = None) -> dict[str, Any]:
-        model_labels = model_labels or {}
-        existing = self._read_ratings_payload(job_id)
-        models = existing.get("models")
-        if not isinstance(models, dict):
-            models = {}
+    def _prepare_ratings(self, job_id: str, model_labels: dict[str, str]) -> tuple[_RatingsState, bool]:
+        state, needs_write = self._read_ratings_state(job_id)
+        if state is None:
+            state = _RatingsState()
 
-        changed = False
         for model_slug, model_label in model_labels.items():
-            entry = models.get(model_slug)
-            if not isinstance(entry, dict):
-                models[model_slug] = self._new_model_entry(model_slug, model_label)
-                changed = True
-                continue
-
-            if not entry.get("model_label"):
-                entry["model_label"] = model_label
-                changed = True
-
-            for key, default in {
-                "rating": DEFAULT_RATING,
-                "wins": 0,
-                "losses": 0,
-                "ties": 0,
-                "comparisons": 0,
-            }.items():
-                if key not in entry:
-                    entry[key] = default
-                    changed = True
-
-        payload = {
-            "job_id": job_id,
-            "k_factor": float(existing.get("k_factor", DEFAULT_K_FACTOR)),
-            "updated_at": existing.get("updated_at"),
-            "models": models,
-        }
-        if changed or not self.ratings_path(job_id).exists():
-            self._write_ratings_payload(job_id, payload)
-        return payload
+            rating = state.models.get(model_slug)
+            if rating is None:
+                state.models[model_slug] = ModelRating(model_slug=model_slug, model_label=model_label)
+                needs_write = True
+            elif not rating.model_label:
+                rating.model_label = model_label
+                needs_write = True
+        return state, needs_write
 
-    def ratings_table(self, job_id: str, model_labels: dict[str, str] | None = None) -> list[dict[str, Any]]:
-        payload = self.load_ratings(job_id, model_labels=model_labels)
-        models = payload.get("models", {})
-        rows: list[dict[str, Any]] = []
-        for model_slug, entry in models.items():
-            if not isinstance(entry, dict):
-                continue
-            rows.append(
-                {
-                    "model_slug": model_slug,
-                    "model_label": str(entry.get("model_label") or model_slug),
-                    "rating": float(entry.get("rating", DEFAULT_RATING)),
-                    "wins": int(entry.get("wins", 0)),
-                    "losses": int(entry.get("losses", 0)),
-                    "ties": int(entry.get("ties", 0)),
-                    "comparisons": int(entry.get("comparisons", 0)),
-                }
-            )
+    def load_ratings(self, job_id: str, model_labels: dict[str, str] | None = None) -> dict[str, Any]:
+        state, needs_write = self._prepare_ratings(job_id, model_labels or {})
+        if needs_write:
+            return self._write_ratings_state(job_id, state)
+        return state.to_payload(job_id)
+
+    @staticmethod
+    def _ratings_rows(state: _RatingsState) -> list[dict[str, Any]]:
+        rows = [
+            {
+                "model_slug": model_slug,
+                "model_label": rating.model_label or model_slug,
+                "rating": rating.rating,
+                "wins": rating.wins,
+                "losses": rating.losses,
+                "ties": rating.ties,
+                "comparisons": rating.comparisons,
+            }
+            for model_slug, rating in state.models.items()
+        ]
         rows.sort(key=lambda row: row["rating"], reverse=True)
         return rows
 
+    def ratings_table(self, job_id: str, model_labels: dict[str, str] | None = None) -> list[dict[str, Any]]:
+        state, needs_write = self._prepare_ratings(job_id, model_labels or {})
+        if needs_write:
+            self._write_ratings_state(job_id, state)
+        return self._ratings_rows(state)
+
     def _append_vote(self, job_id: str, payload: dict[str, Any]) -> None:
-        votes_path = self.votes_path(job_id)
-        votes_path.parent.mkdir(parents=True, exist_ok=True)
-        with votes_path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(payload, sort_keys=True) + "\n")
+        line = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS) + b"\n"
+        with self._votes_lock:
+            handle = self._vote_handles.get(job_id)
+            if handle is None:
+                elo_dir, _, votes_path = self._job_paths(job_id)
+                elo_dir.mkdir(parents=True, exist_ok=True)
+                handle = open(votes_path, "ab", buffering=VOTES_BUFFER_BYTES)  # noqa: SIM115
+                self._vote_handles[job_id] = handle
+            handle.write(line)
+            # Flush so readers of votes.jsonl see the vote; fsync is deferred to close().
+            handle.flush()
+
+    def close(self) -> None:
+        with self._votes_lock:
+            handles = list(self._vote_handles.values())
+            self._vote_handles.clear()
+        for handle in handles:
+            try:
+                handle.flush()
+                os.fsync(handle.fileno())
+            except OSError:
+                pass
+            finally:
+                handle.close()
 
     def record_vote(
         self,
@@ -136,26 +238,24 @@ class EloManager:
         choice: str,
         context: dict[str, Any],
     ) -> dict[str, Any]:
-        payload = self.load_ratings(
+        # One read, at most one write; the returned table is built from the in-memory state.
+        state, needs_write = self._prepare_ratings(
             job_id,
-            model_labels={
+            {
                 left_model_slug: left_model_label,
                 right_model_slug: right_model_label,
             },
         )
-        models = payload["models"]
-        left = models[left_model_slug]
-        right = models[right_model_slug]
-        k_factor = float(payload.get("k_factor", DEFAULT_K_FACTOR))
-
-        before = {
-            "left_rating": float(left.get("rating", DEFAULT_RATING)),
-            "right_rating": float(right.get("rating", DEFAULT_RATING)),
-        }
+        left = state.models[left_model_slug]
+        right = state.models[right_model_slug]
+
+        before = {"left_rating": left.rating, "right_rating": right.rating}
 
         timestamp = datetime.now(UTC).isoformat()
         normalized_choice = str(choice).strip().lower()
         if normalized_choice == "skip":
+            if needs_write:
+                self._write_ratings_state(job_id, state)
             self._append_vote(
                 job_id,
                 {
@@ -172,41 +272,38 @@ class EloManager:
             return {
                 "job_id": job_id,
                 "choice": normalized_choice,
-                "ratings": self.ratings_table(job_id),
+                "ratings": self._ratings_rows(state),
             }
 
         if normalized_choice == "left_better":
             score_left, score_right = 1.0, 0.0
-            left["wins"] = int(left.get("wins", 0)) + 1
-            right["losses"] = int(right.get("losses", 0)) + 1
+            left.wins += 1
+            right.losses += 1
         elif normalized_choice == "right_better":
             score_left, score_right = 0.0, 1.0
-            right["wins"] = int(right.get("wins", 0)) + 1
-            left["losses"] = int(left.get("losses", 0)) + 1
+            right.wins += 1
+            left.losses += 1
         elif normalized_choice in {"both_good", "both_bad"}:
             score_left = score_right = 0.5
-            left["ties"] = int(left.get("ties", 0)) + 1
-            right["ties"] = int(right.get("ties", 0)) + 1
+            left.ties += 1
+            right.ties += 1
         else:
             raise ValueError(
                 "Invalid choice. Expected one of: left_better, right_better, both_good, both_bad, skip."
             )
 
-        ra = float(left.get("rating", DEFAULT_RATING))
-        rb = float(right.get("rating", DEFAULT_RATING))
+        ra = left.rating
+        rb = right.rating
         ea = self._expected_score(ra, rb)
         eb = self._expected_score(rb, ra)
-        new_ra = ra + k_factor * (score_left - ea)
-        new_rb = rb + k_factor * (score_right - eb)
-
-        left["rating"] = round(new_ra, 4)
-        right["rating"] = round(new_rb, 4)
-        left["comparisons"] = int(left.get("comparisons", 0)) + 1
-        right["comparisons"] = int(right.get("comparisons", 0)) + 1
+        left.rating = round(ra + state.k_factor * (score_left - ea), 4)
+        right.rating = round(rb + state.k_factor * (score_right - eb), 4)
+        left.comparisons += 1
+        right.comparisons += 1
 
-        self._write_ratings_payload(job_id, payload)
+        self._write_ratings_state(job_id, state)
 
-        after = {"left_rating": left["rating"], "right_rating": right["rating"]}
+        after = {"left_rating": left.rating, "right_rating": right.rating}
         self._append_vote(
             job_id,
             {
@@ -224,5 +321,5 @@ class EloManager:
         return {
             "job_id": job_id,
             "choice": normalized_choice,
-            "ratings": self.ratings_table(job_id),
+            "ratings": self._ratings_rows(state),
         }
@@ -1,9 +1,18 @@
 from __future__ import annotations
 
+import atexit
 import os
 import shutil
 import subprocess
+import threading
+import time
 from dataclasses import dataclass
+from typing import Any
+
+try:
+    import pynvml as _pynvml
+except ImportError:  # pragma: no cover - exercised when the local extra is not installed
+    _pynvml = None
 
 
 @dataclass
@@ -22,64 +31,179 @@ def _parse_int(value: str, default: int = 0) -> int:
         return default
 
 
+def _parse_smi_csv(text: str) -> list[GPUStat]:
+    return [
+        GPUStat(_parse_int(index), name.strip(), _parse_int(total), _parse_int(used), _parse_int(util))
+        for parts in (line.split(",") for line in text.splitlines() if line)
+        if len(parts) == 5
+        for index, name, total, used, util in (parts,)
+    ]
+
+
+_SMI_COMMAND = [
+    "nvidia-smi",
+    "--query-gpu=index,name,memory.total,memory.used,utilization.gpu",
+    "--format=csv,noheader,nounits",
+]
+
+# Without NVML, one long-lived `nvidia-smi -l` streams samples instead of a fork/exec per poll.
+_SMI_STREAM: subprocess.Popen[str] | None = None
+_SMI_STREAM_LATEST: list[GPUStat] | None = None
+_SMI_STREAM_FAILED = False
+_SMI_STREAM_LOCK = threading.Lock()
+
+
+def _read_smi_stream(process: subprocess.Popen[str], gpu_count: int) -> None:
+    global _SMI_STREAM, _SMI_STREAM_LATEST, _SMI_STREAM_FAILED
+    published = False
+    sample: list[GPUStat] = []
+    try:
+        for line in process.stdout or ():
+            parsed = _parse_smi_csv(line)
+            if not parsed:
+                continue
+            if sample and parsed[0].index <= sample[-1].index:
+                sample = []
+            sample.append(parsed[0])
+            if len(sample) == gpu_count:
+                _SMI_STREAM_LATEST = sample
+                published = True
+                sample = []
+    except Exception:
+        pass
+    with _SMI_STREAM_LOCK:
+        if _SMI_STREAM is process:
+            _SMI_STREAM = None
+            _SMI_STREAM_LATEST = None
+            # A stream that dies before its first sample would die again; stay on one-shot queries.
+            _SMI_STREAM_FAILED = not published
+
+
+def _stop_smi_stream() -> None:
+    global _SMI_STREAM
+    with _SMI_STREAM_LOCK:
+        process, _SMI_STREAM = _SMI_STREAM, None
+    if process is not None and process.poll() is None:
+        process.terminate()
+
+
+def _start_smi_stream(gpu_count: int) -> None:
+    global _SMI_STREAM, _SMI_STREAM_FAILED
+    with _SMI_STREAM_LOCK:
+        if _SMI_STREAM is not None or _SMI_STREAM_FAILED:
+            return
+        interval = str(max(1, round(_TTL_SECONDS)))
+        try:
+            process = subprocess.Popen(
+                [*_SMI_COMMAND, "-l", interval],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+            )
+        except Exception:
+            _SMI_STREAM_FAILED = True
+            return
+        _SMI_STREAM = process
+    threading.Thread(
+        target=_read_smi_stream,
+        args=(process, gpu_count),
+        name="tracr-nvidia-smi",
+        daemon=True,
+    ).start()
+    atexit.unregister(_stop_smi_stream)
+    atexit.register(_stop_smi_stream)
+
+
 def _query_gpu_stats_nvidia_smi() -> list[GPUStat]:
     if not shutil.which("nvidia-smi"):
         return []
 
-    command = [
-        "nvidia-smi",
-        "--query-gpu=index,name,memory.total,memory.used,utilization.gpu",
-        "--format=csv,noheader,nounits",
-    ]
+    streamed = _SMI_STREAM_LATEST
+    if streamed is not None:
+        return list(streamed)
 
     try:
-        result = subprocess.run(command, capture_output=True, text=True, check=True)
+        result = subprocess.run(_SMI_COMMAND, capture_output=True, text=True, check=True)
     except Exception:
         return []
 
-    stats: list[GPUStat] = []
-    for line in result.stdout.strip().splitlines():
-        parts = [p.strip() for p in line.split(",")]
-        if len(parts) != 5:
-            continue
-        stats.append(
-            GPUStat(
-                index=_parse_int(parts[0]),
-                name=parts[1],
-                memory_total_mb=_parse_int(parts[2]),
-                memory_used_mb=_parse_int(parts[3]),
-                utilization_percent=_parse_int(parts[4]),
-            )
-        )
-
+    stats = _parse_smi_csv(result.stdout)
+    if stats:
+        _start_smi_stream(len(stats))
     return stats
 
 
-def _query_gpu_stats_nvml() -> list[GPUStat]:
+# NVML stays initialized for the process lifetime; shutdown runs at interpreter exit.
+# Device handles and names are static for that lifetime, so they are resolved once.
+_NVML_INITIALIZED = False
+_NVML_LIBRARY_MISSING = False
+_HANDLES: list[Any] = []
+_NAMES: list[str] = []
+
+
+def _decode_nvml_name(name_raw: Any) -> str:
+    if isinstance(name_raw, bytes):
+        return name_raw.decode("utf-8", errors="ignore")
+    return str(name_raw)
+
+
+def _ensure_nvml(pynvml: Any) -> bool:
+    global _NVML_INITIALIZED, _NVML_LIBRARY_MISSING
+    if _NVML_INITIALIZED:
+        return True
+    if pynvml is None or _NVML_LIBRARY_MISSING:
+        return False
+
+    try:
+        pynvml.nvmlInit()
+    except Exception as exc:
+        # libnvidia-ml will not appear mid-process; skip the dlopen attempt on later polls.
+        library_missing = getattr(pynvml, "NVMLError_LibraryNotFound", None)
+        if isinstance(library_missing, type) and isinstance(exc, library_missing):
+            _NVML_LIBRARY_MISSING = True
+        return False
+
     try:
-        import pynvml
+        handles = [pynvml.nvmlDeviceGetHandleByIndex(index) for index in range(int(pynvml.nvmlDeviceGetCount()))]
+        names = [_decode_nvml_name(pynvml.nvmlDeviceGetName(handle)) for handle in handles]
     except Exception:
-        return []
+        try:
+            pynvml.nvmlShutdown()
+        except Exception:
+            pass
+        return False
+
+    _HANDLES[:] = handles
+    _NAMES[:] = names
+    _NVML_INITIALIZED = True
+    atexit.register(_shutdown_nvml, pynvml)
+    return True
+
 
+def _shutdown_nvml(pynvml: Any) -> None:
+    global _NVML_INITIALIZED
+    if not _NVML_INITIALIZED:
+        return
+    _NVML_INITIALIZED = False
+    _HANDLES.clear()
+    _NAMES.clear()
     try:
-        pynvml.nvmlInit()
+        pynvml.nvmlShutdown()
     except Exception:
+        pass
+
+
+def _query_gpu_stats_nvml() -> list[GPUStat]:
+    pynvml = _pynvml
+    if not _ensure_nvml(pynvml):
         return []
 
     stats: list[GPUStat] = []
     try:
-        count = int(pynvml.nvmlDeviceGetCount())
-        for index in range(count):
-            handle = pynvml.nvmlDeviceGetHandleByIndex(index)
-            name_raw = pynvml.nvmlDeviceGetName(handle)
-            if isinstance(name_raw, bytes):
-                name = name_raw.decode("utf-8", errors="ignore")
-            else:
-                name = str(name_raw)
-
+        for index, (handle, name) in enumerate(zip(_HANDLES, _NAMES)):
             memory_info = pynvml.nvmlDeviceGetMemoryInfo(handle)
-            memory_total_mb = int(memory_info.total / (1024 * 1024))
-            memory_used_mb = int(memory_info.used / (1024 * 1024))
+            memory_total_mb = int(memory_info.total) >> 20
+            memory_used_mb = int(memory_info.used) >> 20
 
             utilization_percent = 0
             try:
@@ -98,20 +222,72 @@ def _query_gpu_stats_nvml() -> list[GPUStat]:
             )
     except Exception:
         return []
-    finally:
+
+    return stats
+
+
+def _read_gpu_stats() -> list[GPUStat]:
+    # NVML is an in-process library call; nvidia-smi costs a fork/exec plus its own NVML init per query.
+    stats = _query_gpu_stats_nvml()
+    if stats:
+        return stats
+    return _query_gpu_stats_nvidia_smi()
+
+
+def _poll_interval_seconds() -> float:
+    raw = os.getenv("OCR_GPU_POLL_INTERVAL_SECONDS")
+    if raw:
         try:
-            pynvml.nvmlShutdown()
-        except Exception:
+            return max(0.0, float(raw))
+        except ValueError:
             pass
+    return 2.0
 
+
+# Callers inside one poll interval share the last snapshot instead of re-querying the driver.
+_TTL_SECONDS = _poll_interval_seconds()
+_LAST_SNAPSHOT: tuple[float, list[GPUStat]] | None = None
+_POLLER: threading.Thread | None = None
+_POLLER_LOCK = threading.Lock()
+_REFRESH_LOCK = threading.Lock()
+
+
+def _refresh_snapshot() -> list[GPUStat]:
+    global _LAST_SNAPSHOT
+    stats = _read_gpu_stats()
+    _LAST_SNAPSHOT = (time.monotonic(), stats)
     return stats
 
 
 def query_gpu_stats() -> list[GPUStat]:
-    stats = _query_gpu_stats_nvidia_smi()
-    if stats:
-        return stats
-    return _query_gpu_stats_nvml()
+    snapshot = _LAST_SNAPSHOT
+    if snapshot is not None and time.monotonic() - snapshot[0] < _TTL_SECONDS:
+        return list(snapshot[1])
+    # Concurrent misses wait for one driver query instead of each forking nvidia-smi.
+    with _REFRESH_LOCK:
+        current = _LAST_SNAPSHOT
+        if current is not None and current is not snapshot:
+            return list(current[1])
+        return list(_refresh_snapshot())
+
+
+def _poll_forever() -> None:
+    while True:
+        try:
+            with _REFRESH_LOCK:
+                _refresh_snapshot()
+        except Exception:
+            pass
+        time.sleep(max(_TTL_SECONDS, 0.1))
+
+
+def prewarm_gpu_poller() -> None:
+    global _POLLER
+    with _POLLER_LOCK:
+        if _POLLER is not None and _POLLER.is_alive():
+            return
+        _POLLER = threading.Thread(target=_poll_forever, name="tracr-gpu-poller", daemon=True)
+        _POLLER.start()
 
 
 def detect_gpu_count() -> int:
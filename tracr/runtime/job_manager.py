@@ -2,14 +2,20 @@ from __future__ import annotations
 
 import asyncio
 import concurrent.futures
-import json
+import os
+import shutil
 import threading
+import time
+from collections.abc import Iterator
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
+
 try:
     import fcntl
 except ImportError:  # pragma: no cover - platform dependent
@@ -17,6 +23,7 @@ except ImportError:  # pragma: no cover - platform dependent
 
 from tracr.core.config import REPO_ROOT, Settings
 from tracr.core.input_discovery import expand_pdf_inputs, resolve_input_path
+from tracr.core.jsonio import dumps_bytes, loads
 from tracr.core.models import (
     JobProgress,
     LaunchJobRequest,
@@ -24,13 +31,91 @@ from tracr.core.models import (
     ModelRunProgress,
     RunStatus,
 )
-from tracr.core.output_layout import OutputLayout, RunPaths, build_job_id, write_json
+from tracr.core.output_layout import (
+    PDF_PAGES_FILENAME,
+    PDF_SUMMARY_FILENAME,
+    OutputLayout,
+    PDFPaths,
+    RunPaths,
+    atomic_write_bytes,
+    build_job_id,
+    write_json,
+)
 from tracr.core.pdf_tools import PDFDescriptor, describe_pdfs, iter_rendered_pages
 from tracr.core.provider_presets import PRESET_BY_KEY
 from tracr.runtime.openai_client import OCRPageResult, EndpointAuth, OpenAICompatibleOCRClient
 from tracr.runtime.vllm_manager import ServerHandle, VLLMServerManager
 
 
+METADATA_READ_WORKERS = 8
+RELATIVE_PATH_CACHE_SIZE = 2048
+PAGE_TOKEN_INDEX_CACHE_SIZE = 256
+_RUN_METADATA_RECOMPUTED_FIELDS = frozenset({"statistics", "runtime_seconds", "eta_seconds"})
+# Per-page metadata rewrites are coalesced: flush at most every interval or every N pages.
+METADATA_FLUSH_INTERVAL_SECONDS = 0.25
+METADATA_FLUSH_EVERY_PAGES = 16
+PAGE_RENDERS_DIRNAME = "page_renders"
+# Known provider usage shapes: (required keys, (input key, output key, total key)).
+_USAGE_KEYMAPS: tuple[tuple[frozenset[str], tuple[str, str, str]], ...] = (
+    (frozenset({"prompt_tokens", "completion_tokens", "total_tokens"}), ("prompt_tokens", "completion_tokens", "total_tokens")),
+    (frozenset({"input_tokens", "output_tokens", "total_tokens"}), ("input_tokens", "output_tokens", "total_tokens")),
+)
+
+_ZERO_TOKEN_USAGE: dict[str, int] = {"input_tokens": 0, "output_tokens": 0, "total_tokens": 0}
+_get_input_tokens = itemgetter("input_tokens")
+_get_output_tokens = itemgetter("output_tokens")
+_get_total_tokens = itemgetter("total_tokens")
+
+
+def _write_metadata_json(path: Path, payload: dict[str, Any], *, fsync: bool = False) -> None:
+    atomic_write_bytes(path, dumps_bytes(payload, pretty=True), fsync=fsync)
+
+
+@lru_cache(maxsize=PAGE_TOKEN_INDEX_CACHE_SIZE)
+def _load_page_token_index(metadata_path: str, mtime_ns: int, size: int) -> dict[int, int | None] | None:
+    # mtime_ns/size only key the cache so a rewritten file is parsed again.
+    payload = JobManager._read_json_if_exists(Path(metadata_path))
+    if "pages" not in payload:
+        return None
+    return {
+        page_number: JobManager._page_output_tokens(page_entry)
+        for page_number, page_entry in JobManager._pdf_pages_by_number(payload).items()
+    }
+
+
+def _iso_from_ns(timestamp_ns: int) -> str:
+    # Same output as datetime.now(UTC).isoformat(), including microseconds.
+    seconds, nanos = divmod(timestamp_ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds, UTC).replace(microsecond=nanos // 1000).isoformat()
+
+
+def _read_small(path: str) -> str:
+    # Page markdown is small; skip the io text stack and read it in one syscall.
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        chunks = [os.read(fd, max(size, 1))]
+        while chunks[-1]:
+            chunks.append(os.read(fd, 65536))
+    finally:
+        os.close(fd)
+    text = b"".join(chunks).decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        # EPERM: the process exists but belongs to someone else.
+        return True
+    return True
+
+
 @dataclass
 class _RunContext:
     run_paths: RunPaths
@@ -38,6 +123,39 @@ class _RunContext:
     spec_index: int
 
 
+@dataclass
+class _MetadataDebounce:
+    interval_seconds: float = METADATA_FLUSH_INTERVAL_SECONDS
+    every_pages: int = METADATA_FLUSH_EVERY_PAGES
+    dirty_pages: int = 0
+    last_flush: float = 0.0
+
+    def mark_dirty(self) -> bool:
+        self.dirty_pages += 1
+        now = time.monotonic()
+        if self.dirty_pages >= self.every_pages or now - self.last_flush >= self.interval_seconds:
+            self.dirty_pages = 0
+            self.last_flush = now
+            return True
+        return False
+
+
+@dataclass
+class _PdfRunState:
+    descriptor: PDFDescriptor
+    layout: PDFPaths
+    started_at: datetime
+    totals: dict[str, Any]
+    debounce: _MetadataDebounce
+    pages: list[dict[str, Any]] = field(default_factory=list)
+    submitted_pages: int = 0
+    render_done: bool = False
+
+    @property
+    def settled(self) -> bool:
+        return self.render_done and len(self.pages) == self.submitted_pages
+
+
 @dataclass
 class _PageOCROutcome:
     page_number: int
@@ -48,11 +166,119 @@ class _PageOCROutcome:
     attempts: int
     request_seconds: float | None
     error_text: str | None
-    page_started_at: datetime
-    page_ended_at: datetime
+    # Wall-clock time.time_ns() stamps; formatted to ISO only when the page record is built.
+    page_started_at_ns: int
+    page_ended_at_ns: int
     processing_seconds: float
 
 
+class _SharedPageRenders:
+    # Renders a job's PDFs once and lets every model run read the same pages. Pages are
+    # spilled to disk because runs progress at very different rates (a local run may still
+    # be waiting for GPUs while an API run is finishing).
+    def __init__(
+        self,
+        root: Path,
+        descriptors: list[PDFDescriptor],
+        consumers: list[str],
+        cancel_event: threading.Event,
+    ):
+        self._root = root
+        self._descriptors = descriptors
+        self._cancel_event = cancel_event
+        self._stop = threading.Event()
+        self._condition = threading.Condition()
+        self._rendered: list[list[int]] = [[] for _ in descriptors]
+        self._done = [False] * len(descriptors)
+        self._errors: list[str | None] = [None] * len(descriptors)
+        # consumer -> pages read so far per PDF; only runs still reading hold pages on disk.
+        self._positions: dict[str, list[int]] = {consumer: [0] * len(descriptors) for consumer in consumers}
+        self._dropped = [0] * len(descriptors)
+        self._thread = threading.Thread(target=self._render_all, name=f"page-renders-{root.name}", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        shutil.rmtree(self._root, ignore_errors=True)
+
+    def release(self, consumer: str) -> None:
+        with self._condition:
+            if self._positions.pop(consumer, None) is None:
+                return
+            if not self._positions:
+                self._stop.set()
+            stale = [path for index in range(len(self._descriptors)) for path in self._drop_read_pages(index)]
+        for path in stale:
+            path.unlink(missing_ok=True)
+
+    def _page_path(self, index: int, page_number: int) -> Path:
+        return self._root / str(index) / f"{page_number}.img"
+
+    def _drop_read_pages(self, index: int) -> list[Path]:
+        # Caller holds _condition.
+        rendered = self._rendered[index]
+        if self._positions:
+            read_by_all = min(positions[index] for positions in self._positions.values())
+        else:
+            read_by_all = len(rendered)
+        stale = [self._page_path(index, page_number) for page_number in rendered[self._dropped[index] : read_by_all]]
+        self._dropped[index] = max(self._dropped[index], read_by_all)
+        return stale
+
+    def _render_all(self) -> None:
+        for index, descriptor in enumerate(self._descriptors):
+            rendered = None
+            try:
+                if self._stop.is_set() or self._cancel_event.is_set():
+                    continue
+                (self._root / str(index)).mkdir(parents=True, exist_ok=True)
+                rendered = iter_rendered_pages(descriptor.path)
+                for page_number, image in rendered:
+                    self._page_path(index, page_number).write_bytes(image)
+                    with self._condition:
+                        self._rendered[index].append(page_number)
+                        stale = [] if self._positions else self._drop_read_pages(index)
+                        self._condition.notify_all()
+                    for path in stale:
+                        path.unlink(missing_ok=True)
+                    if self._stop.is_set() or self._cancel_event.is_set():
+                        break
+            except Exception as exc:  # noqa: BLE001
+                self._errors[index] = str(exc) or exc.__class__.__name__
+            finally:
+                if rendered is not None:
+                    rendered.close()
+                with self._condition:
+                    self._done[index] = True
+                    self._condition.notify_all()
+
+    def iter_pages(self, consumer: str, index: int) -> Iterator[tuple[int, bytes]]:
+        position = 0
+        while True:
+            with self._condition:
+                while position >= len(self._rendered[index]) and not self._done[index]:
+                    self._condition.wait()
+                if position >= len(self._rendered[index]):
+                    if self._errors[index] is not None:
+                        raise RuntimeError(self._errors[index])
+                    return
+                page_number = self._rendered[index][position]
+            image = self._page_path(index, page_number).read_bytes()
+            position += 1
+            with self._condition:
+                positions = self._positions.get(consumer)
+                if positions is not None:
+                    positions[index] = position
+                stale = self._drop_read_pages(index)
+            for path in stale:
+                path.unlink(missing_ok=True)
+            yield page_number, image
+
+
 class JobManager:
     def __init__(self, settings: Settings):
         self.settings = settings
@@ -60,12 +286,42 @@ class JobManager:
         self.vllm_manager = VLLMServerManager(settings)
         self._project_root = REPO_ROOT.resolve()
 
-        self._state_lock = threading.RLock()
+        # _registry_lock guards which jobs exist (the dicts below); each job's progress, metrics
+        # and metadata writes go through its own lock so concurrent jobs don't serialize on
+        # each other's page updates. Take the registry lock before a job lock, never after.
+        self._registry_lock = threading.RLock()
+        self._job_locks: dict[str, threading.RLock] = {}
         self._jobs: dict[str, JobProgress] = {}
         self._job_contexts: dict[str, list[_RunContext]] = {}
         self._cancel_events: dict[str, threading.Event] = {}
         self._tasks: dict[str, asyncio.Task[None]] = {}
         self._run_metrics: dict[str, dict[str, Any]] = {}
+        # job_id -> running totals across all of the job's runs, updated alongside _run_metrics.
+        self._job_metrics: dict[str, dict[str, Any]] = {}
+        # job_id -> monotonic time of the last job_metadata.json write.
+        self._job_metadata_written_at: dict[str, float] = {}
+        # (project root, raw path) -> project-relative path; the same paths are relativized on every rewrite.
+        self._relative_path_cache: dict[tuple[Path, str], str] = {}
+        # Shared page renders are spilled per process: `tracr web` and `tracr api` can run
+        # side by side on one state dir, and neither may delete the other's live renders.
+        self._page_renders_root = settings.state_path / PAGE_RENDERS_DIRNAME / str(os.getpid())
+        self._clear_stale_page_renders()
+
+    def _clear_stale_page_renders(self) -> None:
+        # Jobs never survive a restart, so renders left by a dead process (or an earlier
+        # manager in this one) are garbage.
+        try:
+            entries = list(os.scandir(self.settings.state_path / PAGE_RENDERS_DIRNAME))
+        except OSError:
+            return
+        for entry in entries:
+            if entry.name.isdigit() and entry.path != str(self._page_renders_root) and _pid_alive(int(entry.name)):
+                continue
+            shutil.rmtree(entry.path, ignore_errors=True)
+
+    def _job_lock(self, job_id: str) -> threading.RLock:
+        # Unknown jobs fall back to the registry lock so lookups stay consistent with launch/dismiss.
+        return self._job_locks.get(job_id) or self._registry_lock
 
     def _to_project_relative_path(self, value: str | Path | None) -> str | None:
         if value is None:
@@ -75,14 +331,24 @@ class JobManager:
         if not raw:
             return raw
 
+        cache_key = (self._project_root, raw)
+        cached = self._relative_path_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         path = Path(raw).expanduser()
         if not path.is_absolute():
-            return path.as_posix()
+            relative = path.as_posix()
+        else:
+            try:
+                relative = path.resolve().relative_to(self._project_root).as_posix()
+            except Exception:  # noqa: BLE001
+                relative = str(path)
 
-        try:
-            return path.resolve().relative_to(self._project_root).as_posix()
-        except Exception:  # noqa: BLE001
-            return str(path)
+        if len(self._relative_path_cache) >= RELATIVE_PATH_CACHE_SIZE:
+            self._relative_path_cache.clear()
+        self._relative_path_cache[cache_key] = relative
+        return relative
 
     @staticmethod
     def _parse_iso_datetime(value: Any) -> datetime | None:
@@ -177,14 +443,13 @@ class JobManager:
         run_id_to_index: dict[str, int] = {}
 
         def upsert(model_payload: dict[str, Any]) -> None:
-            entry = dict(model_payload)
-            run_id = str(entry.get("run_id") or "").strip()
+            run_id = str(model_payload.get("run_id") or "").strip()
             if run_id and run_id in run_id_to_index:
-                prior = dict(merged[run_id_to_index[run_id]])
-                prior.update(entry)
-                merged[run_id_to_index[run_id]] = prior
+                # Entries in `merged` are already private copies, so update in place.
+                merged[run_id_to_index[run_id]].update(model_payload)
                 return
 
+            entry = dict(model_payload)
             merged.append(entry)
             if run_id:
                 run_id_to_index[run_id] = len(merged) - 1
@@ -321,16 +586,20 @@ class JobManager:
             if isinstance(item, dict)
         ]
 
-        total_pages = sum(self._safe_int(item.get("total_pages")) for item in merged_models if isinstance(item, dict))
-        completed_pages = sum(self._safe_int(item.get("completed_pages")) for item in merged_models if isinstance(item, dict))
+        total_pages = 0
+        completed_pages = 0
+        model_started: list[Any] = []
+        model_ended: list[Any] = []
+        for item in merged_models:
+            total_pages += self._safe_int(item.get("total_pages"))
+            completed_pages += self._safe_int(item.get("completed_pages"))
+            model_started.append(item.get("started_at"))
+            model_ended.append(item.get("ended_at"))
         progress_ratio = (completed_pages / total_pages) if total_pages > 0 else 0.0
 
         fallback_status = str(current_payload.get("status") or existing_payload.get("status") or RunStatus.QUEUED.value)
         merged_status = self._merge_job_status_from_models(merged_models, fallback_status)
 
-        model_started = [item.get("started_at") for item in merged_models if isinstance(item, dict)]
-        model_ended = [item.get("ended_at") for item in merged_models if isinstance(item, dict)]
-
         created_at = self._timestamp_min([existing_payload.get("created_at"), current_payload.get("created_at")])
         started_at = self._timestamp_min([existing_payload.get("started_at"), current_payload.get("started_at"), *model_started])
 
@@ -367,7 +636,8 @@ class JobManager:
         return merged
 
     def _serialize_run_for_job_metadata(self, job_id: str, run: ModelRunProgress) -> dict[str, Any]:
-        payload = run.model_dump(mode="json")
+        # These fields are recomputed below, so skip serializing the (possibly large) stale copies.
+        payload = run.model_dump(mode="json", exclude=_RUN_METADATA_RECOMPUTED_FIELDS)
         payload["output_dir"] = self._to_project_relative_path(payload.get("output_dir"))
         payload["current_pdf"] = self._to_project_relative_path(payload.get("current_pdf"))
 
@@ -429,9 +699,22 @@ class JobManager:
         if not usage:
             return cls._new_token_usage()
 
-        input_tokens = cls._safe_int(usage.get("prompt_tokens", usage.get("input_tokens", 0)))
-        output_tokens = cls._safe_int(usage.get("completion_tokens", usage.get("output_tokens", 0)))
-        total_tokens = cls._safe_int(usage.get("total_tokens", 0))
+        keys = usage.keys()
+        for signature, (input_key, output_key, total_key) in _USAGE_KEYMAPS:
+            if signature <= keys:
+                input_tokens = usage[input_key]
+                output_tokens = usage[output_key]
+                total_tokens = usage[total_key]
+                # Providers send plain ints; only fall back to coercion for odd payloads.
+                if not (type(input_tokens) is int and type(output_tokens) is int and type(total_tokens) is int):
+                    input_tokens = cls._safe_int(input_tokens)
+                    output_tokens = cls._safe_int(output_tokens)
+                    total_tokens = cls._safe_int(total_tokens)
+                break
+        else:
+            input_tokens = cls._safe_int(usage.get("prompt_tokens", usage.get("input_tokens", 0)))
+            output_tokens = cls._safe_int(usage.get("completion_tokens", usage.get("output_tokens", 0)))
+            total_tokens = cls._safe_int(usage.get("total_tokens", 0))
         if total_tokens <= 0:
             total_tokens = input_tokens + output_tokens
 
@@ -471,7 +754,7 @@ class JobManager:
 
     def _run_statistics(self, job_id: str, run_id: str) -> dict[str, Any]:
         key = self._run_metrics_key(job_id, run_id)
-        with self._state_lock:
+        with self._job_lock(job_id):
             metrics = self._run_metrics.get(key, self._new_metrics())
             # deep-ish copy for serialization safety
             copied = {
@@ -495,26 +778,46 @@ class JobManager:
         token_usage: dict[str, Any],
     ) -> None:
         key = self._run_metrics_key(job_id, run_id)
-        with self._state_lock:
-            metrics = self._run_metrics.setdefault(key, self._new_metrics())
-            metrics["pages_attempted"] = self._safe_int(metrics.get("pages_attempted")) + 1
-            if succeeded:
-                metrics["pages_succeeded"] = self._safe_int(metrics.get("pages_succeeded")) + 1
-            else:
-                metrics["pages_failed"] = self._safe_int(metrics.get("pages_failed")) + 1
-            metrics["processing_time_seconds"] = float(metrics.get("processing_time_seconds", 0.0)) + max(
-                0.0, float(processing_time_seconds)
-            )
-            metrics["ocr_request_time_seconds"] = float(metrics.get("ocr_request_time_seconds", 0.0)) + max(
-                0.0, float(ocr_request_time_seconds or 0.0)
-            )
-            token_totals = metrics.setdefault("token_usage", self._new_token_usage())
-            self._merge_token_usage(token_totals, token_usage)
+        processing_time_seconds = max(0.0, float(processing_time_seconds))
+        ocr_request_time_seconds = max(0.0, float(ocr_request_time_seconds or 0.0))
+        with self._job_lock(job_id):
+            targets = [self._run_metrics.setdefault(key, self._new_metrics())]
+            job_metrics = self._job_metrics.get(job_id)
+            if job_metrics is not None:
+                targets.append(job_metrics)
+            for metrics in targets:
+                metrics["pages_attempted"] = self._safe_int(metrics.get("pages_attempted")) + 1
+                if succeeded:
+                    metrics["pages_succeeded"] = self._safe_int(metrics.get("pages_succeeded")) + 1
+                else:
+                    metrics["pages_failed"] = self._safe_int(metrics.get("pages_failed")) + 1
+                metrics["processing_time_seconds"] = (
+                    float(metrics.get("processing_time_seconds", 0.0)) + processing_time_seconds
+                )
+                metrics["ocr_request_time_seconds"] = (
+                    float(metrics.get("ocr_request_time_seconds", 0.0)) + ocr_request_time_seconds
+                )
+                token_totals = metrics.setdefault("token_usage", self._new_token_usage())
+                self._merge_token_usage(token_totals, token_usage)
 
-    def _job_statistics(self, job: JobProgress) -> dict[str, Any]:
+    def _job_statistics(
+        self,
+        job: JobProgress,
+        run_statistics: dict[str, dict[str, Any]] | None = None,
+    ) -> dict[str, Any]:
+        runtime_seconds = self.job_runtime_seconds(job)
+        with self._job_lock(job.job_id):
+            job_metrics = self._job_metrics.get(job.job_id)
+            if job_metrics is not None:
+                return self._finalize_metrics(job_metrics, runtime_seconds=runtime_seconds)
+
+        # Jobs registered without running totals are summed from their runs.
         aggregate = self._new_metrics()
         for run in job.models:
-            run_stats = self._run_statistics(job.job_id, run.run_id)
+            if run_statistics is not None and run.run_id in run_statistics:
+                run_stats = run_statistics[run.run_id]
+            else:
+                run_stats = self._run_statistics(job.job_id, run.run_id)
             aggregate["pages_attempted"] += self._safe_int(run_stats.get("pages_attempted"))
             aggregate["pages_succeeded"] += self._safe_int(run_stats.get("pages_succeeded"))
             aggregate["pages_failed"] += self._safe_int(run_stats.get("pages_failed"))
@@ -522,21 +825,56 @@ class JobManager:
             aggregate["ocr_request_time_seconds"] += float(run_stats.get("ocr_request_time_seconds", 0.0))
             self._merge_token_usage(aggregate["token_usage"], run_stats.get("token_usage", {}))
 
-        return self._finalize_metrics(aggregate, runtime_seconds=self.job_runtime_seconds(job))
+        return self._finalize_metrics(aggregate, runtime_seconds=runtime_seconds)
 
     @classmethod
-    def _pdf_statistics(cls, page_count: int, pages: list[dict[str, Any]]) -> dict[str, Any]:
-        aggregate = cls._new_metrics()
-        for page in pages:
-            status = str(page.get("status", "")).lower()
-            aggregate["pages_attempted"] += 1
-            if status == "completed":
-                aggregate["pages_succeeded"] += 1
-            else:
-                aggregate["pages_failed"] += 1
-            aggregate["processing_time_seconds"] += float(page.get("processing_time_seconds", 0.0))
-            aggregate["ocr_request_time_seconds"] += float(page.get("ocr_request_time_seconds") or 0.0)
-            cls._merge_token_usage(aggregate["token_usage"], page.get("token_usage", {}))
+    def _accumulate_pdf_page(cls, aggregate: dict[str, Any], page: dict[str, Any]) -> None:
+        status = str(page.get("status", "")).lower()
+        aggregate["pages_attempted"] += 1
+        if status == "completed":
+            aggregate["pages_succeeded"] += 1
+        else:
+            aggregate["pages_failed"] += 1
+        aggregate["processing_time_seconds"] += float(page.get("processing_time_seconds", 0.0))
+        aggregate["ocr_request_time_seconds"] += float(page.get("ocr_request_time_seconds") or 0.0)
+        cls._merge_token_usage(aggregate["token_usage"], page.get("token_usage", {}))
+
+    @classmethod
+    def _sum_pdf_pages(cls, pages: list[dict[str, Any]]) -> dict[str, Any]:
+        succeeded = sum(1 for page in pages if str(page.get("status", "")).lower() == "completed")
+        aggregate = {
+            "pages_attempted": len(pages),
+            "pages_succeeded": succeeded,
+            "pages_failed": len(pages) - succeeded,
+            "processing_time_seconds": sum(float(page.get("processing_time_seconds", 0.0)) for page in pages),
+            "ocr_request_time_seconds": sum(float(page.get("ocr_request_time_seconds") or 0.0) for page in pages),
+        }
+        usages = [page.get("token_usage") or _ZERO_TOKEN_USAGE for page in pages]
+        try:
+            token_usage = {
+                "input_tokens": sum(map(_get_input_tokens, usages)),
+                "output_tokens": sum(map(_get_output_tokens, usages)),
+                "total_tokens": sum(map(_get_total_tokens, usages)),
+            }
+        except (KeyError, TypeError):
+            # Hand-edited or legacy page records; fall back to tolerant per-page merging.
+            token_usage = cls._new_token_usage()
+            for usage in usages:
+                cls._merge_token_usage(token_usage, usage)
+        aggregate["token_usage"] = token_usage
+        return aggregate
+
+    @classmethod
+    def _pdf_statistics(
+        cls,
+        page_count: int,
+        pages: list[dict[str, Any]],
+        running_totals: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        # Running totals are kept by the page loop; a full pass over pages is the fallback.
+        aggregate = running_totals
+        if aggregate is None:
+            aggregate = cls._sum_pdf_pages(pages)
 
         finalized = cls._finalize_metrics(aggregate)
         finalized["page_count"] = max(0, page_count)
@@ -544,23 +882,45 @@ class JobManager:
         return finalized
 
     @classmethod
-    def _output_tokens_from_pdf_metadata(cls, pdf_metadata: dict[str, Any], page_number: int) -> int | None:
+    def _pdf_pages_by_number(cls, pdf_metadata: dict[str, Any]) -> dict[int, dict[str, Any]]:
         pages = pdf_metadata.get("pages")
         if not isinstance(pages, list):
-            return None
-
+            return {}
+        index: dict[int, dict[str, Any]] = {}
         for page_entry in pages:
             if not isinstance(page_entry, dict):
                 continue
             entry_page_number = cls._optional_int(page_entry.get("page_number"))
-            if entry_page_number != page_number:
-                continue
-            token_usage = page_entry.get("token_usage")
-            if not isinstance(token_usage, dict):
-                return None
-            return cls._optional_int(token_usage.get("output_tokens"))
+            if entry_page_number is not None:
+                # First entry wins, matching the old linear scan.
+                index.setdefault(entry_page_number, page_entry)
+        return index
 
-        return None
+    @classmethod
+    def _page_output_tokens(cls, page_entry: dict[str, Any] | None) -> int | None:
+        if page_entry is None:
+            return None
+        token_usage = page_entry.get("token_usage")
+        if not isinstance(token_usage, dict):
+            return None
+        return cls._optional_int(token_usage.get("output_tokens"))
+
+    @classmethod
+    def _output_tokens_from_pdf_metadata(cls, pdf_metadata: dict[str, Any], page_number: int) -> int | None:
+        return cls._page_output_tokens(cls._pdf_pages_by_number(pdf_metadata).get(page_number))
+
+    @classmethod
+    def output_tokens_for_page(cls, pdf_dir: Path, page_number: int) -> int | None:
+        metadata_path = os.path.join(pdf_dir, "pdf_metadata.json")
+        try:
+            stat = os.stat(metadata_path)
+        except OSError:
+            return None
+        index = _load_page_token_index(metadata_path, stat.st_mtime_ns, stat.st_size)
+        if index is None:
+            # In-flight PDF: pages live in the NDJSON log, which the stat key does not cover.
+            return cls._output_tokens_from_pdf_metadata(cls.load_pdf_metadata(pdf_dir), page_number)
+        return index.get(page_number)
 
     async def launch_job(self, request: LaunchJobRequest) -> JobProgress:
         input_path = resolve_input_path(self.settings, request.input_path)
@@ -645,7 +1005,7 @@ class JobManager:
 
         cancel_event = threading.Event()
 
-        with self._state_lock:
+        with self._registry_lock:
             existing_job = self._jobs.get(job_id)
             if existing_job and existing_job.status in {
                 RunStatus.QUEUED,
@@ -662,17 +1022,20 @@ class JobManager:
                 self._job_contexts.pop(job_id, None)
                 self._cancel_events.pop(job_id, None)
                 self._tasks.pop(job_id, None)
+                self._job_metadata_written_at.pop(job_id, None)
 
+            self._job_locks.setdefault(job_id, threading.RLock())
             self._jobs[job_id] = job
             self._job_contexts[job_id] = run_contexts
             self._cancel_events[job_id] = cancel_event
             for context in run_contexts:
                 self._run_metrics[self._run_metrics_key(job_id, context.run.run_id)] = self._new_metrics()
+            self._job_metrics[job_id] = self._new_metrics()
 
         loop = asyncio.get_running_loop()
         task = loop.create_task(self._run_job(job_id, request, descriptors))
 
-        with self._state_lock:
+        with self._registry_lock:
             self._tasks[job_id] = task
 
         return self._jobs[job_id].model_copy(deep=True)
@@ -683,15 +1046,28 @@ class JobManager:
         request: LaunchJobRequest,
         descriptors: list[PDFDescriptor],
     ) -> None:
-        with self._state_lock:
+        with self._job_lock(job_id):
             job = self._jobs[job_id]
             job.status = RunStatus.RUNNING
             job.started_at = datetime.now(UTC)
             self._persist_job_metadata(job_id)
 
+        with self._registry_lock:
             contexts = list(self._job_contexts[job_id])
             cancel_event = self._cancel_events[job_id]
 
+        page_renders: _SharedPageRenders | None = None
+        if len(contexts) > 1:
+            page_renders = _SharedPageRenders(
+                self._page_renders_root / job_id,
+                descriptors,
+                consumers=[context.run.run_id for context in contexts],
+                cancel_event=cancel_event,
+            )
+            # A reused job_id must not pick up pages from an earlier run of the same id.
+            await asyncio.to_thread(shutil.rmtree, self._page_renders_root / job_id, ignore_errors=True)
+            page_renders.start()
+
         tasks = [
             asyncio.to_thread(
                 self._run_single_model,
@@ -700,13 +1076,18 @@ class JobManager:
                 descriptors,
                 context,
                 cancel_event,
+                page_renders,
             )
             for context in contexts
         ]
 
-        await asyncio.gather(*tasks, return_exceptions=True)
+        try:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            if page_renders is not None:
+                await asyncio.to_thread(page_renders.close)
 
-        with self._state_lock:
+        with self._job_lock(job_id):
             job = self._jobs[job_id]
             if cancel_event.is_set() and all(run.status == RunStatus.CANCELED for run in job.models):
                 job.status = RunStatus.CANCELED
@@ -741,7 +1122,7 @@ class JobManager:
         return EndpointAuth(base_url=base_url, api_key=api_key)
 
     def _mark_run_status(self, job_id: str, run_id: str, status: RunStatus, error: str | None = None) -> None:
-        with self._state_lock:
+        with self._job_lock(job_id):
             job = self._jobs[job_id]
             for run in job.models:
                 if run.run_id == run_id:
@@ -779,12 +1160,23 @@ class JobManager:
         return self._run_statistics(job_id, run_id)
 
     def job_statistics(self, job_id: str) -> dict[str, Any]:
-        with self._state_lock:
+        with self._job_lock(job_id):
             job = self._jobs.get(job_id)
             if not job:
                 return self._finalize_metrics(self._new_metrics(), runtime_seconds=0.0)
             return self._job_statistics(job)
 
+    def statistics_snapshot(self) -> dict[str, dict[str, Any]]:
+        # One lock hold for a whole /api/jobs listing; run stats are computed once and reused for the job rollup.
+        snapshot: dict[str, dict[str, Any]] = {}
+        with self._registry_lock:
+            jobs = list(self._jobs.items())
+        for job_id, job in jobs:
+            with self._job_lock(job_id):
+                runs = {run.run_id: self._run_statistics(job_id, run.run_id) for run in job.models}
+                snapshot[job_id] = {"job": self._job_statistics(job, runs), "runs": runs}
+        return snapshot
+
     def _persist_job_metadata(self, job_id: str) -> None:
         job = self._jobs[job_id]
         metadata_path = Path(job.metadata_path)
@@ -808,7 +1200,16 @@ class JobManager:
         with self._job_metadata_file_lock(metadata_path):
             existing_payload = self._read_json_if_exists(metadata_path)
             merged_payload = self._merge_job_metadata_payloads(existing_payload, current_payload)
-            write_json(metadata_path, merged_payload)
+            _write_metadata_json(metadata_path, merged_payload, fsync=self.settings.metadata_fsync)
+        self._job_metadata_written_at[job_id] = time.monotonic()
+
+    def _persist_job_metadata_coalesced(self, job_id: str) -> None:
+        # Page-driven flushes from every run of a job land in the same file; status
+        # transitions still go through _persist_job_metadata directly.
+        written_at = self._job_metadata_written_at.get(job_id)
+        if written_at is not None and time.monotonic() - written_at < METADATA_FLUSH_INTERVAL_SECONDS:
+            return
+        self._persist_job_metadata(job_id)
 
     def _persist_run_metadata(
         self,
@@ -838,18 +1239,84 @@ class JobManager:
 
     def _append_error(self, run_dir: Path, record: dict[str, Any]) -> None:
         error_path = run_dir / "errors.jsonl"
-        with error_path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(record) + "\n")
+        with error_path.open("ab") as handle:
+            handle.write(dumps_bytes(record) + b"\n")
 
     @staticmethod
     def _read_json_if_exists(path: Path) -> dict[str, Any]:
         if not path.exists():
             return {}
         try:
-            return json.loads(path.read_text(encoding="utf-8"))
+            return loads(path.read_bytes())
         except Exception:  # noqa: BLE001
             return {}
 
+    @classmethod
+    def _read_json_many(cls, paths: list[Path]) -> list[dict[str, Any]]:
+        if len(paths) <= 1:
+            return [cls._read_json_if_exists(path) for path in paths]
+        # Metadata reads are dominated by open/read latency, which releases the GIL.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(METADATA_READ_WORKERS, len(paths))) as executor:
+            return list(executor.map(cls._read_json_if_exists, paths))
+
+    @classmethod
+    def _read_pdf_pages(cls, pages_path: Path) -> list[dict[str, Any]]:
+        try:
+            data = pages_path.read_bytes()
+        except OSError:
+            return []
+        pages: list[dict[str, Any]] = []
+        for line in data.splitlines():
+            try:
+                page = loads(line)
+            except Exception:  # noqa: BLE001
+                # A torn trailing line from an interrupted append.
+                continue
+            if isinstance(page, dict):
+                pages.append(page)
+        return pages
+
+    @classmethod
+    def load_pdf_metadata(cls, pdf_dir: Path, metadata: dict[str, Any] | None = None) -> dict[str, Any]:
+        if metadata is None:
+            metadata = cls._read_json_if_exists(pdf_dir / "pdf_metadata.json")
+        if "pages" in metadata:
+            return metadata
+        # PDF still in flight (or interrupted): rebuild the view from the summary and page log.
+        summary = cls._read_json_if_exists(pdf_dir / PDF_SUMMARY_FILENAME)
+        pages = cls._read_pdf_pages(pdf_dir / PDF_PAGES_FILENAME)
+        if not summary and not pages:
+            return metadata
+        merged = {**metadata, **summary}
+        merged["pages"] = sorted(pages, key=lambda entry: cls._safe_int(entry.get("page_number")))
+        return merged
+
+    def _persist_pdf_summary(
+        self,
+        *,
+        pdf_summary_path: Path,
+        source_pdf: Path,
+        pdf_slug: str,
+        page_count: int,
+        started_at: datetime | None,
+        running_totals: dict[str, Any],
+    ) -> None:
+        payload = {
+            "source_pdf": str(source_pdf),
+            "pdf_slug": pdf_slug,
+            "page_count": page_count,
+            "updated_at": datetime.now(UTC),
+            "started_at": started_at,
+            "ended_at": None,
+            "statistics": self._pdf_statistics(page_count=page_count, pages=[], running_totals=running_totals),
+        }
+        _write_metadata_json(pdf_summary_path, payload, fsync=self.settings.metadata_fsync)
+
+    @staticmethod
+    def _append_pdf_page(pdf_pages_path: Path, page_record: dict[str, Any]) -> None:
+        with open(pdf_pages_path, "ab") as handle:
+            handle.write(dumps_bytes(page_record) + b"\n")
+
     def _persist_pdf_metadata(
         self,
         *,
@@ -860,21 +1327,26 @@ class JobManager:
         pages: list[dict[str, Any]],
         started_at: datetime | None,
         ended_at: datetime | None,
+        running_totals: dict[str, Any] | None = None,
     ) -> None:
         existing = self._read_json_if_exists(pdf_metadata_path)
-        created_at = existing.get("created_at") or datetime.now(UTC).isoformat()
+        now = datetime.now(UTC)
         payload = {
             "source_pdf": str(source_pdf),
             "pdf_slug": pdf_slug,
             "page_count": page_count,
-            "created_at": created_at,
-            "updated_at": datetime.now(UTC).isoformat(),
-            "started_at": started_at.isoformat() if started_at else existing.get("started_at"),
-            "ended_at": ended_at.isoformat() if ended_at else None,
-            "statistics": self._pdf_statistics(page_count=page_count, pages=pages),
+            "created_at": existing.get("created_at") or now,
+            "updated_at": now,
+            "started_at": started_at or existing.get("started_at"),
+            "ended_at": ended_at,
+            "statistics": self._pdf_statistics(page_count=page_count, pages=pages, running_totals=running_totals),
             "pages": sorted(pages, key=lambda entry: int(entry.get("page_number", 0))),
         }
-        write_json(pdf_metadata_path, payload)
+        _write_metadata_json(pdf_metadata_path, payload, fsync=self.settings.metadata_fsync)
+        if ended_at is not None:
+            # pdf_metadata.json now carries every page, so the in-flight files are redundant.
+            pdf_metadata_path.with_name(PDF_SUMMARY_FILENAME).unlink(missing_ok=True)
+            pdf_metadata_path.with_name(PDF_PAGES_FILENAME).unlink(missing_ok=True)
 
     @staticmethod
     def _process_page_ocr_request(
@@ -887,7 +1359,7 @@ class JobManager:
         page_number: int,
         image_png: bytes,
     ) -> _PageOCROutcome:
-        page_started_at = datetime.now(UTC)
+        page_started_at_ns = time.time_ns()
         ocr_result: OCRPageResult | None = None
         usage_payload: dict[str, Any] | None = None
         finish_reason: str | None = None
@@ -914,8 +1386,8 @@ class JobManager:
             error_text = str(exc)
             markdown_text = f"<!-- OCR failed for page {page_number}: {error_text} -->\n"
 
-        page_ended_at = datetime.now(UTC)
-        processing_seconds = max(0.0, (page_ended_at - page_started_at).total_seconds())
+        page_ended_at_ns = time.time_ns()
+        processing_seconds = max(0.0, (page_ended_at_ns - page_started_at_ns) / 1e9)
         return _PageOCROutcome(
             page_number=page_number,
             markdown_text=markdown_text,
@@ -925,11 +1397,147 @@ class JobManager:
             attempts=attempts,
             request_seconds=request_seconds,
             error_text=error_text,
-            page_started_at=page_started_at,
-            page_ended_at=page_ended_at,
+            page_started_at_ns=page_started_at_ns,
+            page_ended_at_ns=page_ended_at_ns,
             processing_seconds=processing_seconds,
         )
 
+    def _start_pdf_run(
+        self,
+        job_id: str,
+        context: _RunContext,
+        run: ModelRunProgress,
+        descriptor: PDFDescriptor,
+    ) -> _PdfRunState:
+        pdf_layout = self.layout.prepare_pdf(
+            run_dir=context.run_paths.run_dir,
+            source_pdf=descriptor.path,
+            page_count=descriptor.page_count,
+        )
+        pdf_state = _PdfRunState(
+            descriptor=descriptor,
+            layout=pdf_layout,
+            started_at=datetime.now(UTC),
+            totals=self._new_metrics(),
+            debounce=_MetadataDebounce(last_flush=time.monotonic()),
+        )
+        self._persist_pdf_summary(
+            pdf_summary_path=pdf_layout.pdf_summary_path,
+            source_pdf=descriptor.path,
+            pdf_slug=pdf_layout.pdf_slug,
+            page_count=descriptor.page_count,
+            started_at=pdf_state.started_at,
+            running_totals=pdf_state.totals,
+        )
+
+        with self._job_lock(job_id):
+            run.current_pdf = str(descriptor.path)
+            run.current_page = 0
+            self._persist_run_metadata(job_id, context.run_paths, run)
+            self._persist_job_metadata(job_id)
+        return pdf_state
+
+    def _record_page_outcome(
+        self,
+        job_id: str,
+        context: _RunContext,
+        run: ModelRunProgress,
+        pdf_state: _PdfRunState,
+        outcome: _PageOCROutcome,
+    ) -> None:
+        descriptor = pdf_state.descriptor
+        pdf_layout = pdf_state.layout
+        if outcome.error_text is not None:
+            self._append_error(
+                context.run_paths.run_dir,
+                {
+                    "timestamp": datetime.now(UTC).isoformat(),
+                    "source_pdf": str(descriptor.path),
+                    "page": outcome.page_number,
+                    "error": outcome.error_text,
+                },
+            )
+
+        token_usage = self._token_usage_from_provider_usage(outcome.usage_payload)
+        page_path = self.layout.write_page_markdown(
+            pdf_layout.pdf_dir,
+            outcome.page_number,
+            outcome.markdown_text,
+        )
+        try:
+            output_bytes = page_path.stat().st_size
+        except OSError:
+            output_bytes = len(outcome.markdown_text.encode("utf-8"))
+
+        page_record = {
+            "page_number": outcome.page_number,
+            "status": "completed" if outcome.error_text is None else "failed",
+            "started_at": _iso_from_ns(outcome.page_started_at_ns),
+            "ended_at": _iso_from_ns(outcome.page_ended_at_ns),
+            "processing_time_seconds": outcome.processing_seconds,
+            "ocr_request_time_seconds": outcome.request_seconds,
+            "attempts": outcome.attempts,
+            "finish_reason": outcome.finish_reason,
+            "provider_model": outcome.provider_model,
+            "token_usage": token_usage,
+            "usage": outcome.usage_payload,
+            "output_markdown_file": page_path.name,
+            "output_markdown_path": str(page_path),
+            "output_bytes": output_bytes,
+            "error": outcome.error_text,
+        }
+        pdf_state.pages.append(page_record)
+        self._append_pdf_page(pdf_layout.pdf_pages_path, page_record)
+        self._accumulate_pdf_page(pdf_state.totals, page_record)
+        flush_metadata = pdf_state.debounce.mark_dirty()
+        if flush_metadata:
+            self._persist_pdf_summary(
+                pdf_summary_path=pdf_layout.pdf_summary_path,
+                source_pdf=descriptor.path,
+                pdf_slug=pdf_layout.pdf_slug,
+                page_count=descriptor.page_count,
+                started_at=pdf_state.started_at,
+                running_totals=pdf_state.totals,
+            )
+        self._record_run_page_metrics(
+            job_id=job_id,
+            run_id=run.run_id,
+            succeeded=outcome.error_text is None,
+            processing_time_seconds=outcome.processing_seconds,
+            ocr_request_time_seconds=outcome.request_seconds,
+            token_usage=token_usage,
+        )
+
+        with self._job_lock(job_id):
+            run.current_page = outcome.page_number
+            run.completed_pages += 1
+            self._recompute_job_progress(job_id)
+            if flush_metadata:
+                self._persist_run_metadata(job_id, context.run_paths, run)
+                self._persist_job_metadata_coalesced(job_id)
+
+    def _finalize_pdf_run(
+        self,
+        job_id: str,
+        context: _RunContext,
+        run: ModelRunProgress,
+        pdf_state: _PdfRunState,
+    ) -> None:
+        self._persist_pdf_metadata(
+            pdf_metadata_path=pdf_state.layout.pdf_metadata_path,
+            source_pdf=pdf_state.descriptor.path,
+            pdf_slug=pdf_state.layout.pdf_slug,
+            page_count=pdf_state.descriptor.page_count,
+            pages=pdf_state.pages,
+            started_at=pdf_state.started_at,
+            ended_at=datetime.now(UTC),
+            running_totals=pdf_state.totals,
+        )
+        if pdf_state.debounce.dirty_pages:
+            with self._job_lock(job_id):
+                self._persist_run_metadata(job_id, context.run_paths, run)
+                self._persist_job_metadata(job_id)
+
     def _run_single_model(
         self,
         job_id: str,
@@ -937,8 +1545,9 @@ class JobManager:
         descriptors: list[PDFDescriptor],
         context: _RunContext,
         cancel_event: threading.Event,
+        page_renders: _SharedPageRenders | None = None,
     ) -> None:
-        with self._state_lock:
+        with self._job_lock(job_id):
             spec = request.models[context.spec_index]
             run = self._get_run(job_id, context.run.run_id)
             if run is None:
@@ -974,47 +1583,50 @@ class JobManager:
             max_concurrent_requests = spec.max_concurrent_requests or self.settings.vllm_max_concurrent_requests
             max_concurrent_requests = max(1, int(max_concurrent_requests))
 
-            for descriptor in descriptors:
-                if cancel_event.is_set():
-                    self._mark_run_status(job_id, run.run_id, RunStatus.CANCELED)
-                    self._persist_run_metadata(job_id, context.run_paths, run)
-                    return
-
-                pdf_layout = self.layout.prepare_pdf(
-                    run_dir=context.run_paths.run_dir,
-                    source_pdf=descriptor.path,
-                    page_count=descriptor.page_count,
-                )
-                pdf_started_at = datetime.now(UTC)
-                pdf_pages: list[dict[str, Any]] = []
-                self._persist_pdf_metadata(
-                    pdf_metadata_path=pdf_layout.pdf_metadata_path,
-                    source_pdf=descriptor.path,
-                    pdf_slug=pdf_layout.pdf_slug,
-                    page_count=descriptor.page_count,
-                    pages=pdf_pages,
-                    started_at=pdf_started_at,
-                    ended_at=None,
-                )
-
-                with self._state_lock:
-                    run.current_pdf = str(descriptor.path)
-                    run.current_page = 0
-                    self._persist_run_metadata(job_id, context.run_paths, run)
-                    self._persist_job_metadata(job_id)
-
-                page_iter = iter_rendered_pages(descriptor.path)
-                page_iter_exhausted = False
-                pending: dict[concurrent.futures.Future[_PageOCROutcome], int] = {}
-
-                with concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrent_requests) as executor:
+            # Pages from every PDF feed one executor, so workers stay busy across document
+            # boundaries; each PDF is finalized once its last submitted page lands.
+            open_pdfs: list[_PdfRunState] = []
+
+            def _run_pages() -> Iterator[tuple[_PdfRunState, int, bytes]]:
+                try:
+                    for index, descriptor in enumerate(descriptors):
+                        if cancel_event.is_set():
+                            return
+                        pdf_state = self._start_pdf_run(job_id, context, run, descriptor)
+                        open_pdfs.append(pdf_state)
+                        if page_renders is not None:
+                            rendered = page_renders.iter_pages(run.run_id, index)
+                        else:
+                            rendered = iter_rendered_pages(descriptor.path)
+                        try:
+                            for page_number, image_png in rendered:
+                                yield pdf_state, page_number, image_png
+                        finally:
+                            rendered.close()
+                        pdf_state.render_done = True
+                finally:
+                    if page_renders is not None:
+                        page_renders.release(run.run_id)
+
+            def _finalize_settled() -> None:
+                for pdf_state in [state for state in open_pdfs if state.settled]:
+                    open_pdfs.remove(pdf_state)
+                    self._finalize_pdf_run(job_id, context, run, pdf_state)
+
+            page_source = _run_pages()
+            page_source_exhausted = False
+            pending: dict[concurrent.futures.Future[_PageOCROutcome], tuple[_PdfRunState, int]] = {}
+
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrent_requests) as executor:
+                try:
                     while True:
-                        while not cancel_event.is_set() and not page_iter_exhausted and len(pending) < max_concurrent_requests:
+                        while not cancel_event.is_set() and not page_source_exhausted and len(pending) < max_concurrent_requests:
                             try:
-                                page_number, image_png = next(page_iter)
+                                pdf_state, page_number, image_png = next(page_source)
                             except StopIteration:
-                                page_iter_exhausted = True
+                                page_source_exhausted = True
                                 break
+                            pdf_state.submitted_pages += 1
                             pending[
                                 executor.submit(
                                     self._process_page_ocr_request,
@@ -1026,12 +1638,11 @@ class JobManager:
                                     page_number=page_number,
                                     image_png=image_png,
                                 )
-                            ] = page_number
+                            ] = (pdf_state, page_number)
 
+                        _finalize_settled()
                         if not pending:
-                            if page_iter_exhausted or cancel_event.is_set():
-                                break
-                            continue
+                            break
 
                         done, _ = concurrent.futures.wait(
                             pending.keys(),
@@ -1039,11 +1650,11 @@ class JobManager:
                         )
 
                         for future in done:
-                            page_number = pending.pop(future)
+                            pdf_state, page_number = pending.pop(future)
                             try:
                                 outcome = future.result()
                             except Exception as exc:  # noqa: BLE001
-                                now = datetime.now(UTC)
+                                now_ns = time.time_ns()
                                 outcome = _PageOCROutcome(
                                     page_number=page_number,
                                     markdown_text=f"<!-- OCR failed for page {page_number}: {exc} -->\n",
@@ -1053,95 +1664,25 @@ class JobManager:
                                     attempts=0,
                                     request_seconds=None,
                                     error_text=str(exc),
-                                    page_started_at=now,
-                                    page_ended_at=now,
+                                    page_started_at_ns=now_ns,
+                                    page_ended_at_ns=now_ns,
                                     processing_seconds=0.0,
                                 )
+                            self._record_page_outcome(job_id, context, run, pdf_state, outcome)
 
-                            if outcome.error_text is not None:
-                                self._append_error(
-                                    context.run_paths.run_dir,
-                                    {
-                                        "timestamp": datetime.now(UTC).isoformat(),
-                                        "source_pdf": str(descriptor.path),
-                                        "page": outcome.page_number,
-                                        "error": outcome.error_text,
-                                    },
-                                )
-
-                            token_usage = self._token_usage_from_provider_usage(outcome.usage_payload)
-                            page_path = self.layout.write_page_markdown(
-                                pdf_layout.pdf_dir,
-                                outcome.page_number,
-                                outcome.markdown_text,
-                            )
-                            try:
-                                output_bytes = page_path.stat().st_size
-                            except OSError:
-                                output_bytes = len(outcome.markdown_text.encode("utf-8"))
-
-                            page_record = {
-                                "page_number": outcome.page_number,
-                                "status": "completed" if outcome.error_text is None else "failed",
-                                "started_at": outcome.page_started_at.isoformat(),
-                                "ended_at": outcome.page_ended_at.isoformat(),
-                                "processing_time_seconds": outcome.processing_seconds,
-                                "ocr_request_time_seconds": outcome.request_seconds,
-                                "attempts": outcome.attempts,
-                                "finish_reason": outcome.finish_reason,
-                                "provider_model": outcome.provider_model,
-                                "token_usage": token_usage,
-                                "usage": outcome.usage_payload,
-                                "output_markdown_file": page_path.name,
-                                "output_markdown_path": str(page_path),
-                                "output_bytes": output_bytes,
-                                "error": outcome.error_text,
-                            }
-                            pdf_pages.append(page_record)
-                            self._persist_pdf_metadata(
-                                pdf_metadata_path=pdf_layout.pdf_metadata_path,
-                                source_pdf=descriptor.path,
-                                pdf_slug=pdf_layout.pdf_slug,
-                                page_count=descriptor.page_count,
-                                pages=pdf_pages,
-                                started_at=pdf_started_at,
-                                ended_at=None,
-                            )
-                            self._record_run_page_metrics(
-                                job_id=job_id,
-                                run_id=run.run_id,
-                                succeeded=outcome.error_text is None,
-                                processing_time_seconds=outcome.processing_seconds,
-                                ocr_request_time_seconds=outcome.request_seconds,
-                                token_usage=token_usage,
-                            )
-
-                            with self._state_lock:
-                                run.current_page = outcome.page_number
-                                run.completed_pages += 1
-                                self._recompute_job_progress(job_id)
-                                self._persist_run_metadata(job_id, context.run_paths, run)
-                                self._persist_job_metadata(job_id)
-
-                        if page_iter_exhausted and not pending:
-                            break
-
-                self._persist_pdf_metadata(
-                    pdf_metadata_path=pdf_layout.pdf_metadata_path,
-                    source_pdf=descriptor.path,
-                    pdf_slug=pdf_layout.pdf_slug,
-                    page_count=descriptor.page_count,
-                    pages=pdf_pages,
-                    started_at=pdf_started_at,
-                    ended_at=datetime.now(UTC),
-                )
+                        _finalize_settled()
+                finally:
+                    page_source.close()
 
-                if cancel_event.is_set():
-                    self._mark_run_status(job_id, run.run_id, RunStatus.CANCELED)
-                    self._persist_run_metadata(job_id, context.run_paths, run)
-                    return
+            if cancel_event.is_set():
+                # PDFs cut short by cancellation still get their final metadata.
+                for pdf_state in open_pdfs:
+                    self._finalize_pdf_run(job_id, context, run, pdf_state)
+                self._mark_run_status(job_id, run.run_id, RunStatus.CANCELED)
+                self._persist_run_metadata(job_id, context.run_paths, run)
+                return
 
-            with self._state_lock:
+            with self._job_lock(job_id):
                 if run.status != RunStatus.CANCELED:
                     run.status = RunStatus.COMPLETED
                     run.ended_at = datetime.now(UTC)
@@ -1150,7 +1691,7 @@ class JobManager:
                 self._persist_job_metadata(job_id)
 
         except Exception as exc:  # noqa: BLE001
-            with self._state_lock:
+            with self._job_lock(job_id):
                 run = self._get_run(job_id, context.run.run_id)
                 if run:
                     run.status = RunStatus.FAILED
@@ -1160,6 +1701,10 @@ class JobManager:
                     self._persist_run_metadata(job_id, context.run_paths, run)
                     self._persist_job_metadata(job_id)
         finally:
+            # Runs that fail before reading (server or auth errors) never start _run_pages.
+            if page_renders is not None:
+                page_renders.release(context.run.run_id)
+            self.layout.forget_run(context.run_paths.run_dir)
             if client:
                 client.close()
             if local_handle:
@@ -1179,11 +1724,16 @@ class JobManager:
         job.completed_pages_all_models = sum(run.completed_pages for run in job.models)
 
     def list_jobs(self) -> list[JobProgress]:
-        with self._state_lock:
-            return [job.model_copy(deep=True) for job in self._jobs.values()]
+        with self._registry_lock:
+            jobs = list(self._jobs.items())
+        copies: list[JobProgress] = []
+        for job_id, job in jobs:
+            with self._job_lock(job_id):
+                copies.append(job.model_copy(deep=True))
+        return copies
 
     def get_job(self, job_id: str) -> JobProgress | None:
-        with self._state_lock:
+        with self._job_lock(job_id):
             job = self._jobs.get(job_id)
             if not job:
                 return None
@@ -1194,58 +1744,64 @@ class JobManager:
         if not job_dir.exists() or not job_dir.is_dir():
             raise FileNotFoundError(f"Job outputs not found for {job_id}")
 
-        pages: list[dict[str, Any]] = []
-        model_dirs = sorted((path for path in job_dir.iterdir() if path.is_dir()), key=lambda path: path.name)
-
-        for model_dir in model_dirs:
-            model_slug = model_dir.name
-            run_dirs = sorted(
-                (
-                    path
-                    for path in model_dir.iterdir()
-                    if path.is_dir() and self.layout.parse_run_number(path.name) is not None
-                ),
-                key=lambda path: int(self.layout.parse_run_number(path.name) or 0),
-            )
+        run_dirs: list[tuple[str, int, Path]] = []
+        with os.scandir(job_dir) as model_entries:
+            for model_entry in model_entries:
+                if not model_entry.is_dir():
+                    continue
+                with os.scandir(model_entry.path) as run_entries:
+                    for run_entry in run_entries:
+                        run_number = self.layout.parse_run_number(run_entry.name)
+                        if run_number is None or not run_entry.is_dir():
+                            continue
+                        run_dirs.append((model_entry.name, run_number, Path(run_entry.path)))
+
+        pdf_dirs: list[tuple[int, Path]] = []
+        for run_index, (_, _, run_dir) in enumerate(run_dirs):
+            with os.scandir(run_dir) as pdf_entries:
+                pdf_dirs.extend((run_index, Path(entry.path)) for entry in pdf_entries if entry.is_dir())
 
-            for run_dir in run_dirs:
-                run_number = int(self.layout.parse_run_number(run_dir.name) or 0)
-                run_metadata = self._read_json_if_exists(run_dir / "run_metadata.json")
-                model_name = str(run_metadata.get("model") or model_slug)
-                mode = run_metadata.get("mode")
-
-                pdf_dirs = sorted((path for path in run_dir.iterdir() if path.is_dir()), key=lambda path: path.name)
-                for pdf_dir in pdf_dirs:
-                    pdf_slug = pdf_dir.name
-                    pdf_metadata = self._read_json_if_exists(pdf_dir / "pdf_metadata.json")
-                    source_pdf = pdf_metadata.get("source_pdf")
-
-                    page_files = sorted(
-                        (
-                            path
-                            for path in pdf_dir.glob("*.md")
-                            if path.is_file() and path.stem.isdigit()
-                        ),
-                        key=lambda path: int(path.stem),
+        metadata = self._read_json_many(
+            [run_dir / "run_metadata.json" for _, _, run_dir in run_dirs]
+            + [pdf_dir / "pdf_metadata.json" for _, pdf_dir in pdf_dirs]
+        )
+        run_metadata_list = metadata[: len(run_dirs)]
+        pdf_metadata_list = [
+            self.load_pdf_metadata(pdf_dir, pdf_metadata)
+            for (_, pdf_dir), pdf_metadata in zip(pdf_dirs, metadata[len(run_dirs) :])
+        ]
+
+        pages: list[dict[str, Any]] = []
+        for (run_index, pdf_dir), pdf_metadata in zip(pdf_dirs, pdf_metadata_list):
+            model_slug, run_number, _ = run_dirs[run_index]
+            run_metadata = run_metadata_list[run_index]
+            model_name = str(run_metadata.get("model") or model_slug)
+            mode = run_metadata.get("mode")
+            source_pdf = pdf_metadata.get("source_pdf")
+            pages_by_number = self._pdf_pages_by_number(pdf_metadata)
+
+            with os.scandir(pdf_dir) as page_entries:
+                for page_entry in page_entries:
+                    stem, _, suffix = page_entry.name.rpartition(".")
+                    if suffix != "md" or not stem.isdigit() or not page_entry.is_file():
+                        continue
+                    page_number = int(stem)
+                    pages.append(
+                        {
+                            "index": -1,
+                            "model": model_name,
+                            "model_slug": model_slug,
+                            "mode": mode,
+                            "run_number": run_number,
+                            "pdf_slug": pdf_dir.name,
+                            "page_number": page_number,
+                            "source_pdf": source_pdf,
+                            "markdown_path": page_entry.path,
+                            "bytes": page_entry.stat().st_size,
+                            "output_tokens": self._page_output_tokens(pages_by_number.get(page_number)),
+                            "output_characters": None,
+                        }
                     )
-                    for page_file in page_files:
-                        page_number = int(page_file.stem)
-                        output_tokens = self._output_tokens_from_pdf_metadata(pdf_metadata, page_number)
-                        pages.append(
-                            {
-                                "index": -1,
-                                "model": model_name,
-                                "model_slug": model_slug,
-                                "mode": mode,
-                                "run_number": run_number,
-                                "pdf_slug": pdf_slug,
-                                "page_number": page_number,
-                                "source_pdf": source_pdf,
-                                "markdown_path": str(page_file),
-                                "bytes": page_file.stat().st_size,
-                                "output_tokens": output_tokens,
-                            }
-                        )
 
         pages.sort(
             key=lambda item: (
@@ -1266,17 +1822,17 @@ class JobManager:
 
         page = dict(pages[page_index])
         markdown_path = Path(str(page["markdown_path"]))
-        markdown = markdown_path.read_text(encoding="utf-8")
+        markdown = _read_small(str(markdown_path))
         page["output_characters"] = len(markdown)
         if page.get("output_tokens") is None:
-            pdf_metadata = self._read_json_if_exists(markdown_path.parent / "pdf_metadata.json")
+            pdf_metadata = self.load_pdf_metadata(markdown_path.parent)
             page_number = self._optional_int(page.get("page_number"))
             if page_number is not None:
                 page["output_tokens"] = self._output_tokens_from_pdf_metadata(pdf_metadata, page_number)
         return {"page": page, "markdown": markdown}
 
     def dismiss_job(self, job_id: str) -> tuple[bool, str | None]:
-        with self._state_lock:
+        with self._registry_lock:
             job = self._jobs.get(job_id)
             if not job:
                 return False, "job not found"
@@ -1295,10 +1851,13 @@ class JobManager:
             self._jobs.pop(job_id, None)
             self._cancel_events.pop(job_id, None)
             self._tasks.pop(job_id, None)
+            self._job_metadata_written_at.pop(job_id, None)
+            self._job_metrics.pop(job_id, None)
+            self._job_locks.pop(job_id, None)
             return True, None
 
     def cancel_job(self, job_id: str) -> bool:
-        with self._state_lock:
+        with self._job_lock(job_id):
             cancel_event = self._cancel_events.get(job_id)
             if not cancel_event:
                 return False
@@ -1327,7 +1886,7 @@ class JobManager:
 
     async def shutdown(self) -> None:
         tasks: list[asyncio.Task[None]]
-        with self._state_lock:
+        with self._registry_lock:
             for event in self._cancel_events.values():
                 event.set()
             tasks = [task for task in self._tasks.values() if not task.done()]
@@ -12,6 +12,29 @@ from openai import OpenAI
 from openai import APIConnectionError, APIStatusError, APITimeoutError
 
 
+_DOTENV_PATH = Path(__file__).resolve().parents[2] / ".env"
+# str(path) -> ((st_mtime_ns, st_size), parsed values); re-parsed only when the file changes.
+_DOTENV_CACHE: dict[str, tuple[tuple[int, int], dict[str, str | None]]] = {}
+
+
+def _read_dotenv(path: Path) -> dict[str, str | None]:
+    key = str(path)
+    try:
+        stat = os.stat(key)
+    except OSError:
+        _DOTENV_CACHE.pop(key, None)
+        return dict(dotenv_values(path))
+
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _DOTENV_CACHE.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    values = dict(dotenv_values(path))
+    _DOTENV_CACHE[key] = (signature, values)
+    return values
+
+
 @dataclass
 class EndpointAuth:
     base_url: str
@@ -47,9 +70,8 @@ class OpenAICompatibleOCRClient:
         if env_value:
             return env_value
 
-        env_path = Path(__file__).resolve().parents[2] / ".env"
         try:
-            env_map = dotenv_values(env_path)
+            env_map = _read_dotenv(_DOTENV_PATH)
         except Exception:  # noqa: BLE001
             return None
 
@@ -70,12 +92,21 @@ class OpenAICompatibleOCRClient:
             f"Missing API key. Set inline key or environment variable: {api_key_env or '<unset>'}"
         )
 
+    @staticmethod
+    def _image_media_type(image_bytes: bytes) -> str:
+        if image_bytes.startswith(b"\xff\xd8\xff"):
+            return "image/jpeg"
+        if image_bytes[:4] == b"RIFF" and image_bytes[8:12] == b"WEBP":
+            return "image/webp"
+        return "image/png"
+
     @staticmethod
     def _image_content_block(image_png: bytes) -> dict[str, Any]:
         encoded = base64.b64encode(image_png).decode("utf-8")
+        media_type = OpenAICompatibleOCRClient._image_media_type(image_png)
         return {
             "type": "image_url",
-            "image_url": {"url": f"data:image/png;base64,{encoded}"},
+            "image_url": {"url": f"data:{media_type};base64,{encoded}"},
         }
 
     def ocr_page(
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import html
-import json
+import os
 import random
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -11,10 +14,11 @@ try:
 except ModuleNotFoundError:  # pragma: no cover - exercised when web extra is not installed
     md = None
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import HTMLResponse, Response
+from fastapi.responses import HTMLResponse, JSONResponse, Response
 from pydantic import BaseModel
 
 from tracr.core.config import Settings
+from tracr.core.jsonio import dumps_bytes, loads
 from tracr.core.pdf_tools import render_pdf_page_png
 from tracr.runtime.elo_manager import EloManager
 from tracr.runtime.job_manager import JobManager
@@ -23,6 +27,18 @@ from tracr.web.page_shell import head_html, header_html, init_js, shared_js
 from tracr.web.page_viewer import viewer_js, viewer_section_html
 
 
+METADATA_CACHE_SIZE = 4096
+MARKDOWN_CACHE_SIZE = 1024
+JOB_LISTING_WORKERS = 8
+JOB_LISTING_PARALLEL_THRESHOLD = 4
+
+
+class OrjsonResponse(JSONResponse):
+    # Handlers that return this directly skip response-model validation and jsonable_encoder.
+    def render(self, content: Any) -> bytes:
+        return dumps_bytes(content)
+
+
 class EloVoteRequest(BaseModel):
     choice: str
     pdf_slug: str
@@ -36,18 +52,62 @@ class EloVoteRequest(BaseModel):
 
 
 def build_web_router(*, settings: Settings, manager: JobManager, elo_manager: EloManager) -> APIRouter:
-    router = APIRouter()
+    router = APIRouter(default_response_class=OrjsonResponse)
+    # str(path) -> (st_mtime_ns, st_size, parsed payload); callers treat payloads as read-only.
+    metadata_cache: OrderedDict[str, tuple[int, int, dict[str, Any]]] = OrderedDict()
+    metadata_cache_lock = threading.Lock()
+    # Same scheme for page markdown: viewer and Elo endpoints reread the same pages on every click.
+    markdown_cache: OrderedDict[str, tuple[int, int, str]] = OrderedDict()
+    markdown_cache_lock = threading.Lock()
+    # pdf_dir -> (pdf_metadata payload, {page_number: page}); valid while the metadata cache returns
+    # the same payload object, i.e. until pdf_metadata.json changes on disk.
+    pages_index_cache: OrderedDict[str, tuple[dict[str, Any], dict[int, dict[str, Any]]]] = OrderedDict()
 
     def _read_json_if_exists(path: Path) -> dict[str, Any]:
-        if not path.exists():
+        key = str(path)
+        try:
+            stat = os.stat(key)
+        except OSError:
+            with metadata_cache_lock:
+                metadata_cache.pop(key, None)
             return {}
+
+        with metadata_cache_lock:
+            cached = metadata_cache.get(key)
+            if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                metadata_cache.move_to_end(key)
+                return cached[2]
+
         try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
-            if isinstance(payload, dict):
-                return payload
+            payload = loads(path.read_bytes())
         except Exception:  # noqa: BLE001
             return {}
-        return {}
+        if not isinstance(payload, dict):
+            return {}
+
+        with metadata_cache_lock:
+            metadata_cache[key] = (stat.st_mtime_ns, stat.st_size, payload)
+            metadata_cache.move_to_end(key)
+            while len(metadata_cache) > METADATA_CACHE_SIZE:
+                metadata_cache.popitem(last=False)
+        return payload
+
+    def _read_markdown(path: Path) -> str:
+        key = str(path)
+        stat = os.stat(key)
+        with markdown_cache_lock:
+            cached = markdown_cache.get(key)
+            if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                markdown_cache.move_to_end(key)
+                return cached[2]
+
+        text = path.read_text(encoding="utf-8")
+        with markdown_cache_lock:
+            markdown_cache[key] = (stat.st_mtime_ns, stat.st_size, text)
+            markdown_cache.move_to_end(key)
+            while len(markdown_cache) > MARKDOWN_CACHE_SIZE:
+                markdown_cache.popitem(last=False)
+        return text
 
     def _job_dir(job_id: str) -> Path:
         job_dir = settings.outputs_path / job_id
@@ -114,27 +174,65 @@ def build_web_router(*, settings: Settings, manager: JobManager, elo_manager: El
 
         return None
 
-    def _output_token_usage(pdf_metadata: dict[str, Any], page_number: int) -> int | None:
+    def _pages_by_number(output: dict[str, Any]) -> dict[int, dict[str, Any]]:
+        key = str(output["pdf_dir"])
+        pdf_metadata = output["pdf_metadata"]
+        with metadata_cache_lock:
+            cached = pages_index_cache.get(key)
+            if cached is not None and cached[0] is pdf_metadata:
+                pages_index_cache.move_to_end(key)
+                return cached[1]
+
         pages = pdf_metadata.get("pages")
-        if not isinstance(pages, list):
+        index: dict[int, dict[str, Any]] = {}
+        if isinstance(pages, list):
+            for page in pages:
+                if not isinstance(page, dict):
+                    continue
+                try:
+                    index.setdefault(int(page.get("page_number")), page)
+                except Exception:  # noqa: BLE001
+                    continue
+
+        with metadata_cache_lock:
+            pages_index_cache[key] = (pdf_metadata, index)
+            pages_index_cache.move_to_end(key)
+            while len(pages_index_cache) > METADATA_CACHE_SIZE:
+                pages_index_cache.popitem(last=False)
+        return index
+
+    def _output_token_usage(pages_by_number: dict[int, dict[str, Any]], page_number: int) -> int | None:
+        page = pages_by_number.get(page_number)
+        if page is None:
             return None
-        for page in pages:
-            if not isinstance(page, dict):
-                continue
-            try:
-                entry_page = int(page.get("page_number"))
-            except Exception:  # noqa: BLE001
-                continue
-            if entry_page != page_number:
-                continue
-            token_usage = page.get("token_usage")
-            if not isinstance(token_usage, dict):
-                return None
-            try:
-                return int(token_usage.get("output_tokens"))
-            except Exception:  # noqa: BLE001
-                return None
-        return None
+        token_usage = page.get("token_usage")
+        if not isinstance(token_usage, dict):
+            return None
+        try:
+            return int(token_usage.get("output_tokens"))
+        except Exception:  # noqa: BLE001
+            return None
+
+    def _sorted_subdirs(directory: str | Path) -> list[str]:
+        # DirEntry.is_dir() reuses the readdir d_type, so listing children costs no extra stats.
+        try:
+            with os.scandir(directory) as entries:
+                return sorted(entry.path for entry in entries if entry.is_dir())
+        except OSError:
+            return []
+
+    def _markdown_page_numbers(pdf_dir: str) -> list[int]:
+        page_numbers: list[int] = []
+        try:
+            with os.scandir(pdf_dir) as entries:
+                for entry in entries:
+                    stem, dot, suffix = entry.name.rpartition(".")
+                    if dot and suffix == "md" and stem.isdigit() and entry.is_file():
+                        page_numbers.append(int(stem))
+        except OSError:
+            return []
+        page_numbers.sort()
+        return page_numbers
 
     def _collect_job_outputs(job_id: str) -> dict[str, Any]:
         job_dir = _job_dir(job_id)
@@ -142,38 +240,31 @@ def build_web_router(*, settings: Settings, manager: JobManager, elo_manager: El
         job_title = str(job_metadata.get("title") or job_id)
 
         outputs: list[dict[str, Any]] = []
-        for model_dir in sorted((item for item in job_dir.iterdir() if item.is_dir()), key=lambda item: item.name):
-            model_slug = model_dir.name
-            model_metadata = _read_json_if_exists(model_dir / "model_metadata.json")
+        for model_dir in _sorted_subdirs(job_dir):
+            model_slug = os.path.basename(model_dir)
+            model_metadata = _read_json_if_exists(Path(model_dir, "model_metadata.json"))
             fallback_model_label = str(model_metadata.get("model") or model_slug)
 
-            run_dirs = sorted(
-                (
-                    item
-                    for item in model_dir.iterdir()
-                    if item.is_dir() and manager.layout.parse_run_number(item.name) is not None
-                ),
-                key=lambda item: int(manager.layout.parse_run_number(item.name) or 0),
-            )
+            run_dirs: list[tuple[int, str]] = []
+            for run_dir in _sorted_subdirs(model_dir):
+                run_number = manager.layout.parse_run_number(os.path.basename(run_dir))
+                if run_number is not None:
+                    run_dirs.append((run_number, run_dir))
+            run_dirs.sort(key=lambda item: item[0])
 
-            for run_dir in run_dirs:
-                run_number = int(manager.layout.parse_run_number(run_dir.name) or 0)
-                run_metadata = _read_json_if_exists(run_dir / "run_metadata.json")
+            for run_number, run_dir in run_dirs:
+                run_metadata = _read_json_if_exists(Path(run_dir, "run_metadata.json"))
                 model_label = str(run_metadata.get("model") or fallback_model_label)
 
-                for pdf_dir in sorted((item for item in run_dir.iterdir() if item.is_dir()), key=lambda item: item.name):
-                    pdf_slug = pdf_dir.name
-                    pdf_metadata = _read_json_if_exists(pdf_dir / "pdf_metadata.json")
+                for pdf_dir in _sorted_subdirs(run_dir):
+                    pdf_slug = os.path.basename(pdf_dir)
+                    pdf_metadata = manager.load_pdf_metadata(
+                        Path(pdf_dir), _read_json_if_exists(Path(pdf_dir, "pdf_metadata.json"))
+                    )
                     source_pdf = str(pdf_metadata.get("source_pdf") or "")
                     pdf_label = Path(source_pdf).stem if source_pdf else pdf_slug
 
-                    page_numbers: list[int] = []
-                    for page_file in pdf_dir.glob("*.md"):
-                        if not page_file.is_file() or not page_file.stem.isdigit():
-                            continue
-                        page_numbers.append(int(page_file.stem))
-                    page_numbers.sort()
-
+                    page_numbers = _markdown_page_numbers(pdf_dir)
                     if not page_numbers:
                         continue
 
@@ -190,7 +281,7 @@ def build_web_router(*, settings: Settings, manager: JobManager, elo_manager: El
                             "page_numbers": page_numbers,
                             "page_count": len(page_numbers),
                             "pdf_metadata": pdf_metadata,
-                            "pdf_dir": pdf_dir,
+                            "pdf_dir": Path(pdf_dir),
                         }
                     )
 
@@ -202,44 +293,53 @@ def build_web_router(*, settings: Settings, manager: JobManager, elo_manager: El
         }
 
     def _find_output(job_id: str, output_id: str) -> dict[str, Any]:
-        payload = _collect_job_outputs(job_id)
+        return _match_output(_collect_job_outputs(job_id), output_id)
+
+    def _match_output(payload: dict[str, Any], output_id: str) -> dict[str, Any]:
         for output in payload["outputs"]:
             if output["output_id"] == output_id:
                 return output
         raise HTTPException(status_code=404, detail=f"Output not found for id: {output_id}")
 
-    def _discover_jobs() -> list[dict[str, Any]]:
-        outputs_root = settings.outputs_path
-        jobs: list[dict[str, Any]] = []
+    def _summarize_job(job_dir: Path) -> dict[str, Any] | None:
+        job_id = job_dir.name
+        try:
+            payload = _collect_job_outputs(job_id)
+        except HTTPException:
+            return None
 
-        for job_dir in sorted((item for item in outputs_root.iterdir() if item.is_dir()), key=lambda item: item.name):
-            if job_dir.name == "proxy_logs":
-                continue
-            job_id = job_dir.name
-            try:
-                payload = _collect_job_outputs(job_id)
-            except HTTPException:
-                continue
+        outputs = payload["outputs"]
+        if not outputs:
+            return None
 
-            outputs = payload["outputs"]
-            if not outputs:
-                continue
+        model_slugs = {item["model_slug"] for item in outputs}
+        page_count = sum(int(item["page_count"]) for item in outputs)
+        metadata = _read_json_if_exists(job_dir / "job_metadata.json")
+        return {
+            "job_id": job_id,
+            "title": str(metadata.get("title") or payload["title"] or job_id),
+            "model_count": len(model_slugs),
+            "output_count": len(outputs),
+            "page_count": page_count,
+            "elo_eligible": len(model_slugs) > 1,
+            "created_at": metadata.get("created_at"),
+        }
 
-            model_slugs = {item["model_slug"] for item in outputs}
-            page_count = sum(int(item["page_count"]) for item in outputs)
-            metadata = _read_json_if_exists(job_dir / "job_metadata.json")
-            jobs.append(
-                {
-                    "job_id": job_id,
-                    "title": str(metadata.get("title") or payload["title"] or job_id),
-                    "model_count": len(model_slugs),
-                    "output_count": len(outputs),
-                    "page_count": page_count,
-                    "elo_eligible": len(model_slugs) > 1,
-                    "created_at": metadata.get("created_at"),
-                }
-            )
+    def _discover_jobs() -> list[dict[str, Any]]:
+        job_dirs = [
+            Path(job_dir_path)
+            for job_dir_path in _sorted_subdirs(settings.outputs_path)
+            if os.path.basename(job_dir_path) != "proxy_logs"
+        ]
+
+        # Each job is independent and the scan is dominated by open/read latency, which releases the GIL.
+        if len(job_dirs) < JOB_LISTING_PARALLEL_THRESHOLD:
+            summaries = [_summarize_job(job_dir) for job_dir in job_dirs]
+        else:
+            with ThreadPoolExecutor(max_workers=min(JOB_LISTING_WORKERS, len(job_dirs))) as executor:
+                summaries = list(executor.map(_summarize_job, job_dirs))
 
+        jobs = [summary for summary in summaries if summary is not None]
         jobs.sort(key=lambda item: (str(item.get("created_at") or ""), item["job_id"]), reverse=True)
         return jobs
 
@@ -313,11 +413,11 @@ def build_web_router(*, settings: Settings, manager: JobManager, elo_manager: El
         return Response(content=logo.read_bytes(), media_type="image/png")
 
     @router.get("/api/web/jobs")
-    def web_jobs() -> dict[str, Any]:
-        return {"jobs": _discover_jobs()}
+    def web_jobs() -> OrjsonResponse:
+        return OrjsonResponse({"jobs": _discover_jobs()})
 
     @router.get("/api/web/jobs/{job_id}/outputs")
-    def web_job_outputs(job_id: str) -> dict[str, Any]:
+    def web_job_outputs(job_id: str) -> OrjsonResponse:
         payload = _collect_job_outputs(job_id)
         outputs = [
             {
@@ -333,15 +433,18 @@ def build_web_router(*, settings: Settings, manager: JobManager, elo_manager: El
             }
             for output in payload["outputs"]
         ]
-        return {
-            "job_id": job_id,
-            "title": payload["title"],
-            "outputs": outputs,
-        }
+        return OrjsonResponse(
+            {
+                "job_id": job_id,
+                "title": payload["title"],
+                "outputs": outputs,
+            }
+        )
 
     @router.get("/api/web/jobs/{job_id}/viewer/page")
-    def web_viewer_page(job_id: str, output_id: str, page_number: int | None = None) -> dict[str, Any]:
-        output = _find_output(job_id, output_id)
+    def web_viewer_page(job_id: str, output_id: str, page_number: int | None = None) -> OrjsonResponse:
+        job_outputs = _collect_job_outputs(job_id)
+        output = _match_output(job_outputs, output_id)
         pages = list(output["page_numbers"])
         if not pages:
             raise HTTPException(status_code=404, detail="No pages available for this output")
@@ -351,30 +454,33 @@ def build_web_router(*, settings: Settings, manager: JobManager, elo_manager: El
             raise HTTPException(status_code=404, detail=f"Page {current_page} not available for this output")
 
         markdown_path = Path(output["pdf_dir"]) / f"{current_page}.md"
-        if not markdown_path.exists():
-            raise HTTPException(status_code=404, detail=f"Page markdown missing: {current_page}")
-        markdown_raw = markdown_path.read_text(encoding="utf-8")
+        try:
+            markdown_raw = _read_markdown(markdown_path)
+        except FileNotFoundError:
+            raise HTTPException(status_code=404, detail=f"Page markdown missing: {current_page}") from None
 
-        output_tokens = _output_token_usage(output["pdf_metadata"], current_page)
-        return {
-            "job_id": job_id,
-            "job_title": _collect_job_outputs(job_id)["title"],
-            "output": {
-                "output_id": output["output_id"],
-                "model_label": output["model_label"],
-                "model_slug": output["model_slug"],
-                "run_number": output["run_number"],
-                "pdf_label": output["pdf_label"],
-                "pdf_slug": output["pdf_slug"],
-                "page_numbers": pages,
-                "current_page": current_page,
-            },
-            "markdown_raw": markdown_raw,
-            "markdown_html": _render_markdown(markdown_raw),
-            "output_characters": len(markdown_raw),
-            "output_tokens": output_tokens,
-            "image_url": f"/api/web/jobs/{job_id}/viewer/page-image?output_id={output_id}&page_number={current_page}",
-        }
+        output_tokens = _output_token_usage(_pages_by_number(output), current_page)
+        return OrjsonResponse(
+            {
+                "job_id": job_id,
+                "job_title": job_outputs["title"],
+                "output": {
+                    "output_id": output["output_id"],
+                    "model_label": output["model_label"],
+                    "model_slug": output["model_slug"],
+                    "run_number": output["run_number"],
+                    "pdf_label": output["pdf_label"],
+                    "pdf_slug": output["pdf_slug"],
+                    "page_numbers": pages,
+                    "current_page": current_page,
+                },
+                "markdown_raw": markdown_raw,
+                "markdown_html": _render_markdown(markdown_raw),
+                "output_characters": len(markdown_raw),
+                "output_tokens": output_tokens,
+                "image_url": f"/api/web/jobs/{job_id}/viewer/page-image?output_id={output_id}&page_number={current_page}",
+            }
+        )
 
     @router.get("/api/web/jobs/{job_id}/viewer/page-image")
     def web_viewer_page_image(job_id: str, output_id: str, page_number: int, dpi: int = 180) -> Response:
@@ -409,58 +515,62 @@ def build_web_router(*, settings: Settings, manager: JobManager, elo_manager: El
         }
 
     @router.get("/api/web/elo/jobs/{job_id}/next")
-    def web_elo_next(job_id: str) -> dict[str, Any]:
+    def web_elo_next(job_id: str) -> OrjsonResponse:
         candidates = _elo_pair_candidates(job_id)
         model_labels = candidates["model_labels"]
         grouped = candidates["grouped"]
         ratings = elo_manager.ratings_table(job_id, model_labels=model_labels)
 
         if not grouped:
-            return {
-                "job_id": job_id,
-                "job_title": candidates["title"],
-                "has_pair": False,
-                "message": "No comparable pages found for this job.",
-                "ratings": ratings,
-            }
+            return OrjsonResponse(
+                {
+                    "job_id": job_id,
+                    "job_title": candidates["title"],
+                    "has_pair": False,
+                    "message": "No comparable pages found for this job.",
+                    "ratings": ratings,
+                }
+            )
 
         key = random.choice(list(grouped.keys()))
         entries = list(grouped[key])
         left, right = random.sample(entries, 2)
         page_number = int(key[1])
 
-        left_markdown = (Path(left["pdf_dir"]) / f"{page_number}.md").read_text(encoding="utf-8")
-        right_markdown = (Path(right["pdf_dir"]) / f"{page_number}.md").read_text(encoding="utf-8")
+        left_markdown = _read_markdown(Path(left["pdf_dir"]) / f"{page_number}.md")
+        right_markdown = _read_markdown(Path(right["pdf_dir"]) / f"{page_number}.md")
 
-        return {
-            "job_id": job_id,
-            "job_title": candidates["title"],
-            "has_pair": True,
-            "pair": {
-                "pdf_slug": str(key[0]),
-                "pdf_label": str(left["pdf_label"]),
-                "page_number": page_number,
-                "image_url": (
-                    f"/api/web/jobs/{job_id}/viewer/page-image?"
-                    f"output_id={left['output_id']}&page_number={page_number}"
-                ),
-                "left": {
-                    "model_slug": left["model_slug"],
-                    "model_label": left["model_label"],
-                    "run_number": left["run_number"],
-                    "markdown_raw": left_markdown,
-                    "markdown_html": _render_markdown(left_markdown),
-                },
-                "right": {
-                    "model_slug": right["model_slug"],
-                    "model_label": right["model_label"],
-                    "run_number": right["run_number"],
-                    "markdown_raw": right_markdown,
-                    "markdown_html": _render_markdown(right_markdown),
+        return OrjsonResponse(
+            {
+                "job_id": job_id,
+                "job_title": candidates["title"],
+                "has_pair": True,
+                "pair": {
+                    "pdf_slug": str(key[0]),
+                    "pdf_label": str(left["pdf_label"]),
+                    "page_number": page_number,
+                    "image_url": (
+                        f"/api/web/jobs/{job_id}/viewer/page-image?"
+                        f"output_id={left['output_id']}&page_number={page_number}"
+                    ),
+                    "left": {
+                        "model_slug": left["model_slug"],
+                        "model_label": left["model_label"],
+                        "run_number": left["run_number"],
+                        "markdown_raw": left_markdown,
+                        "markdown_html": _render_markdown(left_markdown),
+                    },
+                    "right": {
+                        "model_slug": right["model_slug"],
+                        "model_label": right["model_label"],
+                        "run_number": right["run_number"],
+                        "markdown_raw": right_markdown,
+                        "markdown_html": _render_markdown(right_markdown),
+                    },
                 },
-            },
-            "ratings": ratings,
-        }
+                "ratings": ratings,
+            }
+        )
 
     @router.get("/api/web/elo/jobs/{job_id}/browse")
     def web_elo_browse(
@@ -471,7 +581,7 @@ def build_web_router(*, settings: Settings, manager: JobManager, elo_manager: El
         right_run_number: int,
         pdf_slug: str | None = None,
         page_number: int | None = None,
-    ) -> dict[str, Any]:
+    ) -> OrjsonResponse:
         candidates = _elo_pair_candidates(job_id)
         model_labels = candidates["model_labels"]
         grouped = candidates["grouped"]
@@ -495,14 +605,16 @@ def build_web_router(*, settings: Settings, manager: JobManager, elo_manager: El
         shared_pages.sort(key=lambda p: (p["pdf_slug"], p["page_number"]))
 
         if not shared_pages:
-            return {
-                "job_id": job_id,
-                "job_title": candidates["title"],
-                "has_pair": False,
-                "message": "No shared pages between these models.",
-                "ratings": ratings,
-                "shared_pages": [],
-            }
+            return OrjsonResponse(
+                {
+                    "job_id": job_id,
+                    "job_title": candidates["title"],
+                    "has_pair": False,
+                    "message": "No shared pages between these models.",
+                    "ratings": ratings,
+                    "shared_pages": [],
+                }
+            )
 
         target_slug = pdf_slug or shared_pages[0]["pdf_slug"]
         target_page = page_number if page_number is not None else shared_pages[0]["page_number"]
@@ -514,39 +626,41 @@ def build_web_router(*, settings: Settings, manager: JobManager, elo_manager: El
             target_key = (target_slug, target_page)
 
         left_out, right_out = page_outputs[target_key]
-        left_md = (Path(left_out["pdf_dir"]) / f"{target_page}.md").read_text(encoding="utf-8")
-        right_md = (Path(right_out["pdf_dir"]) / f"{target_page}.md").read_text(encoding="utf-8")
+        left_md = _read_markdown(Path(left_out["pdf_dir"]) / f"{target_page}.md")
+        right_md = _read_markdown(Path(right_out["pdf_dir"]) / f"{target_page}.md")
 
-        return {
-            "job_id": job_id,
-            "job_title": candidates["title"],
-            "has_pair": True,
-            "pair": {
-                "pdf_slug": target_slug,
-                "pdf_label": str(left_out["pdf_label"]),
-                "page_number": target_page,
-                "image_url": (
-                    f"/api/web/jobs/{job_id}/viewer/page-image?"
-                    f"output_id={left_out['output_id']}&page_number={target_page}"
-                ),
-                "left": {
-                    "model_slug": left_out["model_slug"],
-                    "model_label": left_out["model_label"],
-                    "run_number": left_out["run_number"],
-                    "markdown_raw": left_md,
-                    "markdown_html": _render_markdown(left_md),
-                },
-                "right": {
-                    "model_slug": right_out["model_slug"],
-                    "model_label": right_out["model_label"],
-                    "run_number": right_out["run_number"],
-                    "markdown_raw": right_md,
-                    "markdown_html": _render_markdown(right_md),
+        return OrjsonResponse(
+            {
+                "job_id": job_id,
+                "job_title": candidates["title"],
+                "has_pair": True,
+                "pair": {
+                    "pdf_slug": target_slug,
+                    "pdf_label": str(left_out["pdf_label"]),
+                    "page_number": target_page,
+                    "image_url": (
+                        f"/api/web/jobs/{job_id}/viewer/page-image?"
+                        f"output_id={left_out['output_id']}&page_number={target_page}"
+                    ),
+                    "left": {
+                        "model_slug": left_out["model_slug"],
+                        "model_label": left_out["model_label"],
+                        "run_number": left_out["run_number"],
+                        "markdown_raw": left_md,
+                        "markdown_html": _render_markdown(left_md),
+                    },
+                    "right": {
+                        "model_slug": right_out["model_slug"],
+                        "model_label": right_out["model_label"],
+                        "run_number": right_out["run_number"],
+                        "markdown_raw": right_md,
+                        "markdown_html": _render_markdown(right_md),
+                    },
                 },
-            },
-            "ratings": ratings,
-            "shared_pages": shared_pages,
-        }
+                "ratings": ratings,
+                "shared_pages": shared_pages,
+            }
+        )
 
     @router.post("/api/web/elo/jobs/{job_id}/vote")
     def web_elo_vote(job_id: str, payload: EloVoteRequest) -> dict[str, Any]: